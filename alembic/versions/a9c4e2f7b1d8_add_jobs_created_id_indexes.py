@@ -0,0 +1,38 @@
+"""add jobs created_at id indexes for keyset pagination by campaign and unfiltered
+
+Revision ID: a9c4e2f7b1d8
+Revises: f3b8d2c6a9e1
+Create Date: 2025-06-06 10:12:48.215730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c4e2f7b1d8'
+down_revision: Union[str, None] = 'f3b8d2c6a9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_campaign_created_id',
+        'jobs',
+        ['campaign_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_jobs_created_id',
+        'jobs',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_created_id', table_name='jobs')
+    op.drop_index('ix_jobs_campaign_created_id', table_name='jobs')
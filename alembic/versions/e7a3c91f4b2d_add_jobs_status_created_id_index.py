@@ -0,0 +1,31 @@
+"""add jobs status created_at id index for keyset pagination
+
+Revision ID: e7a3c91f4b2d
+Revises: 02bc375f16d5
+Create Date: 2025-06-03 10:14:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3c91f4b2d'
+down_revision: Union[str, None] = '02bc375f16d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_status_created_id',
+        'jobs',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_status_created_id', table_name='jobs')
@@ -0,0 +1,31 @@
+"""add jobs campaign_id job_type status index for per-campaign job stats
+
+Revision ID: f3b8d2c6a9e1
+Revises: e7a3c91f4b2d
+Create Date: 2025-06-05 09:41:27.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2c6a9e1'
+down_revision: Union[str, None] = 'e7a3c91f4b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_campaign_type_status',
+        'jobs',
+        ['campaign_id', 'job_type', 'status'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_campaign_type_status', table_name='jobs')
@@ -13,7 +13,7 @@ from app.models.user import User
 router = APIRouter()
 
 @router.post("/signup", response_model=SignupResponse, status_code=status.HTTP_201_CREATED)
-async def signup(
+def signup(
     user_data: UserSignupRequest,
     db: Session = Depends(get_db)
 ):
@@ -28,7 +28,7 @@ async def signup(
     return result
 
 @router.post("/login", response_model=LoginResponse)
-async def login(
+def login(
     user_data: UserLoginRequest,
     db: Session = Depends(get_db)
 ):
@@ -1,11 +1,14 @@
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+import asyncio
 import math
 
-from app.core.database import get_db
+from app.core.database import get_db, get_readonly_db
 from app.core.dependencies import get_current_active_user
-from app.models.campaign import Campaign
+from app.core.response_cache import cached_response, CAMPAIGNS_NAMESPACE
+from app.models.campaign_status import CampaignStatus
 from app.models.user import User
 from app.schemas.campaign import (
     CampaignCreate, 
@@ -30,6 +33,14 @@ class CampaignsListResponse(BaseModel):
     status: str
     data: CampaignListData
 
+class CampaignBatchData(BaseModel):
+    campaigns: List[CampaignResponse]
+    not_found: List[str]
+
+class CampaignBatchResponse(BaseModel):
+    status: str
+    data: CampaignBatchData
+
 class CampaignDetailResponse(BaseModel):
     status: str
     data: CampaignResponse
@@ -70,33 +81,33 @@ async def list_campaigns(
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
     organization_id: Optional[str] = Query(None, description="Filter by organization ID"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by campaign status"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_readonly_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """List all campaigns with optional pagination and organization filtering"""
     campaign_service = CampaignService()
+    skip = (page - 1) * per_page
     
-    # Get all campaigns data first
-    campaigns_data = await campaign_service.get_campaigns(db, organization_id=organization_id)
+    # Unknown status values can never match a campaign
+    try:
+        campaign_status = CampaignStatus(status_filter) if status_filter else None
+    except ValueError:
+        return CampaignsListResponse(
+            status="success",
+            data=CampaignListData(campaigns=[], total=0, page=page, per_page=per_page, pages=1)
+        )
     
-    # Convert to response models
-    all_campaigns = []
-    for campaign_dict in campaigns_data:
-        # Get the campaign object to create proper response
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_dict['id']).first()
-        if campaign:
-            campaign_response = CampaignResponse.from_campaign(campaign)
-            # Apply status filter if provided
-            if not status_filter or campaign_response.status == status_filter:
-                all_campaigns.append(campaign_response)
+    # Fetch only the requested page
+    campaigns = await campaign_service.get_campaigns(
+        db, organization_id=organization_id, status_filter=campaign_status, skip=skip, limit=per_page
+    )
+    total_campaigns = await campaign_service.count_campaigns(
+        db, organization_id=organization_id, status_filter=campaign_status
+    )
     
     # Calculate pagination
-    total_campaigns = len(all_campaigns)
     total_pages = math.ceil(total_campaigns / per_page) if total_campaigns > 0 else 1
-    skip = (page - 1) * per_page
-    
-    # Apply pagination
-    paginated_campaigns = all_campaigns[skip:skip + per_page]
+    paginated_campaigns = [CampaignResponse.from_campaign(campaign) for campaign in campaigns]
     
     # Create response data
     data = CampaignListData(
@@ -117,22 +128,40 @@ async def create_campaign(
 ):
     """Create a new campaign"""
     campaign_service = CampaignService()
-    campaign_dict = await campaign_service.create_campaign(campaign_in, db)
+    campaign = await campaign_service.create_campaign(campaign_in, db)
     
-    # Get the campaign object to create proper response
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_dict['id']).first()
-    if not campaign:
+    return CampaignCreateResponse(
+        status="success",
+        data=CampaignResponse.from_campaign(campaign)
+    )
+
+@router.get("/batch", response_model=CampaignBatchResponse)
+async def get_campaigns_batch(
+    ids: List[str] = Query(..., description="Campaign IDs to fetch"),
+    db: Session = Depends(get_readonly_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Get several campaigns by ID in one request"""
+    if len(ids) > 100:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Campaign created but could not be retrieved"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At most 100 campaign IDs can be requested at once"
         )
     
-    return CampaignCreateResponse(
+    campaign_service = CampaignService()
+    campaigns = await campaign_service.get_campaigns_by_ids(ids, db)
+    
+    found_ids = {campaign.id for campaign in campaigns}
+    return CampaignBatchResponse(
         status="success",
-        data=CampaignResponse.from_campaign(campaign)
+        data=CampaignBatchData(
+            campaigns=[CampaignResponse.from_campaign(campaign) for campaign in campaigns],
+            not_found=[campaign_id for campaign_id in ids if campaign_id not in found_ids]
+        )
     )
 
 @router.get("/{campaign_id}", response_model=CampaignDetailResponse)
+@cached_response(CAMPAIGNS_NAMESPACE)
 async def get_campaign(
     campaign_id: str,
     db: Session = Depends(get_db),
@@ -140,15 +169,7 @@ async def get_campaign(
 ):
     """Get a specific campaign by ID"""
     campaign_service = CampaignService()
-    campaign_dict = await campaign_service.get_campaign(campaign_id, db)
-    
-    # Get the campaign object to create proper response
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found"
-        )
+    campaign = await campaign_service.get_campaign(campaign_id, db)
     
     return CampaignDetailResponse(
         status="success",
@@ -164,15 +185,7 @@ async def update_campaign(
 ):
     """Update campaign properties"""
     campaign_service = CampaignService()
-    campaign_dict = await campaign_service.update_campaign(campaign_id, campaign_update, db)
-    
-    # Get the campaign object to create proper response
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found"
-        )
+    campaign = await campaign_service.update_campaign(campaign_id, campaign_update, db)
     
     return CampaignUpdateResponse(
         status="success",
@@ -180,7 +193,7 @@ async def update_campaign(
     )
 
 @router.get("/{campaign_id}/start/validate", response_model=CampaignValidationResponse)
-async def validate_campaign_start(
+def validate_campaign_start(
     campaign_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -189,7 +202,7 @@ async def validate_campaign_start(
     campaign_service = CampaignService()
     
     # Get campaign
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    campaign = campaign_service.find_campaign(campaign_id, db)
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -213,15 +226,7 @@ async def start_campaign(
 ):
     """Start campaign process"""
     campaign_service = CampaignService()
-    campaign_dict = await campaign_service.start_campaign(campaign_id, start_data, db)
-    
-    # Get the campaign object to create proper response
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found"
-        )
+    campaign = await campaign_service.start_campaign(campaign_id, start_data, db)
     
     return CampaignStartResponse(
         status="success",
@@ -312,6 +317,7 @@ async def get_campaign_instantly_analytics(
     )
 
 @router.get("/{campaign_id}/details")
+@cached_response(CAMPAIGNS_NAMESPACE)
 async def get_campaign_details(
     campaign_id: str,
     db: Session = Depends(get_db),
@@ -320,14 +326,16 @@ async def get_campaign_details(
     """Get campaign details including lead stats and Instantly analytics"""
     campaign_service = CampaignService()
     
-    # Get campaign
-    campaign_dict = await campaign_service.get_campaign(campaign_id, db)
-    
-    # Get lead stats
-    lead_stats = await campaign_service.get_campaign_lead_stats(campaign_id, db)
-    
-    # Get Instantly analytics
-    instantly_analytics = await campaign_service.get_campaign_instantly_analytics(campaign_id, db)
+    # Load the campaign once and hand it to both helpers so the whole
+    # payload costs a single database round trip; only the Instantly HTTP
+    # call is awaited in a worker thread.
+    campaign = await campaign_service.get_campaign(campaign_id, db)
+    lead_stats, instantly_analytics = await asyncio.gather(
+        campaign_service.get_campaign_lead_stats(campaign_id, db, campaign=campaign),
+        campaign_service.get_campaign_instantly_analytics(campaign_id, db, campaign=campaign)
+    )
+    campaign_dict = campaign.to_dict()
+    campaign_dict['jobs'] = []
     
     return {
         "status": "success",
@@ -369,7 +377,7 @@ async def cleanup_campaign_jobs(
     }
 
 @router.get("/{campaign_id}/results")
-async def get_campaign_results(
+def get_campaign_results(
     campaign_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
@@ -378,36 +386,30 @@ async def get_campaign_results(
     from app.models.job import Job, JobStatus
     
     # Get campaign
-    campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+    campaign = CampaignService().find_campaign(campaign_id, db)
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Campaign {campaign_id} not found"
         )
     
-    # Get completed jobs
-    completed_jobs = (
-        db.query(Job)
+    # Aggregate {job name: result} for completed jobs in the database;
+    # the aggregate is NULL when there are no matching rows
+    results = (
+        db.query(func.jsonb_object_agg(Job.name, Job.result))
         .filter(
             Job.campaign_id == campaign_id,
             Job.status == JobStatus.COMPLETED
         )
-        .all()
+        .scalar()
     )
     
-    if not completed_jobs:
+    if results is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No completed jobs found for this campaign"
         )
     
-    # Collect results from completed jobs
-    results = {}
-    for job in completed_jobs:
-        # Note: Job result validation would be implemented in the Job model
-        # For now, we'll include the results as-is
-        results[job.name] = getattr(job, 'result', None)
-    
     return {
         "status": "success",
         "data": {
@@ -1,4 +1,9 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.dependencies import get_current_active_user
+from app.models.user import User
 
 router = APIRouter()
 
@@ -13,4 +18,19 @@ async def readiness_check():
 
 @router.get("/live", status_code=status.HTTP_200_OK)
 async def liveness_check():
-    return {"status": "alive"} 
\ No newline at end of file
+    return {"status": "alive"}
+
+@router.get("/db-pool", status_code=status.HTTP_200_OK)
+async def db_pool_status(current_user: User = Depends(get_current_active_user)):
+    pool = engine.pool
+    return {
+        "status": "ok",
+        "pool": {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "status": pool.status()
+        }
+    } 
\ No newline at end of file
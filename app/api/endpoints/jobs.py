@@ -1,26 +1,47 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, func, lambda_stmt, select, tuple_
 from sqlalchemy.orm import Session
+import asyncio
+import base64
 import math
+import time
 
-from app.core.database import get_db
-from app.models.job import Job, JobStatus
+from app.core.database import get_db, get_readonly_db
+from app.core.logger import get_logger
+from app.models.job import Job, JobStatus, JobType
 from app.schemas.job import JobCreate, JobResponse, JobUpdate
+from app.workers.celery_app import celery_app
 from app.workers.tasks import process_job
 from pydantic import BaseModel
 
+logger = get_logger(__name__)
+
 # Response models for consistent API structure
 class JobListData(BaseModel):
     jobs: List[JobResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class JobsListResponse(BaseModel):
     status: str
     data: JobListData
 
+class JobsByCampaignResponse(BaseModel):
+    status: str
+    data: Dict[str, List[JobResponse]]
+
+class JobStatsByCampaignResponse(BaseModel):
+    status: str
+    data: Dict[str, Dict[str, int]]
+
 class JobDetailResponse(BaseModel):
     status: str
     data: JobResponse
@@ -43,46 +64,74 @@ class JobCancelResponse(BaseModel):
 
 router = APIRouter()
 
+# How often the job stream re-reads a campaign's jobs, and how long it may stay
+# silent before sending a keep-alive comment
+JOB_STREAM_POLL_SECONDS = 1.0
+JOB_STREAM_HEARTBEAT_SECONDS = 15.0
+# Longest a single stream may stay open; clients reconnect or poll beyond this
+JOB_STREAM_MAX_SECONDS = 600
+
+# Primary-key lookup built once so SQLAlchemy reuses the compiled statement
+_job_by_id_stmt = lambda_stmt(
+    lambda: select(Job).where(Job.id == bindparam("job_id"))
+)
+
 @router.post("/", response_model=JobCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_job(
+def create_job(
     job_in: JobCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new job and queue it for processing"""
+    # Pre-generate the Celery task ID so the job is persisted in a single commit
+    task_id = str(uuid4())
+    
     # Create job in database
     job = Job(
         name=job_in.name,
         description=job_in.description,
         job_type=job_in.job_type,
         campaign_id=job_in.campaign_id,
-        status=JobStatus.PENDING
+        status=JobStatus.PENDING,
+        task_id=task_id
     )
     db.add(job)
     db.commit()
     db.refresh(job)
     
-    # Queue job for processing
-    task = process_job.delay(job.id)
-    
-    # Update job with task ID
-    job.task_id = task.id
-    db.commit()
-    db.refresh(job)
+    # Queue job for processing once the row is visible to workers
+    process_job.apply_async(args=[job.id], task_id=task_id)
     
     return JobCreateResponse(
         status="success",
         data=job
     )
 
+def _encode_cursor(job: Job) -> str:
+    """Encode the (created_at, id) position of a job as an opaque cursor."""
+    raw = f"{job.created_at.isoformat()}|{job.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        created_at, job_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(job_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
 @router.get("/", response_model=JobsListResponse)
-async def list_jobs(
+def list_jobs(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     status_filter: Optional[JobStatus] = Query(None, alias="status", description="Filter by job status"),
     campaign_id: Optional[str] = Query(None, description="Filter by campaign ID"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_readonly_db)
 ):
-    """List all jobs with optional status filter, campaign filter, and pagination"""
+    """List all jobs, newest first, with optional status filter, campaign filter, and pagination"""
     # Build query
     query = db.query(Job)
     if status_filter:
@@ -90,15 +139,23 @@ async def list_jobs(
     if campaign_id:
         query = query.filter(Job.campaign_id == campaign_id)
     
-    # Get total count
-    total_jobs = query.count()
-    
-    # Calculate pagination
-    total_pages = math.ceil(total_jobs / per_page) if total_jobs > 0 else 1
-    skip = (page - 1) * per_page
+    # A cursor seeks straight to its position via ix_jobs_status_created_id,
+    # ix_jobs_campaign_created_id or ix_jobs_created_id instead of scanning
+    # past skipped rows, and skips the total count that page numbers need
+    total_jobs = None
+    total_pages = None
+    if cursor:
+        query = query.filter(tuple_(Job.created_at, Job.id) < _decode_cursor(cursor))
+        query = query.order_by(Job.created_at.desc(), Job.id.desc())
+    else:
+        total_jobs = query.count()
+        total_pages = math.ceil(total_jobs / per_page) if total_jobs > 0 else 1
+        query = query.order_by(Job.created_at.desc(), Job.id.desc()).offset((page - 1) * per_page)
     
-    # Get paginated jobs
-    jobs = query.offset(skip).limit(per_page).all()
+    # One extra row tells whether another page follows
+    jobs = query.limit(per_page + 1).all()
+    next_cursor = _encode_cursor(jobs[per_page - 1]) if len(jobs) > per_page else None
+    jobs = jobs[:per_page]
     
     # Create response data
     data = JobListData(
@@ -106,18 +163,198 @@ async def list_jobs(
         total=total_jobs,
         page=page,
         per_page=per_page,
-        pages=total_pages
+        pages=total_pages,
+        next_cursor=next_cursor
     )
     
     return JobsListResponse(status="success", data=data)
 
+@router.get("/bulk", response_model=JobsByCampaignResponse)
+def list_jobs_by_campaign(
+    request: Request,
+    response: Response,
+    campaign_ids: List[str] = Query(..., description="Campaign IDs to list jobs for"),
+    job_type: Optional[JobType] = Query(None, description="Filter by job type"),
+    db: Session = Depends(get_readonly_db)
+):
+    """
+    List the jobs of several campaigns in one query, grouped by campaign, newest first.
+    
+    Responses carry a weak ETag; a request whose If-None-Match still matches
+    gets an empty 304 without the jobs being loaded.
+    """
+    if len(campaign_ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At most 100 campaign IDs can be requested at once"
+        )
+    
+    query = db.query(Job).filter(Job.campaign_id.in_(campaign_ids))
+    if job_type:
+        query = query.filter(Job.job_type == job_type)
+    
+    # Inserts and deletes change the count or highest id, and every update bumps
+    # updated_at. Summing update times rather than taking the latest one still
+    # catches an update whose transaction started earlier but committed later.
+    job_count, max_id, updated_sum = query.with_entities(
+        func.count(Job.id), func.max(Job.id), func.sum(func.extract("epoch", Job.updated_at))
+    ).one()
+    etag = f'W/"{job_count}-{max_id}-{updated_sum}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    jobs = query.order_by(Job.created_at.desc(), Job.id.desc()).all()
+    
+    # Every requested campaign gets an entry, even if it has no jobs yet
+    jobs_by_campaign = {campaign_id: [] for campaign_id in campaign_ids}
+    for job in jobs:
+        jobs_by_campaign[job.campaign_id].append(job)
+    
+    return JobsByCampaignResponse(status="success", data=jobs_by_campaign)
+
+@router.get("/stats", response_model=JobStatsByCampaignResponse)
+def get_job_stats_by_campaign(
+    campaign_ids: List[str] = Query(..., description="Campaign IDs to count jobs for"),
+    job_type: Optional[JobType] = Query(None, description="Filter by job type"),
+    db: Session = Depends(get_readonly_db)
+):
+    """Count several campaigns' jobs per status with one GROUP BY, without loading the jobs"""
+    if len(campaign_ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At most 100 campaign IDs can be requested at once"
+        )
+    
+    query = (
+        db.query(Job.campaign_id, Job.status, func.count(Job.id))
+        .filter(Job.campaign_id.in_(campaign_ids))
+    )
+    if job_type:
+        query = query.filter(Job.job_type == job_type)
+    
+    # Every requested campaign reports every status, zero when it has no such jobs
+    stats = {
+        campaign_id: {job_status.value.lower(): 0 for job_status in JobStatus} | {"total": 0}
+        for campaign_id in campaign_ids
+    }
+    for campaign_id, job_status, count in query.group_by(Job.campaign_id, Job.status).all():
+        stats[campaign_id][job_status.value.lower()] = count
+        stats[campaign_id]["total"] += count
+    
+    return JobStatsByCampaignResponse(status="success", data=stats)
+
+@router.get("/status", response_model=JobStatusResponse)
+def get_jobs_status(
+    ids: List[int] = Query(..., description="Job IDs to report on"),
+    db: Session = Depends(get_db)
+):
+    """Get status for several jobs, fetching Celery task progress in one Redis round trip"""
+    if len(ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At most 100 job IDs can be requested at once"
+        )
+    
+    jobs = db.query(Job).filter(Job.id.in_(ids)).all()
+    
+    # Read task metadata for processing jobs straight from the result backend
+    processing = [job for job in jobs if job.task_id and job.status == JobStatus.PROCESSING]
+    task_meta = {}
+    if processing:
+        backend = celery_app.backend
+        with backend.client.pipeline() as pipe:
+            for job in processing:
+                pipe.get(backend.get_key_for_task(job.task_id))
+            raw_results = pipe.execute()
+        for job, raw in zip(processing, raw_results):
+            task_meta[job.id] = backend.decode_result(raw) if raw else {"status": "PENDING", "result": None}
+    
+    jobs_data = []
+    for job in jobs:
+        job_data = {
+            "id": job.id,
+            "status": job.status,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+            "completed_at": job.completed_at
+        }
+        meta = task_meta.get(job.id)
+        if meta:
+            if meta["status"] == "PROGRESS":
+                job_data["progress"] = meta["result"]
+            else:
+                job_data["task_state"] = meta["status"]
+        jobs_data.append(job_data)
+    
+    found_ids = {job.id for job in jobs}
+    return JobStatusResponse(
+        status="success",
+        data={
+            "jobs": jobs_data,
+            "not_found": [job_id for job_id in ids if job_id not in found_ids]
+        }
+    )
+
+@router.get("/stream")
+def stream_jobs(
+    campaign_id: str = Query(..., description="Campaign whose jobs to stream"),
+    timeout: int = Query(300, ge=1, le=JOB_STREAM_MAX_SECONDS, description="Seconds before the stream closes"),
+    db: Session = Depends(get_readonly_db)
+):
+    """Stream a campaign's jobs as server-sent events, one event each time any job changes"""
+    # populate_existing refreshes jobs already in the session, so every tick
+    # sees updates committed by the workers since the previous one
+    query = (
+        db.query(Job)
+        .filter(Job.campaign_id == campaign_id)
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .populate_existing()
+    )
+    
+    def read_snapshot():
+        try:
+            return [JobResponse.model_validate(job).model_dump_json() for job in query.all()]
+        finally:
+            # End the read transaction so the connection goes back to the pool
+            # between ticks. Nothing is pending, so committing is equivalent to a
+            # rollback here, but unlike one it can't undo an enclosing transaction
+            # the session was joined to (as the test suite does)
+            db.commit()
+    
+    async def events():
+        # Only the query runs on the threadpool; waiting between ticks holds neither a thread nor a connection
+        deadline = time.monotonic() + timeout
+        last_snapshot = None
+        last_sent = time.monotonic()
+        while True:
+            snapshot = await run_in_threadpool(read_snapshot)
+            now = time.monotonic()
+            if snapshot != last_snapshot:
+                yield f'data: {{"jobs": [{",".join(snapshot)}]}}\n\n'
+                last_snapshot = snapshot
+                last_sent = now
+            elif now - last_sent >= JOB_STREAM_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = now
+            
+            if now >= deadline:
+                return
+            await asyncio.sleep(JOB_STREAM_POLL_SECONDS)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @router.get("/{job_id}", response_model=JobDetailResponse)
-async def get_job(
+def get_job(
     job_id: int,
     db: Session = Depends(get_db)
 ):
     """Get a specific job by ID"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.execute(_job_by_id_stmt, {"job_id": job_id}).scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -130,12 +367,12 @@ async def get_job(
     )
 
 @router.get("/{job_id}/status", response_model=JobStatusResponse)
-async def get_job_status(
+def get_job_status(
     job_id: int,
     db: Session = Depends(get_db)
 ):
     """Get job status including Celery task progress"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.execute(_job_by_id_stmt, {"job_id": job_id}).scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -152,7 +389,6 @@ async def get_job_status(
     
     # Get Celery task status if available
     if job.task_id and job.status == JobStatus.PROCESSING:
-        from app.workers.celery_app import celery_app
         task_result = celery_app.AsyncResult(job.task_id)
         
         if task_result.state == "PROGRESS":
@@ -165,13 +401,21 @@ async def get_job_status(
         data=response_data
     )
 
+def _revoke_task(task_id: str) -> None:
+    """Revoke a Celery task; failures are logged, the job is already cancelled."""
+    try:
+        celery_app.control.revoke(task_id, terminate=True)
+    except Exception as e:
+        logger.error(f"Failed to revoke Celery task {task_id}: {str(e)}", exc_info=True)
+
 @router.post("/{job_id}/cancel", response_model=JobCancelResponse)
-async def cancel_job_post(
+def cancel_job_post(
     job_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Cancel a pending or processing job (POST endpoint)"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.execute(_job_by_id_stmt, {"job_id": job_id}).scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -184,27 +428,30 @@ async def cancel_job_post(
             detail=f"Cannot cancel job in {job.status} status"
         )
     
-    # Revoke Celery task if it exists
-    if job.task_id:
-        from app.workers.celery_app import celery_app
-        celery_app.control.revoke(job.task_id, terminate=True)
+    # Read task_id before the commit expires the job, which would cost a refresh SELECT
+    task_id = job.task_id
     
     # Update job status
     job.status = JobStatus.CANCELLED
     db.commit()
     
+    # Revoke Celery task if it exists, after the response has been sent
+    if task_id:
+        background_tasks.add_task(_revoke_task, task_id)
+    
     return JobCancelResponse(
         status="success",
         message=f"Job {job_id} cancelled"
     )
 
 @router.delete("/{job_id}", response_model=JobCancelResponse)
-async def cancel_job(
+def cancel_job(
     job_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Cancel a pending or processing job"""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = db.execute(_job_by_id_stmt, {"job_id": job_id}).scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -217,15 +464,17 @@ async def cancel_job(
             detail=f"Cannot cancel job in {job.status} status"
         )
     
-    # Revoke Celery task if it exists
-    if job.task_id:
-        from app.workers.celery_app import celery_app
-        celery_app.control.revoke(job.task_id, terminate=True)
+    # Read task_id before the commit expires the job, which would cost a refresh SELECT
+    task_id = job.task_id
     
     # Update job status
     job.status = JobStatus.CANCELLED
     db.commit()
     
+    # Revoke Celery task if it exists, after the response has been sent
+    if task_id:
+        background_tasks.add_task(_revoke_task, task_id)
+    
     return JobCancelResponse(
         status="success",
         message=f"Job {job_id} cancelled"
@@ -3,8 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 import math
 
-from app.core.database import get_db
-from app.models.lead import Lead
+from app.core.database import get_db, get_readonly_db
 from app.schemas.lead import LeadCreate, LeadUpdate, LeadResponse
 from app.services.lead import LeadService
 from pydantic import BaseModel
@@ -21,6 +20,14 @@ class LeadsListResponse(BaseModel):
     status: str
     data: LeadListData
 
+class LeadBatchData(BaseModel):
+    leads: List[LeadResponse]
+    not_found: List[str]
+
+class LeadBatchResponse(BaseModel):
+    status: str
+    data: LeadBatchData
+
 class LeadDetailResponse(BaseModel):
     status: str
     data: LeadResponse
@@ -40,28 +47,19 @@ async def list_leads(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
     campaign_id: Optional[str] = Query(None, description="Filter by campaign ID"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_readonly_db)
 ):
     """List all leads with optional pagination and campaign filtering"""
     lead_service = LeadService()
+    skip = (page - 1) * per_page
     
-    # Get all leads data first
-    leads_data = await lead_service.get_leads(db, campaign_id=campaign_id)
-    
-    # Convert to response models
-    all_leads = []
-    for lead_dict in leads_data:
-        lead = db.query(Lead).filter(Lead.id == lead_dict['id']).first()
-        if lead:
-            all_leads.append(LeadResponse(**lead.to_dict()))
+    # Fetch only the requested page
+    leads = await lead_service.get_leads(db, campaign_id=campaign_id, skip=skip, limit=per_page)
+    total_leads = await lead_service.count_leads(db, campaign_id=campaign_id)
     
     # Calculate pagination
-    total_leads = len(all_leads)
     total_pages = math.ceil(total_leads / per_page) if total_leads > 0 else 1
-    skip = (page - 1) * per_page
-    
-    # Apply pagination
-    paginated_leads = all_leads[skip:skip + per_page]
+    paginated_leads = [LeadResponse(**lead.to_dict()) for lead in leads]
     
     # Create response data
     data = LeadListData(
@@ -81,19 +79,37 @@ async def create_lead(
 ):
     """Create a new lead"""
     lead_service = LeadService()
-    lead_dict = await lead_service.create_lead(lead_in, db)
-    lead = db.query(Lead).filter(Lead.id == lead_dict['id']).first()
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Lead created but could not be retrieved"
-        )
+    lead = await lead_service.create_lead(lead_in, db)
     
     return LeadCreateResponse(
         status="success",
         data=LeadResponse(**lead.to_dict())
     )
 
+@router.get("/batch", response_model=LeadBatchResponse)
+async def get_leads_batch(
+    ids: List[str] = Query(..., description="Lead IDs to fetch"),
+    db: Session = Depends(get_readonly_db)
+):
+    """Get several leads by ID in one request"""
+    if len(ids) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At most 100 lead IDs can be requested at once"
+        )
+    
+    lead_service = LeadService()
+    leads = await lead_service.get_leads_by_ids(ids, db)
+    
+    found_ids = {lead.id for lead in leads}
+    return LeadBatchResponse(
+        status="success",
+        data=LeadBatchData(
+            leads=[LeadResponse(**lead.to_dict()) for lead in leads],
+            not_found=[lead_id for lead_id in ids if lead_id not in found_ids]
+        )
+    )
+
 @router.get("/{lead_id}", response_model=LeadDetailResponse)
 async def get_lead(
     lead_id: str,
@@ -101,13 +117,7 @@ async def get_lead(
 ):
     """Get a specific lead by ID"""
     lead_service = LeadService()
-    lead_dict = await lead_service.get_lead(lead_id, db)
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Lead {lead_id} not found"
-        )
+    lead = await lead_service.get_lead(lead_id, db)
     
     return LeadDetailResponse(
         status="success",
@@ -122,13 +132,7 @@ async def update_lead(
 ):
     """Update a specific lead by ID"""
     lead_service = LeadService()
-    lead_dict = await lead_service.update_lead(lead_id, lead_update, db)
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Lead {lead_id} not found"
-        )
+    lead = await lead_service.update_lead(lead_id, lead_update, db)
     
     return LeadUpdateResponse(
         status="success",
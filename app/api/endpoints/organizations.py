@@ -1,11 +1,11 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 import math
 
-from app.core.database import get_db
-from app.models.organization import Organization
-from app.models.campaign import Campaign
+from app.core.database import get_db, get_readonly_db
+from app.core.response_cache import cached_response, ORGANIZATIONS_NAMESPACE
 from app.schemas.organization import (
     OrganizationCreate,
     OrganizationResponse,
@@ -19,11 +19,12 @@ from app.services.campaign import CampaignService
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[OrganizationResponse])
+@cached_response(ORGANIZATIONS_NAMESPACE)
 async def list_organizations(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
     search: str = Query(None, description="Search term"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_readonly_db)
 ):
     """Get all organizations with pagination"""
     organization_service = OrganizationService()
@@ -36,17 +37,16 @@ async def list_organizations(
     skip = (page - 1) * limit
     
     # Get organizations data with pagination
-    organizations_data = await organization_service.get_organizations(
+    orgs = await organization_service.get_organizations(
         db, skip=skip, limit=limit, search=search
     )
     
     # Convert to response models with campaign counts
-    organizations = []
-    for org_dict in organizations_data:
-        org = db.query(Organization).filter(Organization.id == org_dict['id']).first()
-        if org:
-            campaign_count = organization_service.get_campaign_count(org.id, db)
-            organizations.append(OrganizationResponse.from_organization(org, campaign_count))
+    campaign_counts = organization_service.get_campaign_counts([org.id for org in orgs], db)
+    organizations = [
+        OrganizationResponse.from_organization(org, campaign_counts.get(org.id, 0))
+        for org in orgs
+    ]
     
     # Create pagination metadata
     meta = PaginationMeta(
@@ -65,42 +65,33 @@ async def create_organization(
 ):
     """Create a new organization"""
     organization_service = OrganizationService()
-    org_dict = await organization_service.create_organization(organization_in, db)
-    
-    # Get the organization object to create proper response
-    organization = db.query(Organization).filter(Organization.id == org_dict['id']).first()
-    if not organization:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Organization created but could not be retrieved"
-        )
+    organization = await organization_service.create_organization(organization_in, db)
     
     # Get campaign count for the new organization (should be 0)
     campaign_count = organization_service.get_campaign_count(organization.id, db)
     return OrganizationResponse.from_organization(organization, campaign_count)
 
 @router.get("/{org_id}", response_model=OrganizationResponse)
+@cached_response(ORGANIZATIONS_NAMESPACE)
 async def get_organization(
     org_id: str,
     db: Session = Depends(get_db)
 ):
     """Get a specific organization by ID"""
     organization_service = OrganizationService()
-    org_dict = await organization_service.get_organization(org_id, db)
+    organization = await organization_service.get_organization(org_id, db)
     
-    if not org_dict:
+    if not organization:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Organization {org_id} not found"
         )
     
-    # Get the organization object to create proper response
-    organization = db.query(Organization).filter(Organization.id == org_id).first()
     campaign_count = organization_service.get_campaign_count(org_id, db)
     return OrganizationResponse.from_organization(organization, campaign_count)
 
 @router.get("/{org_id}/campaigns", response_model=List[CampaignResponse])
-async def list_organization_campaigns(
+def list_organization_campaigns(
     org_id: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -108,26 +99,24 @@ async def list_organization_campaigns(
 ):
     """Get all campaigns for a specific organization"""
     # Verify organization exists
-    organization = db.query(Organization).filter(Organization.id == org_id).first()
-    if not organization:
+    if not OrganizationService().organization_exists(org_id, db):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Organization {org_id} not found"
         )
     
-    # Get campaigns for this organization using the campaign service
-    campaign_service = CampaignService()
-    campaigns_data = await campaign_service.get_campaigns(db, organization_id=org_id)
+    # Stream the JSON array so memory stays flat for large pages
+    campaigns = CampaignService().iter_campaigns(db, organization_id=org_id, skip=skip, limit=limit)
     
-    # Convert to response models and apply pagination
-    campaigns = []
-    for campaign_dict in campaigns_data:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_dict['id']).first()
-        if campaign:
-            campaigns.append(CampaignResponse.from_campaign(campaign))
+    def stream_campaigns():
+        yield "["
+        for index, campaign in enumerate(campaigns):
+            if index:
+                yield ","
+            yield CampaignResponse.from_campaign(campaign).model_dump_json()
+        yield "]"
     
-    # Apply pagination
-    return campaigns[skip:skip + limit]
+    return StreamingResponse(stream_campaigns(), media_type="application/json")
 
 @router.put("/{org_id}", response_model=OrganizationResponse)
 async def update_organization(
@@ -137,15 +126,13 @@ async def update_organization(
 ):
     """Update organization properties"""
     organization_service = OrganizationService()
-    org_dict = await organization_service.update_organization(org_id, organization_update, db)
+    organization = await organization_service.update_organization(org_id, organization_update, db)
     
-    if not org_dict:
+    if not organization:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Organization {org_id} not found"
         )
     
-    # Get the organization object to create proper response
-    organization = db.query(Organization).filter(Organization.id == org_id).first()
     campaign_count = organization_service.get_campaign_count(org_id, db)
     return OrganizationResponse.from_organization(organization, campaign_count) 
\ No newline at end of file
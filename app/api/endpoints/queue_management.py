@@ -1,12 +1,14 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
+from cachetools import TTLCache
 
 from app.core.database import get_db
 from app.core.queue_manager import get_queue_manager, QueueManager
 from app.core.circuit_breaker import ThirdPartyService, CircuitBreakerService
-from app.core.config import get_redis_connection
+from app.core.config import settings, get_redis_connection
 from app.core.logger import get_logger
 from app.models.campaign_status import CampaignStatus
 
@@ -14,6 +16,33 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Service name lookup built once at import instead of per request
+_SERVICE_BY_NAME = {s.value: s for s in ThirdPartyService}
+_VALID_SERVICES = list(_SERVICE_BY_NAME)
+
+def _parse_service(name: str) -> ThirdPartyService:
+    """Resolve a service name (case-insensitive) or raise a 400."""
+    service = _SERVICE_BY_NAME.get(name.lower())
+    if service is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid service name: {name}. Valid services: {_VALID_SERVICES}"
+        )
+    return service
+
+# Per-process status snapshots so polling dashboards hit Redis at most once per TTL
+_status_cache = TTLCache(maxsize=2, ttl=max(settings.QUEUE_STATUS_CACHE_TTL_SECONDS, 0))
+_status_cache_lock = asyncio.Lock()
+
+async def _cached_status(key: str, load) -> Dict[str, Any]:
+    """Return the cached status snapshot for key, loading it off the event loop on a miss."""
+    if settings.QUEUE_STATUS_CACHE_TTL_SECONDS <= 0:
+        return await asyncio.to_thread(load)
+    async with _status_cache_lock:
+        if key not in _status_cache:
+            _status_cache[key] = await asyncio.to_thread(load)
+        return _status_cache[key]
+
 class ServicePauseRequest(BaseModel):
     service: str
     reason: str = "manual_pause"
@@ -85,11 +114,14 @@ class PausedCampaignsResponse(BaseModel):
 
 @router.get("/status", response_model=QueueStatusResponse)
 async def get_queue_status(
-    queue_manager: QueueManager = Depends(get_queue_manager)
+    db: Session = Depends(get_db)
 ):
     """Get comprehensive queue and circuit breaker status."""
     try:
-        status_data = queue_manager.get_queue_status()
+        # The queue manager (and its Redis connection) is only built on a cache miss
+        status_data = await _cached_status(
+            "queue_status", lambda: get_queue_manager(db).get_queue_status()
+        )
         
         return QueueStatusResponse(
             status="success",
@@ -112,19 +144,14 @@ async def pause_service(
     """Manually pause a service and its related queues and campaigns."""
     try:
         # Validate service name
-        try:
-            service = ThirdPartyService(request.service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {request.service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service = _parse_service(request.service)
         
         # Pause the service
         queue_manager.circuit_breaker.manually_pause_service(service, request.reason)
         
         # Pause related jobs
         paused_jobs = queue_manager.pause_jobs_for_service(service, request.reason)
+        _status_cache.clear()
         
         # Pause related campaigns
         from app.services.campaign import CampaignService
@@ -161,19 +188,14 @@ async def resume_service(
     """Manually resume a service and its related queues and campaigns."""
     try:
         # Validate service name
-        try:
-            service = ThirdPartyService(request.service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {request.service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service = _parse_service(request.service)
         
         # Resume the service
         queue_manager.circuit_breaker.manually_resume_service(service)
         
         # Resume related jobs
         resumed_jobs = queue_manager.resume_jobs_for_service(service)
+        _status_cache.clear()
         
         # Resume related campaigns
         from app.services.campaign import CampaignService
@@ -256,35 +278,16 @@ async def resume_service(
         )
 
 @router.get("/paused-jobs/{service}", response_model=QueueStatusResponse)
-async def get_paused_jobs_for_service(
+def get_paused_jobs_for_service(
     service: str,
     queue_manager: QueueManager = Depends(get_queue_manager)
 ):
     """Get paused jobs for a specific service."""
     try:
         # Validate service name
-        try:
-            service_enum = ThirdPartyService(service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service_enum = _parse_service(service)
         
-        paused_jobs = queue_manager.get_paused_jobs_by_service(service_enum)
-        
-        # Convert jobs to dict format
-        jobs_data = []
-        for job in paused_jobs:
-            jobs_data.append({
-                "id": job.id,
-                "name": job.name,
-                "job_type": job.job_type.value,
-                "campaign_id": job.campaign_id,
-                "error": job.error,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-                "updated_at": job.updated_at.isoformat() if job.updated_at else None
-            })
+        jobs_data = queue_manager.get_paused_job_summaries(service_enum)
         
         return QueueStatusResponse(
             status="success",
@@ -305,20 +308,14 @@ async def get_paused_jobs_for_service(
         )
 
 @router.get("/paused-leads/{service}", response_model=QueueStatusResponse)
-async def get_paused_leads_for_service(
+def get_paused_leads_for_service(
     service: str,
     queue_manager: QueueManager = Depends(get_queue_manager)
 ):
     """Get lead recovery information for paused enrichment jobs."""
     try:
         # Validate service name
-        try:
-            service_enum = ThirdPartyService(service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service_enum = _parse_service(service)
         
         recovery_info = queue_manager.get_paused_leads_for_recovery(service_enum)
         
@@ -345,10 +342,10 @@ async def get_paused_leads_for_service(
 async def get_circuit_breaker_status():
     """Get status of all circuit breakers."""
     try:
-        redis_client = get_redis_connection()
-        circuit_breaker = CircuitBreakerService(redis_client)
-        
-        status_data = circuit_breaker.get_circuit_status()
+        status_data = await _cached_status(
+            "circuit_breakers",
+            lambda: CircuitBreakerService(get_redis_connection()).get_circuit_status()
+        )
         
         return QueueStatusResponse(
             status="success",
@@ -373,13 +370,7 @@ async def pause_campaigns_for_service(
     """Pause all running campaigns that depend on a specific service."""
     try:
         # Validate service name
-        try:
-            service = ThirdPartyService(request.service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {request.service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service = _parse_service(request.service)
         
         # Import campaign service
         from app.services.campaign import CampaignService
@@ -415,13 +406,7 @@ async def resume_campaigns_for_service(
     """Resume paused campaigns that were paused due to a specific service."""
     try:
         # Validate service name
-        try:
-            service = ThirdPartyService(request.service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {request.service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service = _parse_service(request.service)
         
         # Import campaign service and models
         from app.services.campaign import CampaignService
@@ -487,7 +472,7 @@ async def resume_campaigns_for_service(
         )
 
 @router.get("/campaign-status", response_model=CampaignStatusResponse)
-async def get_campaign_pause_status(db: Session = Depends(get_db)):
+def get_campaign_pause_status(db: Session = Depends(get_db)):
     """Get pause status for all campaigns organized by status and service dependency."""
     try:
         from app.models.campaign import Campaign, CampaignStatus
@@ -560,20 +545,14 @@ async def get_campaign_pause_status(db: Session = Depends(get_db)):
         )
 
 @router.get("/paused-campaigns/{service}", response_model=PausedCampaignsResponse)
-async def get_paused_campaigns_for_service(
+def get_paused_campaigns_for_service(
     service: str,
     db: Session = Depends(get_db)
 ):
     """Get campaigns that are paused due to a specific service failure."""
     try:
         # Validate service name
-        try:
-            service_enum = ThirdPartyService(service.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid service name: {service}. Valid services: {[s.value for s in ThirdPartyService]}"
-            )
+        service_enum = _parse_service(service)
         
         from app.models.campaign import Campaign, CampaignStatus
         
@@ -1,26 +1,161 @@
-import os
+import csv
+import io
+import itertools
+import logging
+import operator
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import orjson
 from apify_client import ApifyClient
-from typing import Dict, Any, List, Optional
-from dotenv import load_dotenv
-import random
-import time
-from datetime import datetime
-import json
-import traceback
-import apify_client
-from sqlalchemy.orm import Session
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import insert
 from app.models.lead import Lead
-from app.models.campaign import Campaign
-from app.models.job import Job, JobStatus
-from app.schemas.lead import LeadCreate
-from app.core.database import get_db
 from app.core.logger import get_logger
 from app.core.api_integration_rate_limiter import ApiIntegrationRateLimiter
 from app.background_services.smoke_tests.mock_apify_client import MockApifyClient
 from app.core.config import settings
+from app.core.response_cache import invalidate_tables
 
 logger = get_logger(__name__)
 
+# Number of dataset items held in memory and inserted per batch
+LEAD_SAVE_CHUNK_SIZE = 500
+
+# Batches of at least this many leads are loaded with COPY instead of INSERT;
+# datasets larger than this are also saved in chunks of this size
+LEAD_COPY_MIN_ROWS = 5000
+
+# Dataset items downloaded ahead of the database writer
+LEAD_PREFETCH_BUFFER_SIZE = LEAD_SAVE_CHUNK_SIZE * 2
+
+# Large datasets are downloaded as parallel offset/limit pages of this size
+DATASET_PAGE_SIZE = 1000
+DATASET_DOWNLOAD_WORKERS = 8
+
+# Apify record fields kept in Lead.raw_data. The nested organization object
+# and employment_history make up most of each record (~5 KB) and nothing reads
+# them back; the company name is already extracted into Lead.company.
+RAW_DATA_FIELDS = frozenset({
+    'id', 'name', 'first_name', 'last_name', 'email', 'email_status',
+    'headline', 'title', 'seniority', 'departments', 'subdepartments', 'functions',
+    'linkedin_url', 'twitter_url', 'github_url', 'facebook_url', 'photo_url',
+    'city', 'state', 'country', 'industry', 'estimated_num_employees',
+    'organization_id', 'organization_name', 'organization_website_url', 'organization_linkedin_url',
+})
+
+# Lead columns copied straight from Apify records, which normally carry all
+# of them; phone is usually absent and is read separately with .get()
+_LEAD_PROFILE_FIELDS = ('first_name', 'last_name', 'title', 'linkedin_url')
+_get_lead_profile_fields = operator.itemgetter(*_LEAD_PROFILE_FIELDS)
+
+
+def _lead_profile_fields(lead_data: Dict[str, Any]) -> tuple:
+    """Return the _LEAD_PROFILE_FIELDS values of a record, None for missing keys."""
+    try:
+        return _get_lead_profile_fields(lead_data)
+    except KeyError:
+        return tuple(lead_data.get(field) for field in _LEAD_PROFILE_FIELDS)
+
+
+# Columns written by the COPY path; created_at/updated_at use their server defaults
+_LEAD_COPY_COLUMNS = (
+    'id', 'campaign_id', 'first_name', 'last_name', 'email', 'phone',
+    'company', 'title', 'linkedin_url', 'raw_data',
+)
+_LEAD_COPY_SQL = (
+    f"COPY {Lead.__tablename__} ({', '.join(_LEAD_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+)
+
+_PREFETCH_DONE = object()
+
+# ApifyClient instances shared across ApolloService instances, keyed by API token,
+# so every service in the process reuses the same pooled HTTP connections
+_apify_clients: Dict[str, ApifyClient] = {}
+
+
+def _get_apify_client(api_token: str) -> ApifyClient:
+    """Return the process-wide ApifyClient for ``api_token``."""
+    client = _apify_clients.get(api_token)
+    if client is None:
+        client = _apify_clients[api_token] = ApifyClient(token=api_token)
+    return client
+
+
+@dataclass(slots=True, frozen=True)
+class FetchResult:
+    """Outcome of ApolloService.fetch_leads."""
+    count: int
+    created: int = 0
+    skipped: int = 0
+    errors: Tuple[str, ...] = ()
+    error_count: int = 0
+    total_processed: int = 0
+    rate_limited: bool = False
+    remaining_requests: Optional[int] = None
+    retry_after_seconds: int = 0
+
+
+class LeadSaveError(Exception):
+    """Raised by ApolloService._save_leads_stream; ``stats`` holds the totals of the chunks already committed."""
+
+    def __init__(self, message: str, stats: Dict[str, int]):
+        super().__init__(message)
+        self.stats = stats
+
+
+class _PrefetchError:
+    """Carries an exception raised by the prefetch producer to the consumer."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _prefetch_items(items: Iterable[Any], buffer_size: int = LEAD_PREFETCH_BUFFER_SIZE) -> Iterator[Any]:
+    """
+    Iterate ``items`` on a background thread, up to ``buffer_size`` ahead of the caller.
+    
+    Lets the Apify dataset download continue while the caller is busy writing
+    the previous chunk to the database. Producer exceptions are re-raised in
+    the caller; if the caller stops early the producer is told to stop too.
+    """
+    buffer = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_PREFETCH_DONE)
+        except Exception as e:
+            put(_PrefetchError(e))
+
+    threading.Thread(target=produce, name="apollo-dataset-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
 """
 IMPORTANT: Apify Python client (v1.10.0 and some other versions) expects webhook payload keys in snake_case (e.g., 'event_types', 'request_url', 'payload_template', 'idempotency_key'),
 even though the official Apify API docs use camelCase (e.g., 'eventTypes', 'requestUrl', 'payloadTemplate', 'idempotencyKey').
@@ -67,7 +202,8 @@ class ApolloService:
                     redis_client=redis_client,
                     api_name="Apollo",
                     max_requests=settings.APOLLO_RATE_LIMIT_REQUESTS,
-                    period_seconds=settings.APOLLO_RATE_LIMIT_PERIOD
+                    period_seconds=settings.APOLLO_RATE_LIMIT_PERIOD,
+                    lease_size=settings.RATE_LIMIT_LEASE_SIZE
                 )
                 logger.info("Apollo service - Using internal rate limiter setup")
             except Exception as e:
@@ -75,23 +211,16 @@ class ApolloService:
                 self.rate_limiter = None
         
         # Determine which Apify client to use
-        use_mock = os.getenv('USE_APIFY_CLIENT_MOCK', 'false').lower() == 'true'
-        logger.info(f"Apollo service - USE_APIFY_CLIENT_MOCK env var: {os.getenv('USE_APIFY_CLIENT_MOCK', 'not set')}")
-        logger.info(f"Apollo service - Using mock client: {use_mock}")
-        
-        if use_mock:
-            try:
-                from app.background_services.smoke_tests.mock_apify_client import MockApifyClient
-                self.apify_client = MockApifyClient()
-                logger.info("Apollo service - Successfully initialized with MockApifyClient")
-            except ImportError as e:
-                logger.error(f"Apollo service - Failed to import MockApifyClient: {e}")
-                logger.info("Apollo service - Falling back to real ApifyClient")
-                self.apify_client = ApifyClient(token=settings.APIFY_API_TOKEN)
+        if settings.USE_APIFY_CLIENT_MOCK:
+            self.apify_client = MockApifyClient()
+            logger.info("Apollo service - Initialized with MockApifyClient")
         else:
-            self.apify_client = ApifyClient(token=settings.APIFY_API_TOKEN)
+            self.apify_client = _get_apify_client(settings.APIFY_API_TOKEN)
             logger.info("Apollo service - Initialized with real ApifyClient")
         
+        # Resolve the actor sub-client once; fetch_leads reuses it for every run
+        self.actor_client = self.apify_client.actor(self.actor_id)
+        
         logger.info(f"ApolloService initialized with rate limiting: {settings.APOLLO_RATE_LIMIT_REQUESTS} requests per {settings.APOLLO_RATE_LIMIT_PERIOD}s", extra={"rate_limiting": "enabled"})
 
     def _save_leads_to_db(self, leads_data: List[Dict[str, Any]], campaign_id: str, db) -> Dict[str, int]:
@@ -133,16 +262,19 @@ class ApolloService:
                 # Continue without duplicate checking if query fails
                 existing_emails = set()
             
-        created_count = 0
         skipped_count = 0
         error_count = 0
+        rows = []
+        # Per-lead messages are debug only; the INFO summary below covers the batch
+        log_each_lead = logger.isEnabledFor(logging.DEBUG)
         
         # Process ALL records individually (including those with invalid emails)
         for lead_data in leads_data:
             try:
                 email = lead_data.get('email')
                 if not email or not email.strip():
-                    logger.warning(f"[LEAD] Skipping lead with empty email: {lead_data.get('first_name', 'unknown')} {lead_data.get('last_name', '')}")
+                    if log_each_lead:
+                        logger.debug(f"[LEAD] Skipping lead with empty email: {lead_data.get('first_name', 'unknown')} {lead_data.get('last_name', '')}")
                     skipped_count += 1
                     continue
                 
@@ -150,7 +282,8 @@ class ApolloService:
                 
                 # Check if this email already exists (only for valid emails)
                 if email_normalized in existing_emails:
-                    logger.info(f"[LEAD] Skipping duplicate email: {email} for campaign {campaign_id}")
+                    if log_each_lead:
+                        logger.debug(f"[LEAD] Skipping duplicate email: {email} for campaign {campaign_id}")
                     skipped_count += 1
                     continue
                 
@@ -161,35 +294,40 @@ class ApolloService:
                 elif 'organization_name' in lead_data:
                     company = lead_data['organization_name']
                 
-                # Create Lead object
-                lead = Lead(
-                    campaign_id=campaign_id,
-                    first_name=lead_data.get('first_name'),
-                    last_name=lead_data.get('last_name'),
-                    email=email.strip(),  # Store original case but trimmed
-                    phone=lead_data.get('phone'),
-                    company=company,
-                    title=lead_data.get('title'),
-                    linkedin_url=lead_data.get('linkedin_url'),
-                    raw_data=lead_data  # Store the full raw data
-                )
-                
-                db.add(lead)
+                first_name, last_name, title, linkedin_url = _lead_profile_fields(lead_data)
+                rows.append({
+                    'campaign_id': campaign_id,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'email': email.strip(),  # Store original case but trimmed
+                    'phone': lead_data.get('phone'),
+                    'company': company,
+                    'title': title,
+                    'linkedin_url': linkedin_url,
+                    'raw_data': {key: value for key, value in lead_data.items() if key in RAW_DATA_FIELDS}
+                })
                 
                 # Add this email to our existing set to prevent duplicates within this batch
                 existing_emails.add(email_normalized)
                 
-                created_count += 1
-                logger.info(f"[LEAD] Created lead: {lead.email} for campaign {campaign_id}")
-                
             except Exception as e:
                 logger.error(f"[LEAD] Error creating lead from data {lead_data.get('email', 'unknown')}: {str(e)}")
                 error_count += 1
                 continue
         
-        # Commit all leads at once
+        created_count = len(rows)
+        
+        # Insert all leads in a single multi-row INSERT (COPY for very large
+        # batches) and commit once
         try:
+            if len(rows) >= LEAD_COPY_MIN_ROWS:
+                self._copy_leads(rows, db)
+            elif rows:
+                db.execute(insert(Lead), rows)
             db.commit()
+            # Bulk INSERT and COPY bypass the ORM flush hooks that invalidate cached responses
+            if rows:
+                invalidate_tables(Lead.__tablename__)
             logger.info(f"[LEAD] Successfully saved {created_count} leads for campaign {campaign_id}")
             if skipped_count > 0:
                 logger.info(f"[LEAD] Skipped {skipped_count} duplicate/invalid emails for campaign {campaign_id}")
@@ -206,7 +344,94 @@ class ApolloService:
             'errors': error_count
         }
 
-    def fetch_leads(self, params: Dict[str, Any], campaign_id: str, db=None) -> Dict[str, Any]:
+    def _copy_leads(self, rows: List[Dict[str, Any]], db) -> None:
+        """
+        Load lead rows with a single COPY ... FROM STDIN on the session's connection.
+        
+        Skips the per-row statement overhead of INSERT for very large batches.
+        Runs inside the session transaction; the caller commits.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow((
+                str(uuid.uuid4()),
+                *('\\N' if row[column] is None else row[column] for column in _LEAD_COPY_COLUMNS[1:-1]),
+                orjson.dumps(row['raw_data'], option=orjson.OPT_NON_STR_KEYS).decode(),
+            ))
+        buffer.seek(0)
+        
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(_LEAD_COPY_SQL, buffer)
+        finally:
+            cursor.close()
+
+    def _save_leads_stream(
+        self, items: Iterable[Dict[str, Any]], campaign_id: str, db, chunk_size: int = LEAD_SAVE_CHUNK_SIZE
+    ) -> Dict[str, int]:
+        """
+        Save leads from an iterable in fixed-size chunks.
+        
+        Only one chunk is held in memory at a time; each chunk is inserted and
+        committed by _save_leads_to_db, so duplicate checks for later chunks
+        see the leads already saved by earlier ones.
+        Returns the combined statistics plus the number of items consumed.
+        
+        Raises:
+            LeadSaveError: If reading the items or saving a chunk fails; its
+                stats cover the chunks committed before the failure.
+        """
+        totals = {'created': 0, 'skipped': 0, 'errors': 0, 'processed': 0}
+        items_iter = iter(items)
+        try:
+            while chunk := list(itertools.islice(items_iter, chunk_size)):
+                chunk_stats = self._save_leads_to_db(chunk, campaign_id, db)
+                for key in ('created', 'skipped', 'errors'):
+                    totals[key] += chunk_stats[key]
+                totals['processed'] += len(chunk)
+        except Exception as e:
+            raise LeadSaveError(str(e), totals) from e
+        return totals
+
+    def _iterate_dataset_items(self, dataset_id: str, total_records: int) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate the items of an Apify dataset.
+        
+        Datasets larger than one page are fetched as offset/limit pages on a
+        thread pool, at most DATASET_DOWNLOAD_WORKERS pages in flight, and
+        yielded in order. Pages are sized from the dataset's itemCount, so
+        items beyond the requested total_records are kept; total_records is
+        only used when the dataset does not report a count. Smaller datasets,
+        and clients without list_items (the smoke test mock), use the SDK's
+        sequential iterate_items().
+        """
+        dataset_client = self.apify_client.dataset(dataset_id)
+        if not hasattr(dataset_client, 'list_items'):
+            yield from dataset_client.iterate_items()
+            return
+
+        item_count = (dataset_client.get() or {}).get('itemCount')
+        if item_count is None:
+            item_count = total_records
+        if item_count <= DATASET_PAGE_SIZE:
+            yield from dataset_client.iterate_items()
+            return
+
+        offsets = iter(range(0, item_count, DATASET_PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=DATASET_DOWNLOAD_WORKERS) as executor:
+            def fetch_page(offset):
+                return executor.submit(dataset_client.list_items, offset=offset, limit=DATASET_PAGE_SIZE)
+
+            pending = deque(fetch_page(offset) for offset in itertools.islice(offsets, DATASET_DOWNLOAD_WORKERS))
+            while pending:
+                page = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(fetch_page(next_offset))
+                yield from page.items
+
+    def fetch_leads(self, params: Dict[str, Any], campaign_id: str, db=None) -> FetchResult:
         """
         Fetch leads from Apollo via Apify and save them to the database.
         
@@ -220,17 +445,9 @@ class ApolloService:
             db: Database session (optional, for FastAPI integration)
             
         Returns:
-            Dict containing the count of created leads and any errors
+            FetchResult with the count of created leads and any errors
         """
-        # Validate input shape
-        required_keys = ['fileName', 'totalRecords', 'url']
-        for key in required_keys:
-            if key not in params:
-                raise ValueError(f"Missing required parameter: {key} (expected keys: {required_keys})")
-        
-        logger.info(f"[APIFY] fetch_leads input params: {params}")
-        
-        # Check rate limiting if enabled
+        # Check rate limiting first so throttled calls return before any other work
         if self.rate_limiter:
             try:
                 if not self.rate_limiter.acquire():
@@ -249,13 +466,13 @@ class ApolloService:
                             'campaign_id': campaign_id
                         }
                     )
-                    return {
-                        'count': 0,
-                        'errors': [error_msg],
-                        'rate_limited': True,
-                        'remaining_requests': remaining,
-                        'retry_after_seconds': self.rate_limiter.period_seconds
-                    }
+                    return FetchResult(
+                        count=0,
+                        errors=(error_msg,),
+                        rate_limited=True,
+                        remaining_requests=remaining,
+                        retry_after_seconds=self.rate_limiter.period_seconds
+                    )
             except Exception as rate_limit_error:
                 # If rate limiter fails (e.g., Redis unavailable), log and continue
                 logger.warning(
@@ -263,39 +480,44 @@ class ApolloService:
                     extra={'component': 'apollo_service', 'rate_limiter_error': str(rate_limit_error)}
                 )
         
+        # Validate input shape
+        required_keys = ['fileName', 'totalRecords', 'url']
+        for key in required_keys:
+            if key not in params:
+                raise ValueError(f"Missing required parameter: {key} (expected keys: {required_keys})")
+        
+        logger.debug(f"[APIFY] fetch_leads input params: {params}")
+        
         try:
             logger.info(f"[START fetch_leads] campaign_id={campaign_id}")
 
             # --- Apify actor run block ---
-            logger.info(f"[BEFORE ApifyClient actor call] actor_id={self.actor_id} with params: {params}")
-            
-            # Log rate limiting status for monitoring
-            if self.rate_limiter:
-                remaining_before = self.rate_limiter.get_remaining()
-                logger.info(
-                    f"Making Apollo API call with rate limiter remaining: {remaining_before}",
-                    extra={
-                        'component': 'apollo_service',
-                        'rate_limiter_remaining_before': remaining_before,
-                        'campaign_id': campaign_id
-                    }
-                )
+            logger.debug(f"[BEFORE ApifyClient actor call] actor_id={self.actor_id} with params: {params}")
             
-            run = self.apify_client.actor(self.actor_id).call(run_input=params)
+            run = self.actor_client.call(run_input=params)
             dataset_id = run.get("defaultDatasetId")
             if not dataset_id:
                 raise Exception("No dataset ID returned from Apify actor run.")
             logger.info(f"[GOT dataset_id] {dataset_id}")
-            results = list(self.apify_client.dataset(dataset_id).iterate_items())
-            logger.info(f"[AFTER dataset.iterate_items] got {len(results)} results")
 
-            # Process and save leads using helper
+            # Stream dataset items straight into the database in chunks,
+            # downloading ahead on a background thread while each chunk is written
             errors = []
+            total_processed = 0
+            total_records = int(params['totalRecords'])
+            chunk_size = LEAD_COPY_MIN_ROWS if total_records > LEAD_COPY_MIN_ROWS else LEAD_SAVE_CHUNK_SIZE
             try:
-                lead_stats = self._save_leads_to_db(results, campaign_id, db)
+                lead_stats = self._save_leads_stream(
+                    _prefetch_items(self._iterate_dataset_items(dataset_id, total_records)),
+                    campaign_id,
+                    db,
+                    chunk_size=chunk_size
+                )
                 created_count = lead_stats['created']
                 skipped_count = lead_stats['skipped']
                 error_count = lead_stats['errors']
+                total_processed = lead_stats['processed']
+                logger.info(f"[AFTER dataset.iterate_items] processed {total_processed} results")
                 
                 # Add summary to response
                 if skipped_count > 0:
@@ -303,22 +525,25 @@ class ApolloService:
                 if error_count > 0:
                     errors.append(f"Encountered {error_count} errors during processing")
                     
-            except Exception as e:
+            except LeadSaveError as e:
+                # Chunks saved before the failure stay committed, so report them
                 error_msg = f"Error saving leads: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-                created_count = 0
-                skipped_count = 0
-                error_count = 0
+                created_count = e.stats['created']
+                skipped_count = e.stats['skipped']
+                error_count = e.stats['errors']
+                total_processed = e.stats['processed']
             
-            # Log rate limiting status after successful call
+            # Log the slots this process still holds from its last lease; this is not
+            # the shared remaining quota, which would cost a Redis round trip to read
             if self.rate_limiter:
-                remaining_after = self.rate_limiter.get_remaining()
+                leased_slots = self.rate_limiter.local_bucket.tokens
                 logger.info(
-                    f"Apollo API call successful. Rate limiter remaining: {remaining_after}",
+                    f"Apollo API call successful. Leased rate limit slots left in this process: {leased_slots}",
                     extra={
                         'component': 'apollo_service',
-                        'rate_limiter_remaining_after': remaining_after,
+                        'rate_limiter_leased_slots': leased_slots,
                         'campaign_id': campaign_id,
                         'leads_fetched': created_count
                     }
@@ -335,14 +560,14 @@ class ApolloService:
             
             logger.info(f"[AFTER _save_leads_to_db] created_count={created_count}")
             logger.info(f"Leads fetch complete: {created_count} leads created, {len(errors)} errors")
-            return {
-                'count': created_count,
-                'created': created_count,
-                'skipped': skipped_count,
-                'errors': errors,
-                'error_count': error_count,
-                'total_processed': len(results) if 'results' in locals() else 0
-            }
+            return FetchResult(
+                count=created_count,
+                created=created_count,
+                skipped=skipped_count,
+                errors=tuple(errors),
+                error_count=error_count,
+                total_processed=total_processed
+            )
             
         except Exception as e:
             error_msg = f"Error fetching leads: {str(e)}"
@@ -1,5 +1,7 @@
+import functools
 import os
 from typing import Optional, Dict, Any
+import httpx
 from openai import OpenAI
 from app.core.api_integration_rate_limiter import ApiIntegrationRateLimiter
 from app.core.logger import get_logger
@@ -8,6 +10,76 @@ from app.core.circuit_breaker import CircuitBreakerService, ThirdPartyService
 
 logger = get_logger(__name__)
 
+# One pooled HTTP client shared by every OpenAIService in the process, so
+# per-lead service instances reuse keep-alive connections instead of
+# paying a TCP + TLS handshake on each call
+_http_client: Optional[httpx.Client] = None
+
+
+EMAIL_COPY_PROMPT_TEMPLATE = """Write a personalized email to {full_name} at {company_name}.
+
+Enrichment Information:
+{enrichment_content}
+
+Lead Information:
+- Name: {full_name}
+- Company: {company_name}
+- Role: {title}
+
+Write a professional, personalized email that:
+1. Shows understanding of their business
+2. Offers specific value
+3. Has a clear call to action
+4. Is concise and engaging
+
+Email:"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a professional email copywriter."}
+
+# Leads of the same company share the same enrichment, so the company part
+# of the prompt is formatted once and reused for each of them
+PROMPT_CACHE_SIZE = 1024
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared HTTP client used for OpenAI API calls."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+    return _http_client
+
+
+def _enrichment_content(enrichment_data: Optional[Dict[str, Any]]) -> str:
+    """Return the message content of an enrichment completion, or "" if there is none."""
+    try:
+        return enrichment_data['choices'][0]['message']['content'] or ""
+    except (KeyError, IndexError, TypeError):
+        return ""
+
+
+def _escape_braces(value: str) -> str:
+    return value.replace("{", "{{").replace("}", "}}")
+
+
+@functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _company_prompt_template(company_name: str, enrichment_content: str) -> str:
+    """
+    Fill the company fields of EMAIL_COPY_PROMPT_TEMPLATE.
+    
+    The result is still a format template with only the per-lead
+    {full_name} and {title} placeholders left open.
+    """
+    return EMAIL_COPY_PROMPT_TEMPLATE.format_map({
+        'full_name': '{full_name}',
+        'title': '{title}',
+        'company_name': _escape_braces(str(company_name)),
+        'enrichment_content': _escape_braces(enrichment_content)
+    })
+
+
 class OpenAIService:
     """
     Service for generating email copy using OpenAI's API.
@@ -30,7 +102,7 @@ class OpenAIService:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=_get_http_client())
         self.rate_limiter = rate_limiter
         self.circuit_breaker = circuit_breaker
         
@@ -183,7 +255,8 @@ class OpenAIService:
         Returns:
             The full OpenAI API response (dict) or error response
         """
-        operation = f"generate_email_copy for lead {getattr(lead, 'id', None)}"
+        lead_id = lead.id
+        operation = f"generate_email_copy for lead {lead_id}"
         
         # Check circuit breaker if enabled
         circuit_error = self._check_circuit_breaker(operation)
@@ -204,70 +277,46 @@ class OpenAIService:
         
         try:
             # Extract and log prompt variables
-            first_name = getattr(lead, 'first_name', '')
-            last_name = getattr(lead, 'last_name', '')
-            company_name = getattr(lead, 'company_name', None) or getattr(lead, 'company', '')
+            first_name = lead.first_name or ''
+            last_name = lead.last_name or ''
+            # Lead stores the company as `company`; `company_name` is accepted
+            # from lead-like objects that carry it instead
+            company_name = getattr(lead, 'company_name', None) or lead.company or ''
             full_name = f"{first_name} {last_name}".strip()
             
             logger.info(
-                f"Email copy prompt vars for lead {getattr(lead, 'id', None)}: first_name='{first_name}', last_name='{last_name}', company_name='{company_name}'", 
-                extra={'component': 'openai_service', 'lead_id': getattr(lead, 'id', None)}
+                f"Email copy prompt vars for lead {lead_id}: first_name='{first_name}', last_name='{last_name}', company_name='{company_name}'", 
+                extra={'component': 'openai_service', 'lead_id': lead_id}
             )
 
-            # Validate required fields
-            missing = []
-            if not first_name:
-                missing.append('first_name')
-            if not last_name:
-                missing.append('last_name')
-            if not company_name:
-                missing.append('company_name')
-            if missing:
-                error_msg = f"Missing required prompt variables for email copy: {', '.join(missing)} for lead {getattr(lead, 'id', None)}"
+            # Validate required fields; the missing list is only built on failure
+            required = (('first_name', first_name), ('last_name', last_name), ('company_name', company_name))
+            if not all(value for _, value in required):
+                missing = [name for name, value in required if not value]
+                error_msg = f"Missing required prompt variables for email copy: {', '.join(missing)} for lead {lead_id}"
                 logger.error(
                     error_msg, 
-                    extra={'component': 'openai_service', 'lead_id': getattr(lead, 'id', None), 'missing_fields': missing}
+                    extra={'component': 'openai_service', 'lead_id': lead_id, 'missing_fields': missing}
                 )
                 return {
                     'status': 'error',
                     'error': error_msg
                 }
 
-            # Extract enrichment content
-            enrichment_content = ""
-            if enrichment_data and 'choices' in enrichment_data:
-                enrichment_content = enrichment_data['choices'][0]['message']['content']
-
-            prompt = f"""Write a personalized email to {full_name} at {company_name}.
-
-Enrichment Information:
-{enrichment_content}
-
-Lead Information:
-- Name: {full_name}
-- Company: {company_name}
-- Role: {getattr(lead, 'title', 'Unknown')}
-
-Write a professional, personalized email that:
-1. Shows understanding of their business
-2. Offers specific value
-3. Has a clear call to action
-4. Is concise and engaging
-
-Email:"""
+            prompt = _company_prompt_template(company_name, _enrichment_content(enrichment_data)).format_map({
+                'full_name': full_name,
+                'title': lead.title or 'Unknown'
+            })
 
             logger.info(
-                f"Built email copy prompt for lead {getattr(lead, 'id', None)}", 
-                extra={'component': 'openai_service', 'lead_id': getattr(lead, 'id', None)}
+                f"Built email copy prompt for lead {lead_id}", 
+                extra={'component': 'openai_service', 'lead_id': lead_id}
             )
 
             # Call OpenAI API (openai>=1.0.0 interface)
             response = self.client.chat.completions.create(
                 model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a professional email copywriter."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 temperature=0.7,
                 max_tokens=500
             )
@@ -278,30 +327,31 @@ Email:"""
             if self.circuit_breaker:
                 self.circuit_breaker.record_success(ThirdPartyService.OPENAI)
             
-            # Log rate limiting status for monitoring
+            # Log the slots this process still holds from its last lease; this is not
+            # the shared remaining quota, which would cost a Redis round trip to read
             if self.rate_limiter:
-                remaining = self.rate_limiter.get_remaining()
+                leased_slots = self.rate_limiter.local_bucket.tokens
                 logger.info(
-                    f"Email copy generation successful for lead {getattr(lead, 'id', None)}. Rate limiter remaining: {remaining}",
+                    f"Email copy generation successful for lead {lead_id}. Leased rate limit slots left in this process: {leased_slots}",
                     extra={
                         'component': 'openai_service',
-                        'lead_id': getattr(lead, 'id', None),
-                        'rate_limiter_remaining': remaining
+                        'lead_id': lead_id,
+                        'rate_limiter_leased_slots': leased_slots
                     }
                 )
             else:
                 logger.info(
-                    f"Email copy generation successful for lead {getattr(lead, 'id', None)}",
-                    extra={'component': 'openai_service', 'lead_id': getattr(lead, 'id', None)}
+                    f"Email copy generation successful for lead {lead_id}",
+                    extra={'component': 'openai_service', 'lead_id': lead_id}
                 )
             
             return result
             
         except Exception as e:
-            error_msg = f"Error generating email copy for lead {getattr(lead, 'id', None)}: {str(e)}"
+            error_msg = f"Error generating email copy for lead {lead_id}: {str(e)}"
             logger.error(
                 error_msg, 
-                extra={'component': 'openai_service', 'lead_id': getattr(lead, 'id', None), 'error': str(e)}
+                extra={'component': 'openai_service', 'lead_id': lead_id, 'error': str(e)}
             )
             
             # Check if this is a rate limit error and handle appropriately
@@ -309,10 +359,10 @@ Email:"""
                 rate_limit_details = self._extract_rate_limit_details(e)
                 
                 logger.warning(
-                    f"Detected OpenAI rate limit error for lead {getattr(lead, 'id', None)}: {str(e)}",
+                    f"Detected OpenAI rate limit error for lead {lead_id}: {str(e)}",
                     extra={
                         'component': 'openai_service', 
-                        'lead_id': getattr(lead, 'id', None), 
+                        'lead_id': lead_id, 
                         'error_type': 'rate_limit',
                         'rate_limit_details': rate_limit_details
                     }
@@ -1,10 +1,16 @@
+import logging
+import mmap
 import time
-import json
 import os
 import random
-import copy
 import redis
-from typing import Dict, Any, List
+import orjson
+from typing import Dict, Any, List, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
 
 # Configuration constants
 LEADS_PER_DATASET_CALL = 10  # Number of leads returned per dataset call
@@ -12,10 +18,30 @@ LEADS_PER_DATASET_CALL = 10  # Number of leads returned per dataset call
 # Path to the original dataset
 DATASET_PATH = os.path.join(os.path.dirname(__file__), 'dataset_apollo-io-scraper_2025-05-21_19-33-02-963.json')
 
+# Record fields ApolloService reads: its lead columns plus the fields it keeps
+# in Lead.raw_data. Employment history and most of the nested organization
+# are dropped when the dataset is loaded.
+RECORD_FIELDS = frozenset({
+    'id', 'name', 'first_name', 'last_name', 'email', 'email_status', 'phone',
+    'headline', 'title', 'seniority', 'departments', 'subdepartments', 'functions',
+    'linkedin_url', 'twitter_url', 'github_url', 'facebook_url', 'photo_url',
+    'city', 'state', 'country', 'industry', 'estimated_num_employees',
+    'organization', 'organization_id', 'organization_name', 'organization_website_url',
+    'organization_linkedin_url',
+})
+
 # Redis keys for shared state
 DATASET_LOADED_KEY = "mock_apify:dataset_loaded"
 DATASET_ORIGINAL_KEY = "mock_apify:dataset_original"
+DATASET_ORIGINAL_LIST_KEY = DATASET_ORIGINAL_KEY + ":list"
 DATASET_WORKING_KEY = "mock_apify:dataset_working"
+DATASET_WORKING_LIST_KEY = DATASET_WORKING_KEY + ":list"
+
+# Parsed copy of the original dataset, decoded from Redis once per process
+_original_dataset: Optional[List[Dict[str, Any]]] = None
+
+# Set once this process has seen the dataset in Redis, so later batches skip the check
+_dataset_loaded = False
 
 def get_redis_connection() -> redis.Redis:
     """Get Redis connection for shared state across processes."""
@@ -47,53 +73,141 @@ def check_redis_availability() -> bool:
         redis_client = get_redis_connection()
         # Test Redis connectivity with a simple ping
         redis_client.ping()
-        print(f"[MockApifyClient] Redis connectivity verified successfully")
+        logger.info("[MockApifyClient] Redis connectivity verified successfully")
         return True
     except Exception as e:
-        print(f"[MockApifyClient] ERROR: Redis is not available: {e}")
-        print(f"[MockApifyClient] Please ensure Redis is running and accessible")
+        logger.error(f"[MockApifyClient] Redis is not available: {e}")
+        logger.error("[MockApifyClient] Please ensure Redis is running and accessible")
         return False
 
+def _prune_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only RECORD_FIELDS of a scraped record; the organization keeps just its name."""
+    pruned = {key: value for key, value in record.items() if key in RECORD_FIELDS}
+    if isinstance(pruned.get('organization'), dict):
+        pruned['organization'] = {'name': pruned['organization'].get('name')}
+    return pruned
+
 def load_original_dataset():
     """Load the original dataset from file once and store in shared Redis storage."""
+    global _original_dataset
     redis_client = get_redis_connection()
     
     # Check if dataset is already loaded in Redis
     if redis_client.exists(DATASET_LOADED_KEY):
-        print(f"[MockApifyClient] Dataset already loaded in Redis")
-        return json.loads(redis_client.get(DATASET_ORIGINAL_KEY) or "[]")
+        logger.debug("[MockApifyClient] Dataset already loaded in Redis")
+        # The original dataset never changes once loaded, so parse it only once
+        if _original_dataset is None:
+            _original_dataset = orjson.loads(redis_client.get(DATASET_ORIGINAL_KEY) or "[]")
+        return _original_dataset
     
-    print(f"[MockApifyClient] Loading original dataset from: {DATASET_PATH}")
+    logger.info(f"[MockApifyClient] Loading original dataset from: {DATASET_PATH}")
     try:
-        with open(DATASET_PATH, 'r') as f:
-            dataset = json.load(f)
+        # Parse straight from a read-only mapping of the file instead of
+        # reading it into an intermediate bytes object first
+        with open(DATASET_PATH, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            dataset = orjson.loads(view)
+        
+        # Drop the fields ApolloService never reads before the records are stored in Redis
+        dataset = [_prune_record(record) for record in dataset]
         
-        # Store in Redis
-        redis_client.set(DATASET_ORIGINAL_KEY, json.dumps(dataset))
-        redis_client.set(DATASET_WORKING_KEY, json.dumps(dataset))
+        # Store in Redis; the pre-encoded original list lets the working list
+        # be built, and later reset, with a server-side copy
+        redis_client.set(DATASET_ORIGINAL_KEY, orjson.dumps(dataset))
+        _store_list(redis_client, DATASET_ORIGINAL_LIST_KEY, dataset)
+        _copy_original_to_working(redis_client)
         redis_client.set(DATASET_LOADED_KEY, "true")
         
-        print(f"[MockApifyClient] Successfully loaded {len(dataset)} total records from file to Redis")
-        print(f"[MockApifyClient] Created working dataset with {len(dataset)} records")
+        logger.info(f"[MockApifyClient] Successfully loaded {len(dataset)} total records from file to Redis")
+        logger.info(f"[MockApifyClient] Created working dataset with {len(dataset)} records")
         
         # Check first few records for structure
         if dataset and len(dataset) > 0:
             first_record = dataset[0]
-            print(f"[MockApifyClient] Sample record keys: {list(first_record.keys())}")
-            print(f"[MockApifyClient] Sample email: {first_record.get('email', 'NO_EMAIL_FIELD')}")
+            logger.debug(f"[MockApifyClient] Sample record keys: {list(first_record.keys())}")
+            logger.debug(f"[MockApifyClient] Sample email: {first_record.get('email', 'NO_EMAIL_FIELD')}")
         else:
-            print(f"[MockApifyClient] WARNING: Dataset appears to be empty!")
+            logger.warning("[MockApifyClient] Dataset appears to be empty!")
         
+        _original_dataset = dataset
         return dataset
         
     except Exception as e:
-        print(f"[MockApifyClient] ERROR loading dataset: {e}")
+        logger.error(f"[MockApifyClient] Error loading dataset: {e}")
         # Store empty dataset in Redis to prevent repeated load attempts
-        redis_client.set(DATASET_ORIGINAL_KEY, json.dumps([]))
-        redis_client.set(DATASET_WORKING_KEY, json.dumps([]))
+        redis_client.set(DATASET_ORIGINAL_KEY, orjson.dumps([]))
+        redis_client.delete(DATASET_ORIGINAL_LIST_KEY, DATASET_WORKING_LIST_KEY)
         redis_client.set(DATASET_LOADED_KEY, "true")
         return []
 
+def _ensure_dataset_loaded(redis_client) -> None:
+    """
+    Make sure the dataset is in Redis without decoding it in this process.
+    
+    Workers that only pop leads never need the parsed dataset, so it is
+    left to load_original_dataset() callers that actually use the records.
+    Redis is only checked on the first call in each process; _pop_leads()
+    checks again whenever a pop comes back empty.
+    """
+    global _dataset_loaded
+    if _dataset_loaded:
+        return
+    if not redis_client.exists(DATASET_LOADED_KEY):
+        load_original_dataset()
+    _dataset_loaded = True
+
+def _store_list(redis_client, key: str, items: List[Dict[str, Any]]) -> None:
+    """Replace the Redis list at ``key`` with the encoded ``items``."""
+    pipe = redis_client.pipeline()
+    pipe.delete(key)
+    if items:
+        pipe.lpush(key, *(orjson.dumps(item) for item in items))
+    pipe.execute()
+
+def _copy_original_to_working(redis_client) -> int:
+    """Replace the working list with a copy of the original list; returns its length."""
+    pipe = redis_client.pipeline()
+    pipe.delete(DATASET_WORKING_LIST_KEY)
+    pipe.copy(DATASET_ORIGINAL_LIST_KEY, DATASET_WORKING_LIST_KEY)
+    pipe.llen(DATASET_WORKING_LIST_KEY)
+    _, _, working_count = pipe.execute()
+    return working_count
+
+def _pop_working_items(redis_client, count: int) -> List[str]:
+    """
+    Take up to ``count`` encoded leads from the head of the working list.
+    
+    LRANGE + LTRIM run in one MULTI/EXEC transaction, so a batch is a single
+    round trip and concurrent workers never receive the same lead.
+    """
+    if count <= 0:
+        return []
+    pipe = redis_client.pipeline()
+    pipe.lrange(DATASET_WORKING_LIST_KEY, 0, count - 1)
+    pipe.ltrim(DATASET_WORKING_LIST_KEY, count, -1)
+    items, _ = pipe.execute()
+    return items
+
+def _pop_leads(redis_client, count: int) -> List[str]:
+    """
+    Take up to ``count`` encoded leads, loading the dataset first if needed.
+    
+    The process-wide loaded flag is only trusted while pops return leads. An
+    empty pop checks DATASET_LOADED_KEY again, so after Redis is flushed or
+    restarted the dataset is reloaded instead of every later batch coming
+    back empty.
+    """
+    global _dataset_loaded
+    _ensure_dataset_loaded(redis_client)
+    items = _pop_working_items(redis_client, count)
+    if not items and count > 0 and not redis_client.exists(DATASET_LOADED_KEY):
+        logger.warning("[MockApifyClient] Dataset missing from Redis, reloading")
+        _dataset_loaded = False
+        _ensure_dataset_loaded(redis_client)
+        items = _pop_working_items(redis_client, count)
+    return items
+
 def get_next_campaign_data(leads_count=LEADS_PER_DATASET_CALL):
     """
     Get the next available slice of leads using Redis-backed pop-based consumption.
@@ -109,70 +223,31 @@ def get_next_campaign_data(leads_count=LEADS_PER_DATASET_CALL):
     """
     redis_client = get_redis_connection()
     
-    # Ensure dataset is loaded
-    load_original_dataset()
-    
-    # Use Redis for thread-safe pop operations
-    campaign_data = []
-    
-    # Use LPOP to atomically pop items from the working dataset list
-    for _ in range(leads_count):
-        # Try to pop an item from the working dataset
-        item_json = redis_client.lpop(DATASET_WORKING_KEY + ":list")
-        if item_json:
-            try:
-                lead = json.loads(item_json)
-                campaign_data.append(copy.deepcopy(lead))
-            except json.JSONDecodeError as e:
-                print(f"[MockApifyClient] Error parsing lead from Redis: {e}")
-                continue
-        else:
-            # No more items available
-            break
-    
-    # Check if we need to initialize the list format
-    if not campaign_data and redis_client.exists(DATASET_WORKING_KEY):
-        # Convert from JSON array to Redis list format if needed
-        working_data_json = redis_client.get(DATASET_WORKING_KEY)
-        if working_data_json:
+    # Atomically take the next batch from the working dataset list, loading
+    # the dataset if needed; each lead is decoded into a fresh dict, so
+    # callers can't mutate shared state
+    items = _pop_leads(redis_client, leads_count)
+    try:
+        campaign_data = [orjson.loads(item_json) for item_json in items]
+    except orjson.JSONDecodeError:
+        # Rare: decode one by one so a single bad record doesn't lose the batch
+        campaign_data = []
+        for item_json in items:
             try:
-                working_data = json.loads(working_data_json)
-                if working_data and isinstance(working_data, list):
-                    # Convert to Redis list format
-                    pipe = redis_client.pipeline()
-                    pipe.delete(DATASET_WORKING_KEY + ":list")
-                    for item in working_data:
-                        pipe.lpush(DATASET_WORKING_KEY + ":list", json.dumps(item))
-                    pipe.execute()
-                    
-                    # Clear the old JSON format
-                    redis_client.delete(DATASET_WORKING_KEY)
-                    
-                    # Try again to pop items
-                    for _ in range(leads_count):
-                        item_json = redis_client.lpop(DATASET_WORKING_KEY + ":list")
-                        if item_json:
-                            try:
-                                lead = json.loads(item_json)
-                                campaign_data.append(copy.deepcopy(lead))
-                            except json.JSONDecodeError:
-                                continue
-                        else:
-                            break
-            except json.JSONDecodeError:
-                pass
-    
-    # Get remaining count
-    remaining_count = redis_client.llen(DATASET_WORKING_KEY + ":list")
+                campaign_data.append(orjson.loads(item_json))
+            except orjson.JSONDecodeError as e:
+                logger.error(f"[MockApifyClient] Error parsing lead from Redis: {e}")
     
-    # Log the results
-    emails_provided = [lead.get('email') for lead in campaign_data]
-    valid_emails = [email for email in emails_provided if email and email.strip()]
-    
-    print(f"[MockApifyClient] Popped {len(campaign_data)}/{leads_count} requested leads from Redis")
-    print(f"[MockApifyClient] Working dataset remaining: {remaining_count} records")
-    print(f"[MockApifyClient] Emails provided: {emails_provided}")
-    print(f"[MockApifyClient] Valid emails: {len(valid_emails)}/{len(emails_provided)}")
+    # Log the results; the remaining count and email lists are only built for debug output
+    if logger.isEnabledFor(logging.DEBUG):
+        remaining_count = redis_client.llen(DATASET_WORKING_LIST_KEY)
+        emails_provided = [lead.get('email') for lead in campaign_data]
+        valid_count = sum(1 for email in emails_provided if email and email.strip())
+        
+        logger.debug(f"[MockApifyClient] Popped {len(campaign_data)}/{leads_count} requested leads from Redis")
+        logger.debug(f"[MockApifyClient] Working dataset remaining: {remaining_count} records")
+        logger.debug(f"[MockApifyClient] Emails provided: {emails_provided}")
+        logger.debug(f"[MockApifyClient] Valid emails: {valid_count}/{len(emails_provided)}")
     
     return campaign_data
 
@@ -180,51 +255,53 @@ def reset_dataset():
     """
     Reset the working dataset to original state for test isolation.
     
-    This recreates the working dataset from the original loaded data.
+    This recreates the working dataset from the original loaded data with a
+    server-side COPY of the pre-encoded original list, so no records are
+    decoded or re-encoded here.
     """
+    global _dataset_loaded
     redis_client = get_redis_connection()
     
     # Reset using Redis
     original_data_json = redis_client.get(DATASET_ORIGINAL_KEY)
     if original_data_json:
-        original_data = json.loads(original_data_json)
+        # Datasets loaded before the original list existed get it built once
+        if not redis_client.exists(DATASET_ORIGINAL_LIST_KEY):
+            _store_list(redis_client, DATASET_ORIGINAL_LIST_KEY, orjson.loads(original_data_json))
         
-        # Clear and rebuild the working list
-        pipe = redis_client.pipeline()
-        pipe.delete(DATASET_WORKING_KEY + ":list")
-        for item in original_data:
-            pipe.lpush(DATASET_WORKING_KEY + ":list", json.dumps(item))
-        pipe.execute()
+        # Clear and rebuild the working list; drop the JSON working copy left by older versions
+        available_count = _copy_original_to_working(redis_client)
+        redis_client.delete(DATASET_WORKING_KEY)
         
-        # Also reset the JSON format
-        redis_client.set(DATASET_WORKING_KEY, original_data_json)
-        
-        print(f"[MockApifyClient] Reset working dataset to original state: {len(original_data)} records available")
+        logger.info(f"[MockApifyClient] Reset working dataset to original state: {available_count} records available")
     else:
-        print(f"[MockApifyClient] WARNING: Cannot reset - original dataset not loaded")
+        # Redis lost the dataset; let the next batch load it again
+        _dataset_loaded = False
+        logger.warning("[MockApifyClient] Cannot reset - original dataset not loaded")
 
 def get_dataset_status():
     """Get current dataset status for debugging."""
     redis_client = get_redis_connection()
     
-    # Ensure dataset is loaded
-    load_original_dataset()
-    
     try:
-        original_data_json = redis_client.get(DATASET_ORIGINAL_KEY)
-        original_count = len(json.loads(original_data_json)) if original_data_json else 0
-        remaining_count = redis_client.llen(DATASET_WORKING_KEY + ":list")
+        # Ensure dataset is loaded; the whole status is read in one round trip
+        _ensure_dataset_loaded(redis_client)
+        pipe = redis_client.pipeline()
+        pipe.exists(DATASET_LOADED_KEY)
+        pipe.llen(DATASET_ORIGINAL_LIST_KEY)
+        pipe.llen(DATASET_WORKING_LIST_KEY)
+        loaded, original_count, remaining_count = pipe.execute()
         consumed_count = original_count - remaining_count
         
         return {
-            "status": "loaded" if redis_client.exists(DATASET_LOADED_KEY) else "not_loaded",
+            "status": "loaded" if loaded else "not_loaded",
             "total": original_count,
             "consumed": consumed_count,
             "remaining": remaining_count,
             "storage": "redis"
         }
     except Exception as e:
-        print(f"[MockApifyClient] Error getting dataset status from Redis: {e}")
+        logger.error(f"[MockApifyClient] Error getting dataset status from Redis: {e}")
         return {"status": "error", "error": str(e), "storage": "redis"}
 
 class MockActor:
@@ -232,8 +309,9 @@ class MockActor:
         self.actor_id = actor_id
 
     def call(self, run_input=None):
-        # Simulate async process
-        time.sleep(random.uniform(0.1, 0.3))
+        # Simulate the actor run time only when a delay is configured
+        if settings.MOCK_APIFY_DELAY_SECONDS > 0:
+            time.sleep(random.uniform(0, settings.MOCK_APIFY_DELAY_SECONDS))
         
         # Return a mock dataset ID
         dataset_id = f"mock_dataset_{random.randint(1000, 9999)}"
@@ -242,33 +320,38 @@ class MockActor:
 class MockDataset:
     def __init__(self, dataset_id):
         self.dataset_id = dataset_id
-        print(f"[MockDataset] Created dataset {dataset_id}")
     
     def iterate_items(self):
-        """Get next available data slice using Redis-backed pop-based approach."""
-        print(f"[MockDataset] Getting next data slice for dataset {self.dataset_id}")
-        
-        # Get next available data using the Redis-backed pop-based approach
-        campaign_data = get_next_campaign_data(LEADS_PER_DATASET_CALL)
+        """
+        Yield the next available data slice using Redis-backed pop-based approach.
         
-        print(f"[MockDataset] Returning {len(campaign_data)} leads for dataset {self.dataset_id}")
+        The batch is popped atomically on first iteration, like get_next_campaign_data,
+        but leads are decoded one at a time as the caller consumes them.
+        """
+        redis_client = get_redis_connection()
+        items = _pop_leads(redis_client, LEADS_PER_DATASET_CALL)
+        logger.debug(f"[MockDataset] Popped {len(items)}/{LEADS_PER_DATASET_CALL} requested leads for dataset {self.dataset_id}")
         
-        return iter(campaign_data)
+        for item_json in items:
+            try:
+                yield orjson.loads(item_json)
+            except orjson.JSONDecodeError as e:
+                logger.error(f"[MockApifyClient] Error parsing lead from Redis: {e}")
 
 class MockApifyClient:
     def __init__(self, api_token=None):
         self.api_token = api_token
         self.actor_id = "mock/apollo-io-scraper"  # Mock actor ID
-        print(f"[MockApifyClient] Initialized with api_token={'*' * 5 if api_token else None}")
-        print(f"[MockApifyClient] Using mock actor_id: {self.actor_id}")
+        logger.debug(f"[MockApifyClient] Initialized with api_token={'*' * 5 if api_token else None}")
+        logger.debug(f"[MockApifyClient] Using mock actor_id: {self.actor_id}")
         # Load the dataset once when the client is instantiated
-        load_original_dataset()
+        _ensure_dataset_loaded(get_redis_connection())
     
     def actor(self, actor_id):
         return MockActor(actor_id)
 
     def dataset(self, dataset_id):
-        print(f"[MockApifyClient] Creating dataset {dataset_id}")
+        logger.debug(f"[MockApifyClient] Creating dataset {dataset_id}")
         return MockDataset(dataset_id)
 
 def reset_campaign_counter():
@@ -279,7 +362,7 @@ def reset_campaign_counter():
     pop-based approach. It resets the working dataset to its original state.
     """
     reset_dataset()
-    print(f"[MockApifyClient] System reset for new test run")
+    logger.info("[MockApifyClient] System reset for new test run")
 
 def get_mock_leads_data():
     """Get mock leads data using Redis-backed pop-based approach."""
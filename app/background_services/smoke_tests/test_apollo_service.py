@@ -12,8 +12,10 @@ This test suite validates the ApolloService functionality including:
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import json
-from app.background_services.apollo_service import ApolloService
+from app.background_services import apollo_service
+from app.background_services.apollo_service import ApolloService, LeadSaveError, _prefetch_items
 from app.core.api_integration_rate_limiter import ApiIntegrationRateLimiter
+from app.core.config import settings
 from app.models.lead import Lead
 
 class TestApolloService:
@@ -28,6 +30,9 @@ class TestApolloService:
         })
         self.api_token_patcher.start()
         
+        # Don't reuse ApifyClient instances cached by earlier tests
+        apollo_service._apify_clients.clear()
+        
     def teardown_method(self):
         """Cleanup after each test method."""
         self.api_token_patcher.stop()
@@ -52,25 +57,18 @@ class TestApolloService:
             assert service.rate_limiter is rate_limiter
             assert service.api_token == 'test-api-token'
         
-    def test_missing_api_token_raises_error(self):
-        """Test that missing API token raises ValueError."""
-        # Stop the current patcher
-        self.api_token_patcher.stop()
-        
-        # Mock load_dotenv to do nothing and os.getenv to return None for APIFY_API_TOKEN
-        with patch('app.background_services.apollo_service.load_dotenv'):
-            with patch('app.background_services.apollo_service.os.getenv') as mock_getenv:
-                mock_getenv.return_value = None  # Simulate missing API token
-                
-                with pytest.raises(ValueError, match="APIFY_API_TOKEN environment variable is not set"):
-                    ApolloService()
-        
-        # Restart the patcher for subsequent tests
-        self.api_token_patcher.start()
+    def test_api_token_read_from_settings(self):
+        """Test that the API token comes from application settings."""
+        with patch('app.background_services.apollo_service.ApifyClient') as mock_apify_client, \
+             patch.object(settings, 'APIFY_API_TOKEN', 'settings-api-token'):
+            service = ApolloService()
+            
+            assert service.api_token == 'settings-api-token'
+            mock_apify_client.assert_called_once_with(token='settings-api-token')
 
     def test_mock_client_usage(self):
         """Test that mock client is used when environment variable is set."""
-        with patch.dict('os.environ', {'USE_APIFY_CLIENT_MOCK': 'true'}):
+        with patch.object(settings, 'USE_APIFY_CLIENT_MOCK', True):
             with patch('app.background_services.apollo_service.MockApifyClient') as mock_apify:
                 service = ApolloService()
                 mock_apify.assert_called_once_with('test-api-token')
@@ -100,6 +98,7 @@ class TestApolloService:
         
         mock_dataset = Mock()
         mock_client.dataset.return_value = mock_dataset
+        mock_dataset.get.return_value = {'itemCount': 2}
         mock_dataset.iterate_items.return_value = [
             {
                 'first_name': 'John',
@@ -127,8 +126,8 @@ class TestApolloService:
         result = service.fetch_leads(params, 'test-campaign-id', mock_db)
         
         # Verify
-        assert result['count'] == 2
-        assert result['errors'] == []
+        assert result.count == 2
+        assert result.errors == ()
         mock_actor.call.assert_called_once_with(run_input=params)
         mock_dataset.iterate_items.assert_called_once()
         
@@ -145,6 +144,7 @@ class TestApolloService:
         
         mock_dataset = Mock()
         mock_client.dataset.return_value = mock_dataset
+        mock_dataset.get.return_value = {'itemCount': 1}
         mock_dataset.iterate_items.return_value = [
             {'first_name': 'John', 'email': 'john@example.com'}
         ]
@@ -166,8 +166,8 @@ class TestApolloService:
         result = service.fetch_leads(params, 'test-campaign-id', mock_db)
         
         # Verify
-        assert result['count'] == 1
-        assert 'errors' in result
+        assert result.count == 1
+        assert isinstance(result.errors, tuple)
         mock_actor.call.assert_called_once()
 
     def test_fetch_leads_rate_limit_exceeded(self):
@@ -187,11 +187,11 @@ class TestApolloService:
             result = service.fetch_leads(params, 'test-campaign-id')
             
             # Verify rate limit response
-            assert result['count'] == 0
-            assert result['rate_limited'] is True
-            assert 'Rate limit exceeded' in result['errors'][0]
-            assert 'remaining_requests' in result
-            assert result['retry_after_seconds'] == 60
+            assert result.count == 0
+            assert result.rate_limited is True
+            assert 'Rate limit exceeded' in result.errors[0]
+            assert result.remaining_requests is not None
+            assert result.retry_after_seconds == 60
 
     @patch('app.background_services.apollo_service.ApifyClient')
     def test_fetch_leads_apify_error(self, mock_apify_client):
@@ -246,6 +246,7 @@ class TestApolloService:
             mock_actor.call.return_value = {'defaultDatasetId': 'test-dataset-id'}
             mock_dataset = Mock()
             mock_client.dataset.return_value = mock_dataset
+            mock_dataset.get.return_value = {'itemCount': 1}
             mock_dataset.iterate_items.return_value = [{'email': 'test@example.com'}]
             
             # Mock database
@@ -257,7 +258,7 @@ class TestApolloService:
             result = service.fetch_leads(params, 'test-campaign-id', mock_db)
             
             # Verify that API call still succeeded despite rate limiter failure
-            assert result['count'] == 1
+            assert result.count == 1
             mock_actor.call.assert_called_once()
 
     @patch('app.background_services.apollo_service.ApifyClient')
@@ -301,7 +302,12 @@ class TestApolloService:
         assert result['created'] == 2
         assert result['skipped'] == 0
         assert result['errors'] == 0
-        assert mock_db.add.call_count == 2
+        mock_db.execute.assert_called_once()
+        rows = mock_db.execute.call_args[0][1]
+        assert [row['company'] for row in rows] == ['Test Company', 'Another Company']
+        # raw_data keeps the flat profile fields but drops the nested organization
+        assert rows[0]['raw_data']['title'] == 'CEO'
+        assert 'organization' not in rows[0]['raw_data']
         mock_db.commit.assert_called_once()
 
     @patch('app.background_services.apollo_service.ApifyClient')
@@ -400,8 +406,9 @@ class TestApolloService:
         assert result['skipped'] == 4  # existing email + duplicate within batch + empty email + no email
         assert result['errors'] == 0
         
-        # Verify that only 2 leads were added to the session
-        assert mock_db.add.call_count == 2
+        # Verify that only 2 leads were inserted
+        rows = mock_db.execute.call_args[0][1]
+        assert [row['email'] for row in rows] == ['john@example.com', 'bob@example.com']
         mock_db.commit.assert_called_once()
         
         # Check the query was called correctly
@@ -434,7 +441,7 @@ class TestApolloService:
         assert result['skipped'] == 0
         assert result['errors'] == 0
         
-        assert mock_db.add.call_count == 1
+        assert len(mock_db.execute.call_args[0][1]) == 1
         mock_db.commit.assert_called_once()
 
     @patch('app.background_services.apollo_service.ApifyClient')
@@ -452,43 +459,159 @@ class TestApolloService:
         mock_query.filter.return_value = mock_query
         mock_query.all.return_value = []
         
-        # Mock Lead creation to fail for specific cases
-        with patch('app.background_services.apollo_service.Lead') as mock_lead_class:
-            def side_effect(*args, **kwargs):
-                if kwargs.get('email') == 'error@example.com':
-                    raise Exception("Database constraint violation")
-                return Mock()
-            
-            mock_lead_class.side_effect = side_effect
-            
-            leads_data = [
-                {
-                    'first_name': 'John',
-                    'email': 'john@example.com',
-                    'title': 'CEO'
-                },
-                {
-                    'first_name': 'Error',
-                    'email': 'error@example.com',  # This will trigger an error
-                    'title': 'Manager'
-                },
-                {
-                    'first_name': 'Jane',
-                    'email': 'jane@example.com',
-                    'title': 'Developer'
-                }
-            ]
-            
-            # Test
-            result = service._save_leads_to_db(leads_data, 'test-campaign-id', mock_db)
-            
-            # Verify results
-            assert result['created'] == 2  # john and jane
-            assert result['skipped'] == 0
-            assert result['errors'] == 1  # error lead
-            
-            assert mock_db.add.call_count == 2  # Only successful leads added
-            mock_db.commit.assert_called_once()
+        leads_data = [
+            {
+                'first_name': 'John',
+                'email': 'john@example.com',
+                'title': 'CEO'
+            },
+            {
+                'first_name': 'Error',
+                'email': 'error@example.com',
+                'organization': 'Malformed',  # Not a dict - this will trigger an error
+                'title': 'Manager'
+            },
+            {
+                'first_name': 'Jane',
+                'email': 'jane@example.com',
+                'title': 'Developer'
+            }
+        ]
+        
+        # Test
+        result = service._save_leads_to_db(leads_data, 'test-campaign-id', mock_db)
+        
+        # Verify results
+        assert result['created'] == 2  # john and jane
+        assert result['skipped'] == 0
+        assert result['errors'] == 1  # error lead
+        
+        assert len(mock_db.execute.call_args[0][1]) == 2  # Only successful leads inserted
+        mock_db.commit.assert_called_once()
+
+    @patch('app.background_services.apollo_service.ApifyClient')
+    def test_save_leads_stream_inserts_in_chunks(self, mock_apify_client):
+        """Test that _save_leads_stream inserts and commits one chunk at a time."""
+        service = ApolloService()
+        
+        mock_db = Mock()
+        mock_query = Mock()
+        mock_db.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.all.return_value = []
+        
+        items = ({'email': f'lead{i}@example.com'} for i in range(5))
+        
+        result = service._save_leads_stream(items, 'test-campaign-id', mock_db, chunk_size=2)
+        
+        assert result == {'created': 5, 'skipped': 0, 'errors': 0, 'processed': 5}
+        assert [len(call[0][1]) for call in mock_db.execute.call_args_list] == [2, 2, 1]
+        assert mock_db.commit.call_count == 3
+
+    @patch('app.background_services.apollo_service.ApifyClient')
+    def test_save_leads_stream_error_keeps_committed_totals(self, mock_apify_client):
+        """Test that a failure mid-stream reports the chunks already committed."""
+        service = ApolloService()
+        
+        mock_db = Mock()
+        mock_query = Mock()
+        mock_db.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.all.return_value = []
+        
+        def items():
+            for i in range(3):
+                yield {'email': f'lead{i}@example.com'}
+            raise Exception("Dataset download failed")
+        
+        with pytest.raises(LeadSaveError, match="Dataset download failed") as exc_info:
+            service._save_leads_stream(items(), 'test-campaign-id', mock_db, chunk_size=2)
+        
+        assert exc_info.value.stats == {'created': 2, 'skipped': 0, 'errors': 0, 'processed': 2}
+        assert mock_db.commit.call_count == 1
+
+    @patch('app.background_services.apollo_service.ApifyClient')
+    def test_save_leads_to_db_uses_copy_for_large_batches(self, mock_apify_client):
+        """Test that batches of LEAD_COPY_MIN_ROWS or more are loaded with COPY."""
+        from app.background_services.apollo_service import LEAD_COPY_MIN_ROWS
+        
+        service = ApolloService()
+        
+        mock_db = Mock()
+        mock_query = Mock()
+        mock_db.query.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.all.return_value = []
+        mock_cursor = mock_db.connection.return_value.connection.cursor.return_value
+        
+        leads_data = [{'email': f'lead{i}@example.com', 'first_name': 'Lead'} for i in range(LEAD_COPY_MIN_ROWS)]
+        
+        result = service._save_leads_to_db(leads_data, 'test-campaign-id', mock_db)
+        
+        assert result['created'] == LEAD_COPY_MIN_ROWS
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_called_once()
+        sql, buffer = mock_cursor.copy_expert.call_args[0]
+        assert sql.startswith('COPY leads (id, campaign_id,')
+        first_row = buffer.getvalue().splitlines()[0].split(',')
+        assert first_row[1:5] == ['test-campaign-id', 'Lead', '\\N', 'lead0@example.com']
+        mock_cursor.close.assert_called_once()
+
+    @patch('app.background_services.apollo_service.ApifyClient')
+    def test_iterate_dataset_items_fetches_pages_in_parallel(self, mock_apify_client):
+        """Test that large datasets are downloaded as offset/limit pages, in order."""
+        from app.background_services.apollo_service import DATASET_PAGE_SIZE
+        
+        mock_client = Mock()
+        mock_apify_client.return_value = mock_client
+        mock_dataset = Mock()
+        mock_client.dataset.return_value = mock_dataset
+        mock_dataset.get.return_value = {'itemCount': DATASET_PAGE_SIZE * 3}
+        mock_dataset.list_items.side_effect = lambda offset, limit: Mock(items=[{'offset': offset}])
+        
+        service = ApolloService()
+        items = list(service._iterate_dataset_items('test-dataset-id', DATASET_PAGE_SIZE * 3))
+        
+        assert items == [{'offset': 0}, {'offset': DATASET_PAGE_SIZE}, {'offset': DATASET_PAGE_SIZE * 2}]
+        assert mock_dataset.list_items.call_count == 3
+        mock_dataset.iterate_items.assert_not_called()
+
+    @patch('app.background_services.apollo_service.ApifyClient')
+    def test_iterate_dataset_items_sizes_pages_from_item_count(self, mock_apify_client):
+        """Test that items beyond the requested total are downloaded, and totalRecords is the fallback."""
+        from app.background_services.apollo_service import DATASET_PAGE_SIZE
+        
+        mock_client = Mock()
+        mock_apify_client.return_value = mock_client
+        mock_dataset = Mock()
+        mock_client.dataset.return_value = mock_dataset
+        mock_dataset.list_items.side_effect = lambda offset, limit: Mock(items=[{'offset': offset}])
+        
+        service = ApolloService()
+        
+        # The actor returned more items than requested
+        mock_dataset.get.return_value = {'itemCount': DATASET_PAGE_SIZE * 3}
+        items = list(service._iterate_dataset_items('test-dataset-id', DATASET_PAGE_SIZE * 2))
+        assert len(items) == 3
+        
+        # No itemCount reported: fall back to the requested total
+        mock_dataset.list_items.reset_mock()
+        mock_dataset.get.return_value = {}
+        items = list(service._iterate_dataset_items('test-dataset-id', DATASET_PAGE_SIZE * 2))
+        assert len(items) == 2
+
+    def test_prefetch_items_preserves_order(self):
+        """Test that prefetched items arrive in source order."""
+        assert list(_prefetch_items(range(25), buffer_size=4)) == list(range(25))
+
+    def test_prefetch_items_reraises_producer_error(self):
+        """Test that a download error surfaces in the consuming thread."""
+        def failing_items():
+            yield {'email': 'lead@example.com'}
+            raise Exception("Dataset download failed")
+        
+        with pytest.raises(Exception, match="Dataset download failed"):
+            list(_prefetch_items(failing_items()))
 
     @patch('app.background_services.apollo_service.ApifyClient')
     def test_fetch_leads_with_duplicate_prevention_reporting(self, mock_apify_client):
@@ -503,6 +626,7 @@ class TestApolloService:
         
         mock_dataset = Mock()
         mock_client.dataset.return_value = mock_dataset
+        mock_dataset.get.return_value = {'itemCount': 3}
         mock_dataset.iterate_items.return_value = [
             {'first_name': 'John', 'email': 'john@example.com'},
             {'first_name': 'Jane', 'email': 'existing@example.com'},  # Will be duplicate
@@ -524,11 +648,11 @@ class TestApolloService:
         result = service.fetch_leads(params, 'test-campaign-id', mock_db)
         
         # Verify detailed statistics in response
-        assert result['count'] == 2  # john and bob created
-        assert result['created'] == 2
-        assert result['skipped'] == 1  # existing email skipped
-        assert result['total_processed'] == 3
-        assert 'Skipped 1 duplicate/invalid emails' in result['errors']
+        assert result.count == 2  # john and bob created
+        assert result.created == 2
+        assert result.skipped == 1  # existing email skipped
+        assert result.total_processed == 3
+        assert 'Skipped 1 duplicate/invalid emails' in result.errors
         
         mock_actor.call.assert_called_once_with(run_input=params)
         mock_dataset.iterate_items.assert_called_once()
@@ -546,6 +670,7 @@ class TestApolloService:
         
         mock_dataset = Mock()
         mock_client.dataset.return_value = mock_dataset
+        mock_dataset.get.return_value = {'itemCount': 2}
         
         # First batch of leads
         mock_dataset.iterate_items.return_value = [
@@ -570,12 +695,13 @@ class TestApolloService:
         # First fetch - should create both leads
         result1 = service.fetch_leads(params, 'test-campaign-1', mock_db)
         
-        assert result1['created'] == 2
-        assert result1['skipped'] == 0
-        assert result1['total_processed'] == 2
-        assert len(result1['errors']) == 0
+        assert result1.created == 2
+        assert result1.skipped == 0
+        assert result1.total_processed == 2
+        assert len(result1.errors) == 0
         
         # Now simulate second batch with some duplicates
+        mock_dataset.get.return_value = {'itemCount': 3}
         mock_dataset.iterate_items.return_value = [
             {'first_name': 'John', 'email': 'john@example.com', 'title': 'CEO'},  # Duplicate
             {'first_name': 'Bob', 'email': 'bob@example.com', 'title': 'Developer'},  # New
@@ -588,14 +714,14 @@ class TestApolloService:
         # Second fetch - should only create Bob, skip duplicates
         result2 = service.fetch_leads(params, 'test-campaign-2', mock_db)
         
-        assert result2['created'] == 1  # Only Bob created
-        assert result2['skipped'] == 2  # John and Jane skipped
-        assert result2['total_processed'] == 3
-        assert 'Skipped 2 duplicate/invalid emails' in result2['errors']
+        assert result2.created == 1  # Only Bob created
+        assert result2.skipped == 2  # John and Jane skipped
+        assert result2.total_processed == 3
+        assert 'Skipped 2 duplicate/invalid emails' in result2.errors
         
         # Verify total database interactions
-        # First batch: 2 adds, Second batch: 1 add = 3 total
-        assert mock_db.add.call_count == 3
+        # One bulk insert per batch: 2 rows, then 1 row
+        assert [len(call[0][1]) for call in mock_db.execute.call_args_list] == [2, 1]
         assert mock_db.commit.call_count == 2
 
 # Integration tests that could be run with actual services (when available)
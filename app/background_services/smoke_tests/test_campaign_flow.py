@@ -8,8 +8,8 @@ if project_root not in sys.path:
 # Enable the Apollo mock but leave Perplexity live
 os.environ["USE_APIFY_CLIENT_MOCK"] = "true"  # keep Apollo mocked
 
-import requests
 import time
+from datetime import datetime
 import random
 import string
 from sqlalchemy.orm import Session
@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from app.models.user import User
 from app.core.database import SessionLocal, get_db
 from app.core.config import settings
+from app.background_services.smoke_tests.utils.http_utils import SESSION
 
 API_BASE = f"http://localhost:8000{settings.API_V1_STR}"
 
@@ -53,12 +54,12 @@ def signup_and_login():
         "confirm_password": password
     }
     print(f"[Auth] Signing up test user: {email}")
-    resp = requests.post(f"{API_BASE}/auth/signup", json=signup_data)
+    resp = SESSION.post(f"{API_BASE}/auth/signup", json=signup_data)
     if resp.status_code not in (200, 201):
         print(f"[Auth] Signup failed: {resp.status_code} {resp.text}")
         raise Exception("Signup failed")
     print(f"[Auth] Signing in test user: {email}")
-    resp = requests.post(f"{API_BASE}/auth/login", json={"email": email, "password": password})
+    resp = SESSION.post(f"{API_BASE}/auth/login", json={"email": email, "password": password})
     if resp.status_code != 200:
         print(f"[Auth] Login failed: {resp.status_code} {resp.text}")
         raise Exception("Login failed")
@@ -75,7 +76,7 @@ def create_organization(token):
         "name": "Test Org",
         "description": "A test organization."
     }
-    resp = requests.post(f"{API_BASE}/organizations", json=org_data, headers=headers)
+    resp = SESSION.post(f"{API_BASE}/organizations", json=org_data, headers=headers)
     if resp.status_code != 201:
         print(f"[Org] Creation failed: {resp.status_code} {resp.text}")
         raise Exception("Organization creation failed")
@@ -99,7 +100,7 @@ def create_campaign(token, organization_id=None):
         campaign_data["organization_id"] = organization_id
     headers = {"Authorization": f"Bearer {token}"}
     print("[Campaign] Creating campaign...")
-    resp = requests.post(f"{API_BASE}/campaigns", json=campaign_data, headers=headers)
+    resp = SESSION.post(f"{API_BASE}/campaigns", json=campaign_data, headers=headers)
     if resp.status_code != 201:
         print(f"[Campaign] Creation failed: {resp.status_code} {resp.text}")
         raise Exception("Campaign creation failed")
@@ -113,7 +114,7 @@ def create_campaign(token, organization_id=None):
 def start_campaign(token, campaign_id):
     headers = {"Authorization": f"Bearer {token}"}
     print(f"[Campaign] Starting campaign {campaign_id}...")
-    resp = requests.post(f"{API_BASE}/campaigns/{campaign_id}/start", json={}, headers=headers)
+    resp = SESSION.post(f"{API_BASE}/campaigns/{campaign_id}/start", json={}, headers=headers)
     if resp.status_code != 200:
         print(f"[Campaign] Start failed: {resp.status_code} {resp.text}")
         raise Exception("Campaign start failed")
@@ -129,7 +130,7 @@ def validate_enrichment(leads, token):
     validated_count = 0
     for i, lead in enumerate(leads, 1):
         print(f"[Validation] Validating lead {i}/{len(leads)}: {lead['email']}")
-        resp = requests.get(f"{API_BASE}/leads/{lead['id']}", headers=headers)
+        resp = SESSION.get(f"{API_BASE}/leads/{lead['id']}", headers=headers)
         if resp.status_code != 200:
             raise Exception(f"Lead fetch failed for {lead['id']}: {resp.status_code} {resp.text}")
         
@@ -148,7 +149,7 @@ def validate_enrichment(leads, token):
 def fetch_campaign_jobs(token, campaign_id):
     """Return list of jobs for the given campaign via API."""
     headers = {"Authorization": f"Bearer {token}"}
-    resp = requests.get(f"{API_BASE}/jobs", headers=headers, params={"campaign_id": campaign_id})
+    resp = SESSION.get(f"{API_BASE}/jobs", headers=headers, params={"campaign_id": campaign_id})
     if resp.status_code != 200:
         raise Exception(f"Failed to fetch jobs: {resp.status_code} {resp.text}")
     
@@ -170,15 +171,16 @@ def wait_for_jobs(token, campaign_id, job_type, expected_count=None, timeout=300
     last_status_log = 0
     status_log_interval = 10  # Log status every 10 seconds
     
+    # Only count jobs created after start_time if provided (ISO strings compare chronologically)
+    # BUT don't filter ENRICH_LEAD jobs since they're always created as part of current campaign
+    created_after = start_time if job_type != "ENRICH_LEAD" else None
+    
     while waited < timeout:
         jobs = fetch_campaign_jobs(token, campaign_id)
-        target = [j for j in jobs if j["job_type"] == job_type]
-        
-        # Filter jobs to only include those created after start_time if provided
-        # BUT don't filter ENRICH_LEAD jobs since they're always created as part of current campaign
-        if start_time and job_type != "ENRICH_LEAD":
-            from datetime import datetime
-            target = [j for j in target if j.get("created_at") and j["created_at"] > start_time]
+        if created_after:
+            target = [j for j in jobs if j["job_type"] == job_type and (j.get("created_at") or "") > created_after]
+        else:
+            target = [j for j in jobs if j["job_type"] == job_type]
         
         # Log current status periodically
         if waited - last_status_log >= status_log_interval:
@@ -231,7 +233,7 @@ def wait_for_jobs(token, campaign_id, job_type, expected_count=None, timeout=300
 def get_all_leads(token, campaign_id):
     print(f"[API] Fetching all leads for campaign {campaign_id}...")
     headers = {"Authorization": f"Bearer {token}"}
-    resp = requests.get(f"{API_BASE}/leads", headers=headers, params={"campaign_id": campaign_id})
+    resp = SESSION.get(f"{API_BASE}/leads", headers=headers, params={"campaign_id": campaign_id})
     if resp.status_code != 200:
         raise Exception(f"Leads fetch failed: {resp.status_code} {resp.text}")
     
@@ -299,7 +301,6 @@ def main():
         
         print(f"\n🎯 PHASE 2: Campaign Execution")
         print("-" * 30)
-        from datetime import datetime
         campaign_start_time = datetime.utcnow().isoformat()
         start_campaign(token, campaign_id)
 
@@ -1,10 +1,8 @@
 import os
 import sys
 
-# Get project root and change working directory to it so pydantic-settings can find .env
+# Get project root; settings resolve .env from it, so the working directory is left alone
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
-os.chdir(project_root)
-print(f"[Setup] Changed working directory to: {project_root}")
 
 # Ensure project root is in sys.path for app imports
 if project_root not in sys.path:
@@ -128,9 +126,9 @@ def main():
             print("⚠️  Could not retrieve circuit breaker status")
             print("💡 Continuing test - will monitor circuit breaker during execution")
         
-        print("\n📋 PHASE 3: Sequential Campaign Creation with Pop-Based Data")
+        print("\n📋 PHASE 3: Concurrent Campaign Creation with Pop-Based Data")
         print("-" * 50)
-        print(f"[Setup] Creating {NUM_CAMPAIGNS} campaigns sequentially...")
+        print(f"[Setup] Creating {NUM_CAMPAIGNS} campaigns concurrently...")
         campaigns_data = create_campaigns_sequentially(
             token, 
             organization_id, 
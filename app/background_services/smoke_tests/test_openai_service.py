@@ -10,8 +10,8 @@ This test suite validates the OpenAIService functionality including:
 
 import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from app.background_services.openai_service import OpenAIService
+from unittest.mock import ANY, Mock, patch, MagicMock
+from app.background_services.openai_service import EMAIL_COPY_PROMPT_TEMPLATE, OpenAIService
 from app.core.api_integration_rate_limiter import ApiIntegrationRateLimiter
 from app.models import Lead
 from app.core.config import settings
@@ -35,7 +35,7 @@ class TestOpenAIService:
             service = OpenAIService()
             
             assert service.rate_limiter is None
-            mock_openai.assert_called_once_with(api_key='test-api-key')
+            mock_openai.assert_called_once_with(api_key='test-api-key', http_client=ANY)
         
     def test_rate_limiter_initialization(self):
         """Test that OpenAIService can be initialized with rate limiter."""
@@ -51,7 +51,7 @@ class TestOpenAIService:
             service = OpenAIService(rate_limiter=rate_limiter)
             
             assert service.rate_limiter is rate_limiter
-            mock_openai.assert_called_once_with(api_key='test-api-key')
+            mock_openai.assert_called_once_with(api_key='test-api-key', http_client=ANY)
         
     def test_missing_api_key_raises_error(self):
         """Test that missing API key raises ValueError."""
@@ -362,6 +362,26 @@ class TestOpenAIService:
             assert 'id' in result
             mock_client.chat.completions.create.assert_called_once()
 
+    def test_generate_email_copy_prompt_with_braces_in_enrichment(self):
+        """Test that the cached company prompt keeps enrichment text verbatim."""
+        with patch('app.background_services.openai_service.OpenAI') as mock_openai_class:
+            mock_client = Mock()
+            mock_openai_class.return_value = mock_client
+            mock_client.chat.completions.create.return_value.model_dump.return_value = {'id': 'chatcmpl-123'}
+            
+            service = OpenAIService()
+            enrichment_content = 'Uses {templates} and {{braces}}'
+            enrichment_data = {'choices': [{'message': {'content': enrichment_content}}]}
+            service.generate_email_copy(self.create_mock_lead(first_name='Ann'), enrichment_data)
+            service.generate_email_copy(self.create_mock_lead(first_name='Ben'), enrichment_data)
+            
+            prompts = [call.kwargs['messages'][1]['content'] for call in mock_client.chat.completions.create.call_args_list]
+            assert prompts[1] == EMAIL_COPY_PROMPT_TEMPLATE.format(
+                full_name='Ben Doe', company_name='Test Company',
+                enrichment_content=enrichment_content, title='CEO'
+            )
+            assert prompts[0] != prompts[1]
+
 # Integration tests that could be run with actual services (when available)
 class TestOpenAIServiceIntegration:
     """Integration tests for OpenAIService (require external services)."""
@@ -17,11 +17,15 @@ from .campaign_utils import (
     create_campaign,
     start_campaign,
     create_campaigns_sequentially,
-    get_all_leads
+    get_all_leads,
+    get_leads_by_ids,
+    get_campaigns_by_ids
 )
 
 from .job_utils import (
     fetch_campaign_jobs,
+    fetch_jobs_bulk,
+    fetch_job_stats,
     wait_for_jobs,
     monitor_all_campaigns_jobs,
     monitor_all_campaigns_jobs_with_cb_awareness,
@@ -66,9 +70,13 @@ __all__ = [
     'start_campaign',
     'create_campaigns_sequentially',
     'get_all_leads',
+    'get_leads_by_ids',
+    'get_campaigns_by_ids',
     
     # Job utilities
     'fetch_campaign_jobs',
+    'fetch_jobs_bulk',
+    'fetch_job_stats',
     'wait_for_jobs',
     'monitor_all_campaigns_jobs',
     'monitor_all_campaigns_jobs_with_cb_awareness',
@@ -91,7 +99,6 @@ __all__ = [
     'check_campaign_status_summary',
     'report_campaign_status_summary',
     'analyze_process_results',
-    'analyze_results',
     
     # Database utilities
     'cleanup_test_data'
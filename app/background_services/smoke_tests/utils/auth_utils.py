@@ -2,29 +2,32 @@
 Authentication and user management utilities for smoke tests.
 """
 
-import requests
-import random
+import secrets
 import string
 from app.core.config import settings
+from .http_utils import SESSION, response_json
+
+# CSPRNG-backed generator for shuffling, so credentials never come from the seeded global random
+_system_random = secrets.SystemRandom()
 
 def random_email():
     """Generate a random email for test user."""
-    return f"testuser_{''.join(random.choices(string.ascii_lowercase + string.digits, k=8))}@hellacooltestingdomain.pizza"
+    return f"testuser_{secrets.token_hex(5)}@hellacooltestingdomain.pizza"
 
 def random_password():
     """Generate a random password that meets requirements."""
     specials = "!@#$%^&*()"
     # Ensure at least one of each required type
     password = [
-        random.choice(string.ascii_lowercase),
-        random.choice(string.ascii_uppercase),
-        random.choice(string.digits),
-        random.choice(specials),
+        secrets.choice(string.ascii_lowercase),
+        secrets.choice(string.ascii_uppercase),
+        secrets.choice(string.digits),
+        secrets.choice(specials),
     ]
     # Fill the rest with random choices
     chars = string.ascii_letters + string.digits + specials
-    password += random.choices(chars, k=8)
-    random.shuffle(password)
+    password += [secrets.choice(chars) for _ in range(8)]
+    _system_random.shuffle(password)
     return ''.join(password)
 
 def signup_and_login(api_base=None):
@@ -48,18 +51,18 @@ def signup_and_login(api_base=None):
         "confirm_password": password
     }
     print(f"[Auth] Signing up test user: {email}")
-    resp = requests.post(f"{api_base}/auth/signup", json=signup_data)
+    resp = SESSION.post(f"{api_base}/auth/signup", json=signup_data)
     if resp.status_code not in (200, 201):
         print(f"[Auth] Signup failed: {resp.status_code} {resp.text}")
         raise Exception("Signup failed")
     print(f"[Auth] Signing in test user: {email}")
-    resp = requests.post(f"{api_base}/auth/login", json={"email": email, "password": password})
+    resp = SESSION.post(f"{api_base}/auth/login", json={"email": email, "password": password})
     if resp.status_code != 200:
         print(f"[Auth] Login failed: {resp.status_code} {resp.text}")
         raise Exception("Login failed")
     
     # Fix: Access token directly from response (no "data" wrapper)
-    response_data = resp.json()
+    response_data = response_json(resp)
     token = response_data["token"]["access_token"]
     print(f"[Auth] Got token: {token[:8]}...")
     return token, email
@@ -83,13 +86,12 @@ def create_organization(token, api_base=None):
         "name": "Test Org",
         "description": "A test organization for concurrent campaigns."
     }
-    resp = requests.post(f"{api_base}/organizations", json=org_data, headers=headers)
+    resp = SESSION.post(f"{api_base}/organizations", json=org_data, headers=headers)
     if resp.status_code != 201:
         print(f"[Org] Creation failed: {resp.status_code} {resp.text}")
         raise Exception("Organization creation failed")
     
-    # Fix: Check if response has "data" wrapper or direct access
-    response_data = resp.json()
-    org_id = response_data.get("data", {}).get("id") or response_data.get("id")
+    # Organization endpoints return the organization itself, without a "data" wrapper
+    org_id = response_json(resp)["id"]
     print(f"[Org] Created organization with id: {org_id}")
     return org_id 
\ No newline at end of file
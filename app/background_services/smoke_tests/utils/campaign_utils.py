@@ -2,8 +2,9 @@
 Campaign management utilities for smoke tests.
 """
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from app.core.config import settings
+from .http_utils import SESSION, response_json
 
 
 def create_campaign(token, campaign_index, organization_id=None, leads_per_campaign=20, api_base=None):
@@ -36,14 +37,13 @@ def create_campaign(token, campaign_index, organization_id=None, leads_per_campa
         campaign_data["organization_id"] = organization_id
     headers = {"Authorization": f"Bearer {token}"}
     print(f"[Campaign #{campaign_index}] Creating campaign...")
-    resp = requests.post(f"{api_base}/campaigns", json=campaign_data, headers=headers)
+    resp = SESSION.post(f"{api_base}/campaigns", json=campaign_data, headers=headers)
     if resp.status_code != 201:
         print(f"[Campaign #{campaign_index}] Creation failed: {resp.status_code} {resp.text}")
         raise Exception(f"Campaign #{campaign_index} creation failed")
 
-    # Fix: Check if response has "data" wrapper or direct access
-    response_data = resp.json()
-    campaign_id = response_data.get("data", {}).get("id") or response_data.get("id")
+    # Campaign endpoints wrap their payload in {"status", "data"}
+    campaign_id = response_json(resp)["data"]["id"]
     
     # No longer need to register campaign mapping - pop-based approach is automatic
     
@@ -66,7 +66,7 @@ def start_campaign(token, campaign_id, campaign_index, api_base=None):
         
     headers = {"Authorization": f"Bearer {token}"}
     print(f"[Campaign #{campaign_index}] Starting campaign {campaign_id}...")
-    resp = requests.post(f"{api_base}/campaigns/{campaign_id}/start", json={}, headers=headers)
+    resp = SESSION.post(f"{api_base}/campaigns/{campaign_id}/start", json={}, headers=headers)
     if resp.status_code != 200:
         print(f"[Campaign #{campaign_index}] Start failed: {resp.status_code} {resp.text}")
         raise Exception(f"Campaign #{campaign_index} start failed")
@@ -91,34 +91,84 @@ def get_all_leads(token, campaign_id, campaign_index, api_base=None):
         
     print(f"[API #{campaign_index}] Fetching all leads for campaign {campaign_id}...")
     headers = {"Authorization": f"Bearer {token}"}
-    resp = requests.get(f"{api_base}/leads", headers=headers, params={"campaign_id": campaign_id})
+    resp = SESSION.get(f"{api_base}/leads", headers=headers, params={"campaign_id": campaign_id})
     if resp.status_code != 200:
         raise Exception(f"Leads fetch failed for campaign #{campaign_index}: {resp.status_code} {resp.text}")
     
-    # Fix: Check if response has "data" wrapper or direct access
-    response_data = resp.json()
-    leads_data = response_data.get("data", {}).get("leads") or response_data.get("leads", [])
+    leads_data = response_json(resp)["data"]["leads"]
     print(f"[API #{campaign_index}] Successfully retrieved {len(leads_data)} leads")
     return leads_data
 
 
-def create_campaigns_sequentially(token, organization_id, num_campaigns, leads_per_campaign, wait_for_jobs_func, validate_no_duplicate_emails_func, api_base=None):
-    """Create and start campaigns one by one, focusing on process validation rather than content prediction."""
+def get_leads_by_ids(token, lead_ids, api_base=None):
+    """
+    Fetch several leads by ID, up to 100 per request.
+    
+    Args:
+        token: Authentication token
+        lead_ids: Lead IDs to fetch
+        api_base: API base URL, defaults to settings-based URL
+        
+    Returns:
+        dict: Lead objects keyed by ID; IDs that were not found are absent
+    """
     if api_base is None:
         api_base = f"http://localhost:8000{settings.API_V1_STR}"
         
-    campaigns_data = {}
-    
-    print(f"[Setup] Creating {num_campaigns} campaigns sequentially...")
+    headers = {"Authorization": f"Bearer {token}"}
+    leads_by_id = {}
+    for start in range(0, len(lead_ids), 100):
+        resp = SESSION.get(f"{api_base}/leads/batch", headers=headers, params={"ids": lead_ids[start:start + 100]})
+        if resp.status_code != 200:
+            raise Exception(f"Leads batch fetch failed: {resp.status_code} {resp.text}")
+        for lead in response_json(resp)["data"]["leads"]:
+            leads_by_id[lead["id"]] = lead
+    return leads_by_id
+
+
+def get_campaigns_by_ids(token, campaign_ids, api_base=None):
+    """
+    Fetch several campaigns by ID, up to 100 per request.
     
-    for campaign_index in range(1, num_campaigns + 1):
-        print(f"\n[Setup] === Setting up Campaign #{campaign_index} ===")
+    Args:
+        token: Authentication token
+        campaign_ids: Campaign IDs to fetch
+        api_base: API base URL, defaults to settings-based URL
         
+    Returns:
+        dict: Campaign objects keyed by ID; IDs that were not found are absent
+    """
+    if api_base is None:
+        api_base = f"http://localhost:8000{settings.API_V1_STR}"
+        
+    headers = {"Authorization": f"Bearer {token}"}
+    campaigns_by_id = {}
+    for start in range(0, len(campaign_ids), 100):
+        resp = SESSION.get(f"{api_base}/campaigns/batch", headers=headers, params={"ids": campaign_ids[start:start + 100]})
+        if resp.status_code != 200:
+            raise Exception(f"Campaigns batch fetch failed: {resp.status_code} {resp.text}")
+        for campaign in response_json(resp)["data"]["campaigns"]:
+            campaigns_by_id[campaign["id"]] = campaign
+    return campaigns_by_id
+
+
+def create_campaigns_sequentially(token, organization_id, num_campaigns, leads_per_campaign, wait_for_jobs_func, validate_no_duplicate_emails_func, api_base=None):
+    """
+    Create and start all campaigns, then wait for their leads, focusing on process validation rather than content prediction.
+    
+    Campaigns are started together and their FETCH_LEADS jobs awaited in parallel,
+    so setup takes about as long as the slowest campaign rather than the sum of all.
+    """
+    if api_base is None:
+        api_base = f"http://localhost:8000{settings.API_V1_STR}"
+    
+    def kick_off(campaign_index):
         # Create and start campaign (no email prediction needed with pop-based approach)
         campaign_id = create_campaign(token, campaign_index, organization_id, leads_per_campaign, api_base)
         start_campaign(token, campaign_id, campaign_index, api_base)
-        
-        # Wait for FETCH_LEADS to complete before moving to next campaign
+        return campaign_id
+    
+    def collect(campaign_index, campaign_id):
         print(f"[Setup] Waiting for Campaign #{campaign_index} FETCH_LEADS to complete...")
         wait_for_jobs_func(token, campaign_id, "FETCH_LEADS", campaign_index, expected_count=1, timeout=180, api_base=api_base)
         
@@ -137,17 +187,27 @@ def create_campaigns_sequentially(token, organization_id, num_campaigns, leads_p
         
         print(f"[Setup] ✅ Campaign #{campaign_index} ready with {len(leads)} leads ({len(actual_emails)} valid emails)")
         
-        # Store campaign tracking data for process validation
-        campaigns_data[campaign_id] = {
+        # Campaign tracking data for process validation
+        return {
             'campaign_index': campaign_index,
             'leads_count': len(leads),
             'leads': leads,
             'actual_emails': actual_emails
         }
     
+    print(f"[Setup] Creating {num_campaigns} campaigns concurrently...")
+    
+    campaign_indices = range(1, num_campaigns + 1)
+    with ThreadPoolExecutor(max_workers=num_campaigns) as executor:
+        campaign_ids = list(executor.map(kick_off, campaign_indices))
+        results = list(executor.map(collect, campaign_indices, campaign_ids))
+    
+    # executor.map keeps submission order, so campaigns stay keyed in index order
+    campaigns_data = dict(zip(campaign_ids, results))
+    
     print(f"\n[Setup] ✅ All {num_campaigns} campaigns created successfully!")
     
     # CROSS-CAMPAIGN VALIDATION: Ensure no duplicate emails across campaigns
     validate_no_duplicate_emails_func(campaigns_data)
     
-    return campaigns_data 
\ No newline at end of file
+    return campaigns_data
@@ -2,8 +2,9 @@
 Circuit breaker monitoring utilities for smoke tests.
 """
 
-import requests
 from app.core.config import settings
+from .http_utils import SESSION, response_json
+from .campaign_utils import get_campaigns_by_ids
 
 
 def check_circuit_breaker_status(token, api_base=None):
@@ -13,9 +14,9 @@ def check_circuit_breaker_status(token, api_base=None):
         
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        resp = requests.get(f"{api_base}/queue-management/status", headers=headers)
+        resp = SESSION.get(f"{api_base}/queue-management/status", headers=headers)
         if resp.status_code == 200:
-            return resp.json()
+            return response_json(resp)
         else:
             print(f"[Circuit Breaker] Warning: Could not get status: {resp.status_code}")
             return None
@@ -29,22 +30,22 @@ def check_campaigns_paused_by_circuit_breaker(token, campaign_ids, api_base=None
     if api_base is None:
         api_base = f"http://localhost:8000{settings.API_V1_STR}"
         
-    headers = {"Authorization": f"Bearer {token}"}
     paused_campaigns = []
     
+    try:
+        campaigns_by_id = get_campaigns_by_ids(token, campaign_ids, api_base)
+    except Exception as e:
+        print(f"[Circuit Breaker] Warning: Could not check campaigns: {e}")
+        return paused_campaigns
+    
     for campaign_id in campaign_ids:
-        try:
-            resp = requests.get(f"{api_base}/campaigns/{campaign_id}", headers=headers)
-            if resp.status_code == 200:
-                campaign = resp.json().get("data", resp.json())
-                if campaign["status"] == "PAUSED":
-                    paused_campaigns.append({
-                        "id": campaign_id,
-                        "status_message": campaign.get("status_message", ""),
-                        "paused_reason": campaign.get("status_error", "")
-                    })
-        except Exception as e:
-            print(f"[Circuit Breaker] Warning: Could not check campaign {campaign_id}: {e}")
+        campaign = campaigns_by_id.get(campaign_id)
+        if campaign and campaign["status"] == "PAUSED":
+            paused_campaigns.append({
+                "id": campaign_id,
+                "status_message": campaign.get("status_message", ""),
+                "paused_reason": campaign.get("status_error", "")
+            })
     
     return paused_campaigns
 
@@ -0,0 +1,23 @@
+"""
+Shared HTTP session for smoke test API calls.
+"""
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session for every helper, so repeated calls (notably the polling
+# loops) reuse keep-alive connections instead of opening a new one per request.
+# Only idempotent requests are retried, on transient gateway errors.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+))
+
+
+def response_json(resp):
+    """Decode a response body with orjson, which parses faster than resp.json()."""
+    return orjson.loads(resp.content)
@@ -2,19 +2,35 @@
 Job monitoring and polling utilities for smoke tests.
 """
 
-import requests
+import os
 import time
+from collections import Counter
+import orjson
 from app.core.config import settings
+from .http_utils import SESSION, response_json
+
+# Follow job changes over the /jobs/stream server-sent events endpoint;
+# set USE_SSE=false to fall back to polling /jobs
+USE_SSE = os.getenv("USE_SSE", "true").lower() == "true"
+
+# Longest timeout /jobs/stream accepts; longer waits use the polling fallback
+STREAM_MAX_TIMEOUT = 600
+
+# Polling fallback: first delay after any job change, growing up to wait_for_jobs' interval
+POLL_MIN_INTERVAL = 1
+
+# Last (ETag, jobs) answer per /jobs/bulk query, for conditional requests
+_jobs_etag_cache = {}
+
+# Upper bound on a single job listing request, so a slow response can't stall a monitor tick
+FETCH_TIMEOUT_SECONDS = 30
 
 
 def _log_job_status(target_jobs, waited, campaign_index, job_type):
     """Log current status of jobs with breakdown by status."""
     print(f"[Polling #{campaign_index}] {waited}s elapsed - Found {len(target_jobs)} {job_type} job(s)")
     if target_jobs:
-        status_counts = {}
-        for job in target_jobs:
-            status = job["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts = Counter(job["status"] for job in target_jobs)
         status_summary = ", ".join(f"{status}: {count}" for status, count in status_counts.items())
         print(f"[Polling #{campaign_index}] Job status breakdown: {status_summary}")
 
@@ -22,12 +38,10 @@ def _log_job_status(target_jobs, waited, campaign_index, job_type):
 def _check_job_completion(target_jobs, expected_count, campaign_index, job_type, waited):
     """
     Check if jobs are completed and handle failures.
+    Any failed job fails the wait straight away, without waiting for the
+    remaining jobs to finish.
     Returns: ('continue', None) | ('success', jobs) | ('wait_more', None)
     """
-    if not target_jobs or not all(j["status"] in ("COMPLETED", "FAILED") for j in target_jobs):
-        return ('continue', None)
-    
-    # All jobs are either completed or failed
     failed = [j for j in target_jobs if j["status"] == "FAILED"]
     if failed:
         print(f"[Polling #{campaign_index}] ERROR: {len(failed)} {job_type} job(s) failed!")
@@ -37,6 +51,9 @@ def _check_job_completion(target_jobs, expected_count, campaign_index, job_type,
         msgs = "; ".join(f.get('error') or f.get('error_message', 'Unknown error') for f in failed)
         raise AssertionError(f"Campaign #{campaign_index} {job_type} job(s) failed: {msgs}")
     
+    if not target_jobs or not all(j["status"] == "COMPLETED" for j in target_jobs):
+        return ('continue', None)
+    
     # Check if we have the expected count or if no specific count was expected
     if expected_count is None or len(target_jobs) >= expected_count:
         print(f"[Polling #{campaign_index}] SUCCESS: {len(target_jobs)} {job_type} job(s) completed after {waited}s")
@@ -66,50 +83,99 @@ def _report_timeout_status(token, campaign_id, job_type, campaign_index, timeout
 
 
 def fetch_campaign_jobs(token, campaign_id, api_base=None):
-    """Return list of jobs for the given campaign via API, handling pagination."""
+    """Return list of jobs for the given campaign via API in a single, unpaginated request."""
+    jobs = fetch_jobs_bulk(token, [campaign_id], api_base=api_base)[campaign_id]
+    print(f"[API] Fetched {len(jobs)} total jobs for campaign {campaign_id}")
+    return jobs
+
+
+def fetch_jobs_bulk(token, campaign_ids, job_type=None, api_base=None):
+    """Return {campaign_id: jobs} for several campaigns in a single API request."""
     if api_base is None:
         api_base = f"http://localhost:8000{settings.API_V1_STR}"
+    if not campaign_ids:
+        return {}
         
     headers = {"Authorization": f"Bearer {token}"}
-    all_jobs = []
-    page = 1
-    per_page = 100  # Use larger page size to minimize API calls
-    
-    while True:
-        params = {
-            "campaign_id": campaign_id,
-            "page": page,
-            "per_page": per_page
-        }
-        resp = requests.get(f"{api_base}/jobs", headers=headers, params=params)
+    params = {"campaign_ids": list(campaign_ids)}
+    if job_type:
+        params["job_type"] = job_type
+    
+    # Revalidate the previous answer to the same query; unchanged jobs come back as an empty 304
+    cache_key = (api_base, tuple(campaign_ids), job_type)
+    cached = _jobs_etag_cache.get(cache_key)
+    if cached:
+        headers["If-None-Match"] = cached[0]
+    
+    resp = SESSION.get(f"{api_base}/jobs/bulk", headers=headers, params=params, timeout=FETCH_TIMEOUT_SECONDS)
+    if resp.status_code == 304 and cached:
+        return cached[1]
+    if resp.status_code != 200:
+        raise Exception(f"Failed to fetch jobs: {resp.status_code} {resp.text}")
+    
+    jobs_by_campaign = response_json(resp)["data"]
+    if "ETag" in resp.headers:
+        _jobs_etag_cache[cache_key] = (resp.headers["ETag"], jobs_by_campaign)
+    return jobs_by_campaign
+
+
+def fetch_job_stats(token, campaign_ids, job_type=None, api_base=None):
+    """Return {campaign_id: {status: count, ..., "total": count}} for several campaigns in a single API request."""
+    if api_base is None:
+        api_base = f"http://localhost:8000{settings.API_V1_STR}"
+    if not campaign_ids:
+        return {}
+        
+    headers = {"Authorization": f"Bearer {token}"}
+    params = {"campaign_ids": list(campaign_ids)}
+    if job_type:
+        params["job_type"] = job_type
+    resp = SESSION.get(f"{api_base}/jobs/stats", headers=headers, params=params, timeout=FETCH_TIMEOUT_SECONDS)
+    if resp.status_code != 200:
+        raise Exception(f"Failed to fetch job stats: {resp.status_code} {resp.text}")
+    return response_json(resp)["data"]
+
+
+def stream_campaign_jobs(token, campaign_id, timeout=300, api_base=None):
+    """Yield the campaign's full job list each time the server reports a change, until the stream closes."""
+    if api_base is None:
+        api_base = f"http://localhost:8000{settings.API_V1_STR}"
+        
+    headers = {"Authorization": f"Bearer {token}", "Accept": "text/event-stream"}
+    params = {"campaign_id": campaign_id, "timeout": timeout}
+    # The server sends a keep-alive at least every 15s, so a long read timeout only trips on a dead stream
+    with SESSION.get(f"{api_base}/jobs/stream", headers=headers, params=params, stream=True, timeout=(10, 60)) as resp:
         if resp.status_code != 200:
-            raise Exception(f"Failed to fetch jobs: {resp.status_code} {resp.text}")
+            raise Exception(f"Failed to stream jobs: {resp.status_code} {resp.text}")
         
-        # Fix: Check if response has "data" wrapper or direct access
-        response_data = resp.json()
-        jobs_data = response_data.get("data", {}).get("jobs") or response_data.get("jobs", [])
+        for line in resp.iter_lines():
+            # Skip keep-alive comments and event separators
+            if line.startswith(b"data: "):
+                yield orjson.loads(line[len(b"data: "):])["jobs"]
+
+
+def _wait_for_jobs_streaming(token, campaign_id, job_type, campaign_index, expected_count, timeout, api_base):
+    """Wait for jobs by consuming the job stream, returning as soon as the completion check holds."""
+    start = time.monotonic()
+    last_status_log = 0
+    status_log_interval = 15  # Log status every 15 seconds for concurrent tests
+    
+    for jobs in stream_campaign_jobs(token, campaign_id, timeout, api_base):
+        waited = int(time.monotonic() - start)
+        target = [j for j in jobs if j["job_type"] == job_type]
         
-        if not jobs_data:
-            break  # No more jobs
-            
-        all_jobs.extend(jobs_data)
+        # Log current status periodically
+        if waited - last_status_log >= status_log_interval:
+            _log_job_status(target, waited, campaign_index, job_type)
+            last_status_log = waited
         
-        # Check if we've fetched all pages
-        if "data" in response_data and isinstance(response_data["data"], dict):
-            data = response_data["data"]
-            if "pages" in data and page >= data["pages"]:
-                break  # We've fetched all pages
-            elif len(jobs_data) < per_page:
-                break  # Last page (partial)
-        else:
-            # Fallback: if we got less than per_page items, we're on the last page
-            if len(jobs_data) < per_page:
-                break
-                
-        page += 1
+        # Fail on the first failed job, succeed once enough jobs have completed
+        result, completed_jobs = _check_job_completion(target, expected_count, campaign_index, job_type, waited)
+        if result == 'success':
+            return completed_jobs
     
-    print(f"[API] Fetched {len(all_jobs)} total jobs for campaign {campaign_id} across {page} page(s)")
-    return all_jobs
+    # The server closes the stream once the timeout has passed
+    _report_timeout_status(token, campaign_id, job_type, campaign_index, timeout, api_base)
 
 
 def wait_for_jobs(token, campaign_id, job_type, campaign_index, expected_count=None, timeout=300, interval=10, api_base=None):
@@ -123,7 +189,12 @@ def wait_for_jobs(token, campaign_id, job_type, campaign_index, expected_count=N
     else:
         print(f"[Polling #{campaign_index}] Waiting for any {job_type} job(s) to complete")
     
+    if USE_SSE and timeout <= STREAM_MAX_TIMEOUT:
+        return _wait_for_jobs_streaming(token, campaign_id, job_type, campaign_index, expected_count, timeout, api_base)
+    
     waited = 0
+    delay = POLL_MIN_INTERVAL
+    last_statuses = None
     last_status_log = 0
     status_log_interval = 15  # Log status every 15 seconds for concurrent tests
     
@@ -136,25 +207,21 @@ def wait_for_jobs(token, campaign_id, job_type, campaign_index, expected_count=N
             _log_job_status(target, waited, campaign_index, job_type)
             last_status_log = waited
         
-        # Check if we have enough jobs yet
-        if expected_count and len(target) < expected_count:
-            time.sleep(interval)
-            waited += interval
-            continue
-
-        # Check job completion status
-        result, completed_jobs = _check_job_completion(target, expected_count, campaign_index, job_type, waited)
+        # Poll quickly while jobs are changing and back off towards interval while they are not
+        statuses = [(j["id"], j["status"]) for j in target]
+        if statuses != last_statuses:
+            delay = POLL_MIN_INTERVAL
+            last_statuses = statuses
+        else:
+            delay = min(max(delay + 1, int(delay * 1.5)), interval)
         
+        # Fail on the first failed job, succeed once enough jobs have completed
+        result, completed_jobs = _check_job_completion(target, expected_count, campaign_index, job_type, waited)
         if result == 'success':
             return completed_jobs
-        elif result == 'wait_more':
-            time.sleep(interval)
-            waited += interval
-            continue
-        # else result == 'continue', so continue to next iteration
 
-        time.sleep(interval)
-        waited += interval
+        time.sleep(delay)
+        waited += delay
     
     # Timeout reached
     _report_timeout_status(token, campaign_id, job_type, campaign_index, timeout, api_base)
@@ -175,13 +242,21 @@ def print_consolidated_status(job_tracker):
     print(f"[Status] Jobs: {total_jobs_completed} complete, {total_jobs_failed} failed / {total_jobs_expected} total ({total_jobs_completed/total_jobs_expected*100:.1f}% complete)")
 
 
-def monitor_all_campaigns_jobs(token, campaigns_data, timeout=600, api_base=None):
-    """Monitor ENRICH_LEAD jobs across all campaigns concurrently"""
+def monitor_all_campaigns_jobs(token, campaigns_data, timeout=600, api_base=None, initial_interval=0.25, max_interval=5.0):
+    """
+    Monitor ENRICH_LEAD jobs across all campaigns concurrently.
+    
+    Polls every initial_interval seconds while jobs are finishing and doubles
+    the interval, up to max_interval, while nothing changes.
+    """
     if api_base is None:
         api_base = f"http://localhost:8000{settings.API_V1_STR}"
     
     print(f"\n[Monitor] Starting to monitor ENRICH_LEAD jobs across {len(campaigns_data)} campaigns")
     
+    # Monotonic clock, so wall-clock adjustments can't stretch or cut short the timeout
+    start_time = time.monotonic()
+    
     # Initialize tracking structure
     job_tracker = {}
     for campaign_id, data in campaigns_data.items():
@@ -192,32 +267,34 @@ def monitor_all_campaigns_jobs(token, campaigns_data, timeout=600, api_base=None
             'failed_jobs': 0,
             'last_job_count': 0,
             'status': 'waiting',  # waiting, processing, completed, failed
-            'last_update': time.time()
+            'last_update': start_time
         }
     
-    start_time = time.time()
     last_status_log = 0
     status_log_interval = 15  # Log every 15 seconds
+    interval = initial_interval
+    prev_finished_count = 0
     
-    while time.time() - start_time < timeout:
-        current_time = time.time()
+    while True:
+        current_time = time.monotonic()
         elapsed = current_time - start_time
+        if elapsed >= timeout:
+            break
         all_complete = True
         
+        # Count ENRICH_LEAD jobs per status for every unfinished campaign in one request
+        active_ids = [cid for cid, tracking in job_tracker.items() if tracking['status'] not in ['completed', 'failed']]
+        stats_by_campaign = fetch_job_stats(token, active_ids, "ENRICH_LEAD", api_base)
+        
         for campaign_id, tracking in job_tracker.items():
             if tracking['status'] in ['completed', 'failed']:
                 continue
                 
-            # Fetch jobs for this campaign
-            jobs = fetch_campaign_jobs(token, campaign_id, api_base)
-            enrich_jobs = [j for j in jobs if j["job_type"] == "ENRICH_LEAD"]
-            
-            completed = [j for j in enrich_jobs if j["status"] == "COMPLETED"]
-            failed = [j for j in enrich_jobs if j["status"] == "FAILED"]
+            stats = stats_by_campaign[campaign_id]
             
             old_completed = tracking['completed_jobs']
-            tracking['completed_jobs'] = len(completed)
-            tracking['failed_jobs'] = len(failed)
+            tracking['completed_jobs'] = stats['completed']
+            tracking['failed_jobs'] = stats['failed']
             
             # Update status
             if tracking['failed_jobs'] > 0:
@@ -243,8 +320,15 @@ def monitor_all_campaigns_jobs(token, campaigns_data, timeout=600, api_base=None
         if all_complete:
             print(f"\n[Monitor] 🎉 All campaigns completed after {elapsed:.1f}s!")
             return job_tracker
-            
-        time.sleep(3)  # Check every 3 seconds
+        
+        # Poll quickly while jobs are finishing and back off while they are not
+        finished_count = sum(t['completed_jobs'] + t['failed_jobs'] for t in job_tracker.values())
+        if finished_count != prev_finished_count:
+            interval = initial_interval
+            prev_finished_count = finished_count
+        else:
+            interval = min(interval * 2, max_interval)
+        time.sleep(interval)
     
     # Timeout reached
     print(f"\n[Monitor] ⏰ Timeout reached after {timeout}s")
@@ -270,13 +354,19 @@ def monitor_all_campaigns_jobs_with_cb_awareness(token, campaigns_data, timeout=
                                                 report_circuit_breaker_failure_func=None,
                                                 validate_no_unexpected_pauses_func=None,
                                                 check_campaign_status_summary_func=None,
-                                                api_base=None):
+                                                api_base=None,
+                                                initial_interval=0.25,
+                                                max_interval=5.0):
     """
     Enhanced job monitoring with circuit breaker awareness.
     
     This function monitors ENRICH_LEAD jobs across all campaigns while also
     checking for circuit breaker events that could cause service failures.
     
+    Job stats are polled with the same backoff as monitor_all_campaigns_jobs:
+    initial_interval while jobs are finishing, doubling up to max_interval
+    while nothing changes.
+    
     Returns:
         None: If circuit breaker triggered and test should stop
         dict: Job results if completed successfully or timeout reached
@@ -289,6 +379,8 @@ def monitor_all_campaigns_jobs_with_cb_awareness(token, campaigns_data, timeout=
     # Get campaign IDs for circuit breaker checks
     campaign_ids = list(campaigns_data.keys())
     
+    start_time = time.monotonic()
+    
     # Initialize tracking structure
     job_tracker = {}
     for campaign_id, data in campaigns_data.items():
@@ -299,20 +391,23 @@ def monitor_all_campaigns_jobs_with_cb_awareness(token, campaigns_data, timeout=
             'failed_jobs': 0,
             'last_job_count': 0,
             'status': 'waiting',  # waiting, processing, completed, failed
-            'last_update': time.time()
+            'last_update': start_time
         }
     
-    start_time = time.time()
     last_status_log = 0
     last_cb_check = 0
     status_log_interval = 15  # Log every 15 seconds
     cb_check_interval = 30   # Check circuit breaker every 30 seconds
+    interval = initial_interval
+    prev_finished_count = 0
     
     print(f"[Monitor CB] Circuit breaker checks will run every {cb_check_interval}s")
     
-    while time.time() - start_time < timeout:
-        current_time = time.time()
+    while True:
+        current_time = time.monotonic()
         elapsed = current_time - start_time
+        if elapsed >= timeout:
+            break
         all_complete = True
         
         # === CIRCUIT BREAKER HEALTH CHECK ===
@@ -401,20 +496,19 @@ def monitor_all_campaigns_jobs_with_cb_awareness(token, campaigns_data, timeout=
             last_cb_check = elapsed
         
         # === JOB STATUS MONITORING ===
+        # Count ENRICH_LEAD jobs per status for every unfinished campaign in one request
+        active_ids = [cid for cid, tracking in job_tracker.items() if tracking['status'] not in ['completed', 'failed']]
+        stats_by_campaign = fetch_job_stats(token, active_ids, "ENRICH_LEAD", api_base)
+        
         for campaign_id, tracking in job_tracker.items():
             if tracking['status'] in ['completed', 'failed']:
                 continue
                 
-            # Fetch jobs for this campaign
-            jobs = fetch_campaign_jobs(token, campaign_id, api_base)
-            enrich_jobs = [j for j in jobs if j["job_type"] == "ENRICH_LEAD"]
-            
-            completed = [j for j in enrich_jobs if j["status"] == "COMPLETED"]
-            failed = [j for j in enrich_jobs if j["status"] == "FAILED"]
+            stats = stats_by_campaign[campaign_id]
             
             old_completed = tracking['completed_jobs']
-            tracking['completed_jobs'] = len(completed)
-            tracking['failed_jobs'] = len(failed)
+            tracking['completed_jobs'] = stats['completed']
+            tracking['failed_jobs'] = stats['failed']
             
             # Update status
             if tracking['failed_jobs'] > 0:
@@ -441,8 +535,15 @@ def monitor_all_campaigns_jobs_with_cb_awareness(token, campaigns_data, timeout=
         if all_complete:
             print(f"\n[Monitor CB] 🎉 All campaigns completed after {elapsed:.1f}s!")
             return job_tracker
-            
-        time.sleep(3)  # Check every 3 seconds
+        
+        # Poll quickly while jobs are finishing and back off while they are not
+        finished_count = sum(t['completed_jobs'] + t['failed_jobs'] for t in job_tracker.values())
+        if finished_count != prev_finished_count:
+            interval = initial_interval
+            prev_finished_count = finished_count
+        else:
+            interval = min(interval * 2, max_interval)
+        time.sleep(interval)
     
     # === TIMEOUT HANDLING ===
     print(f"\n[Monitor CB] ⏰ Timeout reached after {timeout}s")
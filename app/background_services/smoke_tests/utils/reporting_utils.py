@@ -2,8 +2,9 @@
 Status reporting and analysis utilities for smoke tests.
 """
 
-import requests
+import warnings
 from app.core.config import settings
+from .campaign_utils import get_campaigns_by_ids
 
 
 def check_campaign_status_summary(token, campaign_ids, api_base=None):
@@ -11,7 +12,6 @@ def check_campaign_status_summary(token, campaign_ids, api_base=None):
     if api_base is None:
         api_base = f"http://localhost:8000{settings.API_V1_STR}"
         
-    headers = {"Authorization": f"Bearer {token}"}
     status_summary = {
         "CREATED": 0,
         "RUNNING": 0, 
@@ -22,22 +22,26 @@ def check_campaign_status_summary(token, campaign_ids, api_base=None):
     
     campaign_details = []
     
+    try:
+        campaigns_by_id = get_campaigns_by_ids(token, campaign_ids, api_base)
+    except Exception as e:
+        print(f"[Status Check] Warning: Could not check campaigns: {e}")
+        return status_summary, campaign_details
+    
     for campaign_id in campaign_ids:
-        try:
-            resp = requests.get(f"{api_base}/campaigns/{campaign_id}", headers=headers)
-            if resp.status_code == 200:
-                campaign = resp.json().get("data", resp.json())
-                status = campaign["status"]
-                status_summary[status] = status_summary.get(status, 0) + 1
-                
-                campaign_details.append({
-                    "id": campaign_id,
-                    "status": status,
-                    "status_message": campaign.get("status_message", ""),
-                    "status_error": campaign.get("status_error", "")
-                })
-        except Exception as e:
-            print(f"[Status Check] Warning: Could not check campaign {campaign_id}: {e}")
+        campaign = campaigns_by_id.get(campaign_id)
+        if campaign is None:
+            print(f"[Status Check] Warning: Could not check campaign {campaign_id}: not found")
+            continue
+        status = campaign["status"]
+        status_summary[status] = status_summary.get(status, 0) + 1
+        
+        campaign_details.append({
+            "id": campaign_id,
+            "status": status,
+            "status_message": campaign.get("status_message", ""),
+            "status_error": campaign.get("status_error", "")
+        })
     
     return status_summary, campaign_details
 
@@ -145,4 +149,9 @@ def analyze_process_results(campaigns_data, job_results):
 
 def analyze_results(campaigns_data, job_results):
     """DEPRECATED: Use analyze_process_results instead."""
+    warnings.warn(
+        "analyze_results is deprecated, use analyze_process_results instead",
+        DeprecationWarning,
+        stacklevel=2
+    )
     return analyze_process_results(campaigns_data, job_results) 
\ No newline at end of file
@@ -2,8 +2,8 @@
 Data validation and assertion utilities for smoke tests.
 """
 
-import requests
 from app.core.config import settings
+from .campaign_utils import get_leads_by_ids
 
 
 def validate_enrichment(leads, token, campaign_index, api_base=None):
@@ -12,19 +12,17 @@ def validate_enrichment(leads, token, campaign_index, api_base=None):
         api_base = f"http://localhost:8000{settings.API_V1_STR}"
         
     print(f"[Validation #{campaign_index}] Starting enrichment validation for {len(leads)} leads...")
-    headers = {"Authorization": f"Bearer {token}"}
+    
+    # Fetch every lead's current state up front instead of one request per lead
+    updated_leads = get_leads_by_ids(token, [lead["id"] for lead in leads], api_base)
     
     # Get expected mock data for this campaign - simplified approach
     validated_count = 0
     for i, lead in enumerate(leads, 1):
         print(f"[Validation #{campaign_index}] Validating lead {i}/{len(leads)}: {lead['email']}")
-        resp = requests.get(f"{api_base}/leads/{lead['id']}", headers=headers)
-        if resp.status_code != 200:
-            raise Exception(f"Lead fetch failed for {lead['id']}: {resp.status_code} {resp.text}")
-        
-        # Fix: Check if response has "data" wrapper or direct access
-        response_data = resp.json()
-        updated_lead = response_data.get("data") or response_data
+        updated_lead = updated_leads.get(lead["id"])
+        if updated_lead is None:
+            raise Exception(f"Lead fetch failed for {lead['id']}: not found")
         
         # Simplified validation - just check that enrichment happened
         assert_lead_enrichment_simple(updated_lead, timeout=60)
@@ -73,13 +71,10 @@ def validate_campaign_data(campaigns_data):
         if len(actual_emails) == 0:
             raise ValueError(f"Campaign #{campaign_index} has no valid email addresses")
         
-        # Check for duplicates within this campaign
-        if len(actual_emails) != len(set(actual_emails)):
-            raise ValueError(f"Campaign #{campaign_index} has duplicate emails within campaign")
-        
-        # Check for duplicates across campaigns
-        overlap = all_emails & actual_emails
-        if overlap:
+        # Check for duplicates across campaigns; isdisjoint stops at the first
+        # shared email without building a set, the overlap is only computed to report it
+        if not all_emails.isdisjoint(actual_emails):
+            overlap = all_emails & actual_emails
             raise ValueError(f"Campaign #{campaign_index} has emails that appear in other campaigns: {overlap}")
         
         all_emails.update(actual_emails)
@@ -115,8 +110,8 @@ def validate_no_duplicate_emails(campaigns_data):
         campaign_index = data['campaign_index']
         
         # Check for duplicates across campaigns
-        overlap = all_emails & campaign_emails
-        if overlap:
+        if not all_emails.isdisjoint(campaign_emails):
+            overlap = all_emails & campaign_emails
             raise ValueError(f"Campaign #{campaign_index} has duplicate emails from other campaigns: {overlap}")
         
         all_emails.update(campaign_emails)
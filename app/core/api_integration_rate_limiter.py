@@ -1,5 +1,6 @@
+import threading
 import time
-from typing import Optional
+from typing import Dict, Optional
 from redis import Redis
 
 def get_api_rate_limits():
@@ -14,7 +15,7 @@ def get_api_rate_limits():
     """
     from app.core.config import settings
     
-    return {
+    limits = {
         'MillionVerifier': {
             'max_requests': settings.MILLIONVERIFIER_RATE_LIMIT_REQUESTS,
             'period_seconds': settings.MILLIONVERIFIER_RATE_LIMIT_PERIOD
@@ -36,10 +37,56 @@ def get_api_rate_limits():
             'period_seconds': settings.APOLLO_RATE_LIMIT_PERIOD
         },
     }
+    for config in limits.values():
+        config['lease_size'] = settings.RATE_LIMIT_LEASE_SIZE
+    return limits
 
 # Maintain backward compatibility - this will now be dynamically loaded
 API_RATE_LIMITS = get_api_rate_limits()
 
+class LocalTokenBucket:
+    """
+    Process-local store of rate limit slots already reserved in Redis.
+    
+    Slots are granted in bulk by the shared Redis counter and handed out
+    locally until they run out or the window they were reserved in expires,
+    so the distributed limit is never exceeded.
+    """
+    def __init__(self):
+        self.tokens = 0
+        self.expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Consume one local slot if any are left in the current window."""
+        with self._lock:
+            if self.tokens > 0 and time.monotonic() < self.expires_at:
+                self.tokens -= 1
+                return True
+            return False
+
+    def fill(self, tokens: int, ttl_seconds: int) -> None:
+        """Replace the local slots with ``tokens`` valid for ``ttl_seconds``."""
+        with self._lock:
+            self.tokens = tokens
+            self.expires_at = time.monotonic() + ttl_seconds
+
+
+# One bucket per API for the life of the process, so slots leased by one
+# limiter instance are used by every other instance built for the same API
+_local_buckets: Dict[str, LocalTokenBucket] = {}
+_local_buckets_lock = threading.Lock()
+
+
+def get_local_bucket(api_name: str) -> LocalTokenBucket:
+    """Return the process-wide bucket of leased slots for ``api_name``."""
+    with _local_buckets_lock:
+        bucket = _local_buckets.get(api_name)
+        if bucket is None:
+            bucket = _local_buckets[api_name] = LocalTokenBucket()
+        return bucket
+
+
 class ApiIntegrationRateLimiter:
     """
     Distributed rate limiter using Redis. Supports per-API configuration.
@@ -59,12 +106,14 @@ class ApiIntegrationRateLimiter:
             # Handle rate limit exceeded
             pass
     """
-    def __init__(self, redis_client: Redis, api_name: str, max_requests: int, period_seconds: int):
+    def __init__(self, redis_client: Redis, api_name: str, max_requests: int, period_seconds: int, lease_size: int = 1):
         self.redis = redis_client
         self.api_name = api_name
         self.max_requests = max_requests
         self.period_seconds = period_seconds
+        self.lease_size = max(1, lease_size)
         self.key = f"ratelimit:{api_name}"
+        self.local_bucket = get_local_bucket(api_name)
 
     def is_allowed(self) -> bool:
         """
@@ -86,6 +135,9 @@ class ApiIntegrationRateLimiter:
         """
         Attempt to acquire a rate limit slot.
         
+        Slots left over from an earlier lease are used without touching
+        Redis; otherwise up to lease_size slots are reserved in one INCRBY.
+        
         Args:
             block (bool): If True, wait until a slot is available or timeout is reached
             timeout (Optional[int]): Maximum time to wait in seconds (only used if block=True)
@@ -95,12 +147,17 @@ class ApiIntegrationRateLimiter:
         """
         start = time.time()
         while True:
+            if self.local_bucket.take():
+                return True
             try:
                 pipe = self.redis.pipeline()
-                pipe.incr(self.key, 1)
+                pipe.incr(self.key, self.lease_size)
                 pipe.expire(self.key, self.period_seconds)
                 count, _ = pipe.execute()
-                if count <= self.max_requests:
+                granted = min(self.lease_size, self.max_requests - (count - self.lease_size))
+                if granted > 0:
+                    if granted > 1:
+                        self.local_bucket.fill(granted - 1, self.period_seconds)
                     return True
             except Exception:
                 # If Redis is unavailable, allow the request (graceful degradation)
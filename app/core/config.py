@@ -1,8 +1,13 @@
 from typing import List, Union
+import os
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl, field_validator
 import json
 
+# Resolve .env against the project root rather than the working directory,
+# so settings load the same no matter where the process was started from
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 class Settings(BaseSettings):
     PROJECT_NAME: str = "FastAPI K8s Worker Prototype"
     VERSION: str = "0.1.0"
@@ -47,12 +52,20 @@ class Settings(BaseSettings):
         postgres_password = values.data.get("POSTGRES_PASSWORD")
         postgres_db = values.data.get("POSTGRES_DB")
         return f"postgresql://{postgres_user}:{postgres_password}@{postgres_server}/{postgres_db}"
+
+    # Database connection pool - sized so checkout never becomes the bottleneck
+    # for the request threadpool under load
+    DB_POOL_SIZE: int = (os.cpu_count() or 1) * 4
+    DB_MAX_OVERFLOW: int = (os.cpu_count() or 1) * 2
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 30  # seconds
     
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_URL: str = ""
+    REDIS_MAX_CONNECTIONS: int = 50
 
     @field_validator("REDIS_URL", mode="before")
     def assemble_redis_connection(cls, v: str, values: dict) -> str:
@@ -79,6 +92,11 @@ class Settings(BaseSettings):
             return v
         return values.data.get("REDIS_URL", "")
 
+    # Response cache for read-heavy GET endpoints
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    QUEUE_STATUS_CACHE_TTL_SECONDS: int = 1  # in-process snapshot per API worker; <= 0 disables it
+
     # Rate Limiter Configuration
     # MillionVerifier API Rate Limits
     MILLIONVERIFIER_RATE_LIMIT_REQUESTS: int = 60
@@ -101,12 +119,21 @@ class Settings(BaseSettings):
     # Perplexity API Rate Limits
     PERPLEXITY_RATE_LIMIT_REQUESTS: int = 50
     PERPLEXITY_RATE_LIMIT_PERIOD: int = 60
+    
+    # Rate limit slots each process reserves from Redis per round trip; the
+    # lease is shared by every limiter the process builds for the same API.
+    # 1 keeps every acquire exact; larger values cut Redis traffic but let a
+    # process hold up to N-1 unused slots until the window expires.
+    RATE_LIMIT_LEASE_SIZE: int = 1
 
     # External API Tokens
     # Added to fix critical configuration management failure where ApolloService
     # was refactored to use settings object but this field was never added
     APIFY_API_TOKEN: str
     APOLLO_ACTOR_ID: str = "code_crafter/apollo-io-scraper"
+    USE_APIFY_CLIENT_MOCK: bool = False
+    # Upper bound of the random delay MockActor.call() sleeps to imitate an actor run; 0 disables it
+    MOCK_APIFY_DELAY_SECONDS: float = 0.0
 
     @field_validator(
         "MILLIONVERIFIER_RATE_LIMIT_REQUESTS", "MILLIONVERIFIER_RATE_LIMIT_PERIOD",
@@ -114,6 +141,7 @@ class Settings(BaseSettings):
         "INSTANTLY_RATE_LIMIT_REQUESTS", "INSTANTLY_RATE_LIMIT_PERIOD",
         "OPENAI_RATE_LIMIT_REQUESTS", "OPENAI_RATE_LIMIT_PERIOD",
         "PERPLEXITY_RATE_LIMIT_REQUESTS", "PERPLEXITY_RATE_LIMIT_PERIOD",
+        "RATE_LIMIT_LEASE_SIZE",
         mode="before"
     )
     def validate_rate_limit_integers(cls, v):
@@ -148,15 +176,42 @@ class Settings(BaseSettings):
 
     class Config:
         case_sensitive = True
-        env_file = ".env"
+        env_file = os.path.join(PROJECT_ROOT, ".env")
         extra = "allow"
 
+_redis_pool = None
+
+def get_redis_pool():
+    """
+    Return the process-wide Redis connection pool, creating it on first use.
+    
+    All clients handed out by get_redis_connection share this pool, so
+    connections are reused instead of being opened per request. redis-py
+    resets the pool automatically in forked Celery worker processes.
+    """
+    global _redis_pool
+    if _redis_pool is None:
+        from redis import BlockingConnectionPool
+        
+        _redis_pool = BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            decode_responses=True,  # Ensures string responses instead of bytes
+            socket_connect_timeout=5,  # 5 second connection timeout
+            socket_timeout=5,  # 5 second socket timeout
+            retry_on_timeout=True,
+            health_check_interval=30  # Check connection health every 30 seconds
+        )
+    return _redis_pool
+
 def get_redis_connection():
     """
     Create and return a Redis connection for rate limiting.
     
-    This function creates a Redis connection using the application settings
-    and is designed to be used by the rate limiter functionality.
+    This function returns a Redis client backed by the shared connection
+    pool and is designed to be used by the rate limiter functionality.
     
     Returns:
         Redis: A Redis client instance configured from application settings
@@ -167,16 +222,7 @@ def get_redis_connection():
     from redis import Redis
     
     try:
-        redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            decode_responses=True,  # Ensures string responses instead of bytes
-            socket_connect_timeout=5,  # 5 second connection timeout
-            socket_timeout=5,  # 5 second socket timeout
-            retry_on_timeout=True,
-            health_check_interval=30  # Check connection health every 30 seconds
-        )
+        redis_client = Redis(connection_pool=get_redis_pool())
         
         # Test the connection
         redis_client.ping()
@@ -52,7 +52,8 @@ def get_email_verifier_rate_limiter(redis_client: Redis) -> ApiIntegrationRateLi
         redis_client=redis_client,
         api_name='MillionVerifier',
         max_requests=config['max_requests'],
-        period_seconds=config['period_seconds']
+        period_seconds=config['period_seconds'],
+        lease_size=config['lease_size']
     )
 
 def get_millionverifier_rate_limiter(redis_client: Redis = Depends(get_redis_client)) -> ApiIntegrationRateLimiter:
@@ -84,7 +85,8 @@ def get_apollo_rate_limiter(redis_client: Redis) -> ApiIntegrationRateLimiter:
         redis_client=redis_client,
         api_name='Apollo',
         max_requests=config['max_requests'],
-        period_seconds=config['period_seconds']
+        period_seconds=config['period_seconds'],
+        lease_size=config['lease_size']
     )
 
 def get_apollo_rate_limiter_dependency(redis_client: Redis = Depends(get_redis_client)) -> ApiIntegrationRateLimiter:
@@ -116,7 +118,8 @@ def get_instantly_rate_limiter(redis_client: Redis) -> ApiIntegrationRateLimiter
         redis_client=redis_client,
         api_name='Instantly',
         max_requests=config['max_requests'],
-        period_seconds=config['period_seconds']
+        period_seconds=config['period_seconds'],
+        lease_size=config['lease_size']
     )
 
 def get_instantly_rate_limiter_dependency(redis_client: Redis = Depends(get_redis_client)) -> ApiIntegrationRateLimiter:
@@ -148,7 +151,8 @@ def get_openai_rate_limiter(redis_client: Redis) -> ApiIntegrationRateLimiter:
         redis_client=redis_client,
         api_name='OpenAI',
         max_requests=config['max_requests'],
-        period_seconds=config['period_seconds']
+        period_seconds=config['period_seconds'],
+        lease_size=config['lease_size']
     )
 
 def get_openai_rate_limiter_dependency(redis_client: Redis = Depends(get_redis_client)) -> ApiIntegrationRateLimiter:
@@ -180,7 +184,8 @@ def get_perplexity_rate_limiter(redis_client: Redis) -> ApiIntegrationRateLimite
         redis_client=redis_client,
         api_name='Perplexity',
         max_requests=config['max_requests'],
-        period_seconds=config['period_seconds']
+        period_seconds=config['period_seconds'],
+        lease_size=config['lease_size']
     )
 
 def get_perplexity_rate_limiter_dependency(redis_client: Redis = Depends(get_redis_client)) -> ApiIntegrationRateLimiter:
@@ -225,7 +230,8 @@ def get_rate_limiter_for_service(service_name: str, redis_client: Redis = Depend
         redis_client=redis_client,
         api_name=service_name,
         max_requests=config['max_requests'],
-        period_seconds=config['period_seconds']
+        period_seconds=config['period_seconds'],
+        lease_size=config['lease_size']
     )
 
 
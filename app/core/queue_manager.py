@@ -162,6 +162,46 @@ class QueueManager:
             logger.error(f"Error getting paused jobs for service {service}: {e}")
             return []
     
+    def get_paused_job_summaries(self, service: ThirdPartyService) -> List[Dict[str, Any]]:
+        """
+        Get the serialized fields of jobs paused due to a specific service.
+        
+        Selects only the columns the API exposes, so no Job entities are
+        hydrated for what is a read-only listing.
+        """
+        try:
+            rows = (
+                self.db.query(
+                    Job.id,
+                    Job.name,
+                    Job.job_type,
+                    Job.campaign_id,
+                    Job.error,
+                    Job.created_at,
+                    Job.updated_at
+                )
+                .filter(
+                    Job.status == JobStatus.PAUSED,
+                    Job.error.like(f"%{service.value}%")
+                )
+                .all()
+            )
+            return [
+                {
+                    "id": row.id,
+                    "name": row.name,
+                    "job_type": row.job_type.value,
+                    "campaign_id": row.campaign_id,
+                    "error": row.error,
+                    "created_at": row.created_at,
+                    "updated_at": row.updated_at
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error(f"Error getting paused jobs for service {service}: {e}")
+            return []
+    
     def get_paused_leads_for_recovery(self, service: ThirdPartyService) -> List[Dict[str, Any]]:
         """
         Get lead information for paused enrichment jobs that need to be recovered.
@@ -188,7 +228,7 @@ class QueueManager:
                             'campaign_id': job.campaign_id,
                             'job_id': job.id,
                             'lead_email': lead.email,
-                            'paused_at': job.updated_at.isoformat() if job.updated_at else None
+                            'paused_at': job.updated_at
                         })
                     else:
                         # If no lead found, just include basic job info
@@ -197,7 +237,7 @@ class QueueManager:
                             'campaign_id': job.campaign_id,
                             'job_id': job.id,
                             'lead_email': None,
-                            'paused_at': job.updated_at.isoformat() if job.updated_at else None
+                            'paused_at': job.updated_at
                         })
             
             return recovery_info
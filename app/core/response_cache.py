@@ -0,0 +1,178 @@
+"""
+Redis-backed response cache for read-heavy GET endpoints.
+
+Cached responses live under ``response_cache:<namespace>:v<version>:<key>``.
+Invalidation bumps the namespace version instead of scanning for keys, so
+every entry of that namespace becomes unreachable in a single INCR and
+simply expires on its TTL.
+
+Campaign, lead and organization namespaces are invalidated automatically
+after any database commit that touched those tables through the ORM (API
+requests and Celery workers alike). Writes that bypass the unit of work,
+such as bulk INSERT or COPY, call invalidate_tables() after committing.
+
+Redis calls run in a worker thread so they never block the event loop.
+
+The cache fails open: if Redis is unavailable the endpoint runs uncached.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings, get_redis_connection
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_KEY_PREFIX = "response_cache"
+
+CAMPAIGNS_NAMESPACE = "campaigns"
+ORGANIZATIONS_NAMESPACE = "organizations"
+
+# Tables whose writes make cached responses stale, and the namespaces they affect.
+# Organization responses embed campaign counts, so campaign writes invalidate both.
+_TABLE_NAMESPACES: Dict[str, Tuple[str, ...]] = {
+    "campaigns": (CAMPAIGNS_NAMESPACE, ORGANIZATIONS_NAMESPACE),
+    "leads": (CAMPAIGNS_NAMESPACE,),
+    "organizations": (ORGANIZATIONS_NAMESPACE,),
+}
+
+_KEY_TYPES = (str, int, float, bool, Enum, type(None))
+
+_redis_client = None
+
+
+def _get_cache_client():
+    """Return the shared Redis client used for the response cache."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = get_redis_connection()
+    return _redis_client
+
+
+def _version_key(namespace: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:{namespace}:version"
+
+
+def _build_key(namespace: str, version: str, func_name: str, kwargs: Dict[str, Any]) -> str:
+    """Build a cache key from the endpoint name and its path/query parameters."""
+    params = {
+        name: value.value if isinstance(value, Enum) else value
+        for name, value in sorted(kwargs.items())
+        if isinstance(value, _KEY_TYPES)
+    }
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{namespace}:v{version}:{func_name}:{digest}"
+
+
+def invalidate_cache(*namespaces: str) -> None:
+    """Invalidate every cached response in the given namespaces."""
+    if not settings.RESPONSE_CACHE_ENABLED or not namespaces:
+        return
+    try:
+        pipe = _get_cache_client().pipeline()
+        for namespace in namespaces:
+            pipe.incr(_version_key(namespace))
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed for {namespaces}: {e}")
+
+
+def invalidate_tables(*tables: str) -> None:
+    """Invalidate the namespaces affected by writes to the given tables."""
+    invalidate_cache(*{
+        namespace
+        for table in tables
+        for namespace in _TABLE_NAMESPACES.get(table, ())
+    })
+
+
+def _lookup(namespace: str, func_name: str, kwargs: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """Return the current cache key for a call and the cached value, if any."""
+    redis_client = _get_cache_client()
+    version = redis_client.get(_version_key(namespace)) or "0"
+    cache_key = _build_key(namespace, version, func_name, kwargs)
+    return cache_key, redis_client.get(cache_key)
+
+
+def cached_response(namespace: str, ttl_seconds: Optional[int] = None) -> Callable:
+    """
+    Cache the JSON-encoded result of an async GET endpoint in Redis.
+
+    The cache key is derived from the endpoint name and its scalar
+    path/query parameters; injected dependencies (sessions, users,
+    managers) are ignored. Exceptions are never cached.
+
+    Args:
+        namespace: Invalidation namespace for this endpoint
+        ttl_seconds: Entry lifetime, defaults to RESPONSE_CACHE_TTL_SECONDS
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return await func(*args, **kwargs)
+
+            ttl = ttl_seconds or settings.RESPONSE_CACHE_TTL_SECONDS
+            cache_key = None
+            try:
+                cache_key, cached = await asyncio.to_thread(_lookup, namespace, func.__name__, kwargs)
+                if cached is not None:
+                    return json.loads(cached)
+            except Exception as e:
+                logger.warning(f"Response cache lookup failed for {func.__name__}: {e}")
+
+            result = await func(*args, **kwargs)
+
+            if cache_key is not None:
+                try:
+                    await asyncio.to_thread(
+                        _get_cache_client().setex, cache_key, ttl, json.dumps(jsonable_encoder(result))
+                    )
+                except Exception as e:
+                    logger.warning(f"Response cache store failed for {func.__name__}: {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _touched_namespaces(objects: Iterable[Any]) -> set:
+    namespaces = set()
+    for obj in objects:
+        namespaces.update(_TABLE_NAMESPACES.get(getattr(obj, "__tablename__", None), ()))
+    return namespaces
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_namespaces(session, flush_context):
+    """Remember which cached namespaces this transaction's writes affect."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+    namespaces = _touched_namespaces(
+        list(session.new) + list(session.dirty) + list(session.deleted)
+    )
+    if namespaces:
+        session.info.setdefault("stale_cache_namespaces", set()).update(namespaces)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    namespaces = session.info.pop("stale_cache_namespaces", None)
+    if namespaces:
+        invalidate_cache(*namespaces)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("stale_cache_namespaces", None)
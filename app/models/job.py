@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -35,5 +35,14 @@ class Job(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     completed_at = Column(DateTime(timezone=True))
     
+    # Supports keyset pagination of job listings, newest first, unfiltered or
+    # filtered by status or campaign, and per-campaign job counts by type and status
+    __table_args__ = (
+        Index('ix_jobs_status_created_id', status, created_at.desc(), id.desc()),
+        Index('ix_jobs_campaign_created_id', campaign_id, created_at.desc(), id.desc()),
+        Index('ix_jobs_created_id', created_at.desc(), id.desc()),
+        Index('ix_jobs_campaign_type_status', campaign_id, job_type, status),
+    )
+    
     # Relationship to campaign
     campaign = relationship("Campaign", back_populates="jobs") 
\ No newline at end of file
@@ -1,14 +1,16 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
+import asyncio
 import re
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import bindparam, exists, func, lambda_stmt, select
 from fastapi import HTTPException, status
 
 from app.models.campaign import Campaign
 from app.models.campaign_status import CampaignStatus
 from app.models.job import Job, JobStatus, JobType
 from app.schemas.campaign import CampaignCreate, CampaignUpdate, CampaignStart
+from app.services.organization import OrganizationService
 from app.core.logger import get_logger
 from app.core.config import get_redis_connection
 from app.core.dependencies import get_apollo_rate_limiter, get_instantly_rate_limiter
@@ -27,6 +29,16 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Primary-key lookups built once so SQLAlchemy reuses the compiled statement
+_campaign_by_id_stmt = lambda_stmt(
+    lambda: select(Campaign).where(Campaign.id == bindparam("campaign_id"))
+)
+_campaign_read_stmt = lambda_stmt(
+    lambda: select(Campaign)
+    .options(raiseload("*"))
+    .where(Campaign.id == bindparam("campaign_id"))
+)
+
 
 class CampaignService:
     """Service for managing campaign business logic."""
@@ -58,66 +70,57 @@ class CampaignService:
             logger.warning(f"Failed to initialize InstantlyService with rate limiting: {str(e)}")
             self.instantly_service = None
 
-    async def get_campaigns(self, db: Session, organization_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all campaigns with latest job information, optionally filtered by organization."""
+    def find_campaign(self, campaign_id: str, db: Session) -> Optional[Campaign]:
+        """Load a campaign by ID, or None if it does not exist."""
+        return db.execute(_campaign_by_id_stmt, {"campaign_id": campaign_id}).scalar_one_or_none()
+
+    def campaign_exists(self, campaign_id: str, db: Session) -> bool:
+        """Check whether a campaign exists without loading the row."""
+        return db.query(exists().where(Campaign.id == campaign_id)).scalar()
+
+    def _campaigns_query(self, db: Session, organization_id: Optional[str] = None, status_filter: Optional[CampaignStatus] = None):
+        """Build the base campaign query shared by listing and counting."""
+        query = db.query(Campaign)
+        if organization_id:
+            query = query.filter(Campaign.organization_id == organization_id)
+        if status_filter:
+            query = query.filter(Campaign.status == status_filter)
+        return query
+
+    async def get_campaigns(
+        self,
+        db: Session,
+        organization_id: Optional[str] = None,
+        status_filter: Optional[CampaignStatus] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Campaign]:
+        """Get a page of campaigns, optionally filtered by organization and status."""
         try:
             if organization_id:
                 logger.info(f'Fetching campaigns for organization {organization_id}')
                 
                 # Validate organization exists
-                from app.models.organization import Organization
-                organization = db.query(Organization).filter(
-                    Organization.id == organization_id
-                ).first()
-                if not organization:
+                if not OrganizationService().organization_exists(organization_id, db):
                     logger.warning(f'Organization {organization_id} not found during campaign fetch')
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Organization {organization_id} not found"
                     )
-                
-                campaigns = (
-                    db.query(Campaign)
-                    .filter(Campaign.organization_id == organization_id)
-                    .order_by(Campaign.created_at.desc())
-                    .all()
-                )
             else:
                 logger.info('Fetching all campaigns')
-                campaigns = db.query(Campaign).order_by(Campaign.created_at.desc()).all()
             
-            logger.info(f'Found {len(campaigns)} campaigns')
-            
-            campaign_list = []
-            for campaign in campaigns:
-                try:
-                    campaign_dict = campaign.to_dict()
-                    
-                    # Get latest job status for each campaign
-                    latest_job = (
-                        db.query(Job)
-                        .filter_by(campaign_id=campaign.id)
-                        .order_by(Job.created_at.desc())
-                        .first()
-                    )
-                    if latest_job:
-                        campaign_dict['latest_job'] = {
-                            'id': latest_job.id,
-                            'status': latest_job.status.value,
-                            'created_at': latest_job.created_at.isoformat() if latest_job.created_at else None,
-                            'completed_at': latest_job.completed_at.isoformat() if latest_job.completed_at else None,
-                            'error': latest_job.error
-                        }
-                    else:
-                        campaign_dict['latest_job'] = None
-                        
-                    campaign_list.append(campaign_dict)
-                except Exception as e:
-                    logger.error(f'Error converting campaign {campaign.id} to dict: {str(e)}', exc_info=True)
-                    continue
+            campaigns = (
+                self._campaigns_query(db, organization_id, status_filter)
+                .options(raiseload("*"))
+                .order_by(Campaign.created_at.desc(), Campaign.id)
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
             
-            logger.info(f'Successfully converted {len(campaign_list)} campaigns to dict')
-            return campaign_list
+            logger.info(f'Found {len(campaigns)} campaigns')
+            return campaigns
             
         except HTTPException:
             raise
@@ -128,12 +131,49 @@ class CampaignService:
                 detail=f"Error fetching campaigns: {str(e)}"
             )
 
-    async def get_campaign(self, campaign_id: str, db: Session) -> Dict[str, Any]:
+    def iter_campaigns(
+        self,
+        db: Session,
+        organization_id: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        batch_size: int = 200
+    ) -> Iterator[Campaign]:
+        """Yield a page of campaigns in batches without materializing the whole list."""
+        query = (
+            self._campaigns_query(db, organization_id)
+            .options(raiseload("*"))
+            .order_by(Campaign.created_at.desc(), Campaign.id)
+            .offset(skip)
+            .limit(limit)
+            .yield_per(batch_size)
+        )
+        yield from query
+
+    async def count_campaigns(
+        self,
+        db: Session,
+        organization_id: Optional[str] = None,
+        status_filter: Optional[CampaignStatus] = None
+    ) -> int:
+        """Count campaigns matching the same filters as get_campaigns."""
+        try:
+            return self._campaigns_query(db, organization_id, status_filter).count()
+        except Exception as e:
+            logger.error(f'Error counting campaigns: {str(e)}', exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error counting campaigns: {str(e)}"
+            )
+
+    async def get_campaign(self, campaign_id: str, db: Session) -> Campaign:
         """Get a single campaign by ID."""
         try:
             logger.info(f'Fetching campaign {campaign_id}')
             
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            campaign = db.execute(
+                _campaign_read_stmt, {"campaign_id": campaign_id}
+            ).scalar_one_or_none()
             if not campaign:
                 logger.warning(f'Campaign {campaign_id} not found')
                 raise HTTPException(
@@ -141,13 +181,8 @@ class CampaignService:
                     detail=f"Campaign {campaign_id} not found"
                 )
             
-            campaign_dict = campaign.to_dict()
-            
-            # Get all jobs for this campaign (empty for now as per original logic)
-            campaign_dict['jobs'] = []
-            
             logger.info(f'Successfully fetched campaign {campaign_id}')
-            return campaign_dict
+            return campaign
             
         except HTTPException:
             raise
@@ -158,17 +193,29 @@ class CampaignService:
                 detail=f"Error fetching campaign: {str(e)}"
             )
 
-    async def create_campaign(self, campaign_data: CampaignCreate, db: Session) -> Dict[str, Any]:
+    async def get_campaigns_by_ids(self, campaign_ids: List[str], db: Session) -> List[Campaign]:
+        """Get several campaigns by ID; IDs that do not exist are skipped."""
+        try:
+            return (
+                db.query(Campaign)
+                .options(raiseload("*"))
+                .filter(Campaign.id.in_(campaign_ids))
+                .all()
+            )
+        except Exception as e:
+            logger.error(f'Error getting campaigns by ID: {str(e)}', exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error fetching campaigns: {str(e)}"
+            )
+
+    async def create_campaign(self, campaign_data: CampaignCreate, db: Session) -> Campaign:
         """Create a new campaign with organization validation and global pause state checking."""
         try:
             logger.info(f'Creating campaign: {campaign_data.name}')
             
             # Validate organization exists
-            from app.models.organization import Organization
-            organization = db.query(Organization).filter(
-                Organization.id == campaign_data.organization_id
-            ).first()
-            if not organization:
+            if not OrganizationService().organization_exists(campaign_data.organization_id, db):
                 logger.warning(f'Organization {campaign_data.organization_id} not found during campaign creation')
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -237,7 +284,7 @@ class CampaignService:
                     logger.warning("Instantly service is paused, skipping campaign creation")
 
             logger.info(f'Successfully created campaign {campaign.id}')
-            return campaign.to_dict()
+            return campaign
             
         except HTTPException:
             raise
@@ -249,10 +296,10 @@ class CampaignService:
                 detail=f"Error creating campaign: {str(e)}"
             )
 
-    async def update_campaign(self, campaign_id: str, update_data: CampaignUpdate, db: Session) -> Dict[str, Any]:
+    async def update_campaign(self, campaign_id: str, update_data: CampaignUpdate, db: Session) -> Campaign:
         """Update campaign properties and return updated campaign."""
         try:
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            campaign = self.find_campaign(campaign_id, db)
             if not campaign:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -264,11 +311,7 @@ class CampaignService:
             
             # Validate organization exists if organization_id is being updated
             if 'organization_id' in update_dict:
-                from app.models.organization import Organization
-                organization = db.query(Organization).filter(
-                    Organization.id == update_dict['organization_id']
-                ).first()
-                if not organization:
+                if not OrganizationService().organization_exists(update_dict['organization_id'], db):
                     logger.warning(f'Organization {update_dict["organization_id"]} not found during campaign update')
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -282,7 +325,7 @@ class CampaignService:
             db.refresh(campaign)
             
             logger.info(f'Successfully updated campaign {campaign_id}')
-            return campaign.to_dict()
+            return campaign
             
         except HTTPException:
             raise
@@ -294,12 +337,12 @@ class CampaignService:
                 detail=f"Error updating campaign: {str(e)}"
             )
 
-    async def start_campaign(self, campaign_id: str, start_data: CampaignStart, db: Session) -> Dict[str, Any]:
+    async def start_campaign(self, campaign_id: str, start_data: CampaignStart, db: Session) -> Campaign:
         """Start a campaign process with enhanced business rule validation."""
         try:
             logger.info(f"Starting campaign process for campaign_id={campaign_id}")
 
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            campaign = self.find_campaign(campaign_id, db)
             if not campaign:
                 logger.error(f"Campaign {campaign_id} not found during start.")
                 raise HTTPException(
@@ -382,15 +425,7 @@ class CampaignService:
             db.commit()
 
             logger.info(f'Successfully started campaign {campaign_id}')
-            
-            # Return campaign data with validation info
-            campaign_dict = campaign.to_dict()
-            campaign_dict['start_validation'] = {
-                'warnings': validation_results["warnings"],
-                'services_checked': list(validation_results["validation_details"].get("services", {}).keys())
-            }
-            
-            return campaign_dict
+            return campaign
 
         except HTTPException:
             raise
@@ -400,7 +435,7 @@ class CampaignService:
             
             # Update campaign status to failed
             try:
-                campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+                campaign = self.find_campaign(campaign_id, db)
                 if campaign:
                     campaign.update_status(CampaignStatus.FAILED, status_error=str(e))
                     db.commit()
@@ -487,9 +522,8 @@ class CampaignService:
         try:
             logger.info(f"Initiating cleanup for campaign {campaign_id} older than {days} days")
 
-            # Get campaign to verify it exists
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-            if not campaign:
+            # Verify campaign exists
+            if not self.campaign_exists(campaign_id, db):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Campaign {campaign_id} not found"
@@ -515,12 +549,16 @@ class CampaignService:
                 detail=f"Error queueing cleanup task: {str(e)}"
             )
 
-    async def get_campaign_lead_stats(self, campaign_id: str, db: Session) -> "CampaignLeadStats":
-        """Return stats for a campaign's leads."""
+    async def get_campaign_lead_stats(
+        self, campaign_id: str, db: Session, campaign: Optional[Campaign] = None
+    ) -> "CampaignLeadStats":
+        """Return stats for a campaign's leads.
+
+        Pass an already loaded ``campaign`` to skip the existence check.
+        """
         try:
             # Check if campaign exists
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-            if not campaign:
+            if campaign is None and not self.campaign_exists(campaign_id, db):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Campaign {campaign_id} not found"
@@ -557,11 +595,17 @@ class CampaignService:
                 error_message=error_str
             )
 
-    async def get_campaign_instantly_analytics(self, campaign_id: str, db: Session) -> "InstantlyAnalytics":
-        """Fetch and map Instantly analytics overview for a campaign."""
+    async def get_campaign_instantly_analytics(
+        self, campaign_id: str, db: Session, campaign: Optional[Campaign] = None
+    ) -> "InstantlyAnalytics":
+        """Fetch and map Instantly analytics overview for a campaign.
+
+        Pass an already loaded ``campaign`` to skip the database lookup.
+        """
         try:
             # Get campaign
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            if campaign is None:
+                campaign = self.find_campaign(campaign_id, db)
             if not campaign:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -614,7 +658,10 @@ class CampaignService:
                     error="InstantlyService not available"
                 )
                 
-            analytics = self.instantly_service.get_campaign_analytics_overview(instantly_campaign_id)
+            # Blocking HTTP call - keep it off the event loop
+            analytics = await asyncio.to_thread(
+                self.instantly_service.get_campaign_analytics_overview, instantly_campaign_id
+            )
             if 'error' in analytics:
                 return InstantlyAnalytics(
                     leads_count=campaign_dict.get("totalRecords"),
@@ -688,7 +735,7 @@ class CampaignService:
             logger.info(f"Pausing campaign {campaign_id} with reason: {reason}")
             
             # Get campaign
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            campaign = self.find_campaign(campaign_id, db)
             if not campaign:
                 logger.warning(f"Campaign {campaign_id} not found during pause")
                 raise HTTPException(
@@ -739,7 +786,7 @@ class CampaignService:
             logger.info(f"Resuming campaign {campaign_id}")
             
             # Get campaign
-            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            campaign = self.find_campaign(campaign_id, db)
             if not campaign:
                 logger.warning(f"Campaign {campaign_id} not found during resume")
                 raise HTTPException(
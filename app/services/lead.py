@@ -1,5 +1,6 @@
 from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.orm import Session, raiseload
 from fastapi import HTTPException, status
 from app.models.lead import Lead
 from app.schemas.lead import LeadCreate, LeadUpdate
@@ -10,31 +11,68 @@ from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Primary-key lookups built once so SQLAlchemy reuses the compiled statement
+_lead_by_id_stmt = lambda_stmt(
+    lambda: select(Lead).where(Lead.id == bindparam("lead_id"))
+)
+_lead_read_stmt = lambda_stmt(
+    lambda: select(Lead).options(raiseload("*")).where(Lead.id == bindparam("lead_id"))
+)
+
 class LeadService:
     """Service for handling lead-related operations."""
 
-    async def get_leads(self, db: Session, campaign_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _leads_query(self, db: Session, campaign_id: Optional[str] = None):
+        query = db.query(Lead)
+        if campaign_id:
+            query = query.filter(Lead.campaign_id == campaign_id)
+        return query
+
+    async def get_leads(
+        self,
+        db: Session,
+        campaign_id: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Lead]:
         try:
-            query = db.query(Lead)
-            if campaign_id:
-                query = query.filter(Lead.campaign_id == campaign_id)
-            leads = query.all()
-            return [lead.to_dict() for lead in leads]
+            return (
+                self._leads_query(db, campaign_id)
+                .options(raiseload("*"))
+                .order_by(Lead.created_at.desc(), Lead.id)
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error fetching leads: {str(e)}", exc_info=True)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error fetching leads")
 
-    async def get_lead(self, lead_id: str, db: Session) -> Dict[str, Any]:
+    async def count_leads(self, db: Session, campaign_id: Optional[str] = None) -> int:
+        try:
+            return self._leads_query(db, campaign_id).count()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting leads: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error counting leads")
+
+    async def get_lead(self, lead_id: str, db: Session) -> Lead:
         try:
-            lead = db.query(Lead).filter(Lead.id == lead_id).first()
+            lead = db.execute(_lead_read_stmt, {"lead_id": lead_id}).scalar_one_or_none()
             if not lead:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
-            return lead.to_dict()
+            return lead
         except SQLAlchemyError as e:
             logger.error(f"Error fetching lead: {str(e)}", exc_info=True)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error fetching lead")
 
-    async def create_lead(self, lead_data: LeadCreate, db: Session) -> Dict[str, Any]:
+    async def get_leads_by_ids(self, lead_ids: List[str], db: Session) -> List[Lead]:
+        try:
+            return db.query(Lead).options(raiseload("*")).filter(Lead.id.in_(lead_ids)).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching leads: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error fetching leads")
+
+    async def create_lead(self, lead_data: LeadCreate, db: Session) -> Lead:
         try:
             # Check for duplicate lead (by email and campaign_id)
             existing_lead = db.query(Lead).filter(
@@ -48,7 +86,7 @@ class LeadService:
                 existing_lead.updated_at = datetime.utcnow()
                 db.commit()
                 db.refresh(existing_lead)
-                return existing_lead.to_dict()
+                return existing_lead
             # Create new lead
             lead = Lead(
                 **lead_data.dict(),
@@ -58,15 +96,15 @@ class LeadService:
             db.add(lead)
             db.commit()
             db.refresh(lead)
-            return lead.to_dict()
+            return lead
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Error creating lead: {str(e)}", exc_info=True)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error creating lead")
 
-    async def update_lead(self, lead_id: str, update_data: LeadUpdate, db: Session) -> Dict[str, Any]:
+    async def update_lead(self, lead_id: str, update_data: LeadUpdate, db: Session) -> Lead:
         try:
-            lead = db.query(Lead).filter(Lead.id == lead_id).first()
+            lead = db.execute(_lead_by_id_stmt, {"lead_id": lead_id}).scalar_one_or_none()
             if not lead:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
             for key, value in update_data.dict(exclude_unset=True).items():
@@ -74,7 +112,7 @@ class LeadService:
             lead.updated_at = datetime.utcnow()
             db.commit()
             db.refresh(lead)
-            return lead.to_dict()
+            return lead
         except SQLAlchemyError as e:
             db.rollback()
             logger.error(f"Error updating lead: {str(e)}", exc_info=True)
@@ -82,7 +120,7 @@ class LeadService:
 
     async def delete_lead(self, lead_id: str, db: Session) -> None:
         try:
-            lead = db.query(Lead).filter(Lead.id == lead_id).first()
+            lead = db.execute(_lead_by_id_stmt, {"lead_id": lead_id}).scalar_one_or_none()
             if not lead:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
             db.delete(lead)
@@ -1,7 +1,8 @@
 from typing import Dict, Any, List, Optional, Tuple
 import re
 from html import escape
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, exists, func, lambda_stmt, select
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
 from datetime import datetime
@@ -14,10 +15,24 @@ from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Primary-key lookups built once so SQLAlchemy reuses the compiled statement
+_organization_by_id_stmt = lambda_stmt(
+    lambda: select(Organization).where(Organization.id == bindparam("org_id"))
+)
+_organization_read_stmt = lambda_stmt(
+    lambda: select(Organization)
+    .options(raiseload("*"))
+    .where(Organization.id == bindparam("org_id"))
+)
+
 
 class OrganizationService:
     """Service for managing organization business logic."""
     
+    def organization_exists(self, org_id: str, db: Session) -> bool:
+        """Check whether an organization exists without loading the row."""
+        return db.query(exists().where(Organization.id == org_id)).scalar()
+
     def get_campaign_count(self, org_id: str, db: Session) -> int:
         """Get the number of campaigns for an organization."""
         try:
@@ -27,6 +42,22 @@ class OrganizationService:
             logger.error(f'Error getting campaign count for organization {org_id}: {str(e)}')
             return 0
     
+    def get_campaign_counts(self, org_ids: List[str], db: Session) -> Dict[str, int]:
+        """Get campaign counts for several organizations in a single grouped query."""
+        if not org_ids:
+            return {}
+        try:
+            rows = (
+                db.query(Campaign.organization_id, func.count(Campaign.id))
+                .filter(Campaign.organization_id.in_(org_ids))
+                .group_by(Campaign.organization_id)
+                .all()
+            )
+            return dict(rows)
+        except Exception as e:
+            logger.error(f'Error getting campaign counts for organizations: {str(e)}')
+            return {}
+    
     def sanitize_input(self, data: dict) -> dict:
         """Sanitize input data to prevent XSS and other attacks."""
         sanitized = {}
@@ -58,7 +89,7 @@ class OrganizationService:
         
         return True, ''
 
-    async def create_organization(self, org_data: OrganizationCreate, db: Session) -> Dict[str, Any]:
+    async def create_organization(self, org_data: OrganizationCreate, db: Session) -> Organization:
         """Create a new organization."""
         try:
             logger.info(f'Creating organization: {org_data.name}')
@@ -96,7 +127,7 @@ class OrganizationService:
             db.refresh(organization)
             
             logger.info(f'Successfully created organization {organization.id}')
-            return organization.to_dict()
+            return organization
             
         except HTTPException:
             raise
@@ -108,18 +139,20 @@ class OrganizationService:
                 detail=f"Error creating organization: {str(e)}"
             )
 
-    async def get_organization(self, org_id: str, db: Session) -> Optional[Dict[str, Any]]:
+    async def get_organization(self, org_id: str, db: Session) -> Optional[Organization]:
         """Get a single organization by ID."""
         try:
             logger.info(f'Fetching organization {org_id}')
             
-            organization = db.query(Organization).filter(Organization.id == org_id).first()
+            organization = db.execute(
+                _organization_read_stmt, {"org_id": org_id}
+            ).scalar_one_or_none()
             if not organization:
                 logger.warning(f'Organization {org_id} not found')
                 return None
             
             logger.info(f'Successfully fetched organization {org_id}')
-            return organization.to_dict()
+            return organization
             
         except Exception as e:
             logger.error(f'Error getting organization: {str(e)}', exc_info=True)
@@ -128,12 +161,12 @@ class OrganizationService:
                 detail=f"Error fetching organization: {str(e)}"
             )
 
-    async def get_organizations(self, db: Session, skip: int = 0, limit: int = 100, search: str = None) -> List[Dict[str, Any]]:
+    async def get_organizations(self, db: Session, skip: int = 0, limit: int = 100, search: str = None) -> List[Organization]:
         """Get organizations with optional pagination and search."""
         try:
             logger.info(f'Fetching organizations with skip={skip}, limit={limit}, search={search}')
             
-            query = db.query(Organization)
+            query = db.query(Organization).options(raiseload("*"))
             
             # Apply search filter if provided
             if search:
@@ -147,7 +180,7 @@ class OrganizationService:
             organizations = query.order_by(Organization.created_at.desc()).offset(skip).limit(limit).all()
             logger.info(f'Found {len(organizations)} organizations')
             
-            return [org.to_dict() for org in organizations]
+            return organizations
             
         except Exception as e:
             logger.error(f'Error getting organizations: {str(e)}', exc_info=True)
@@ -183,12 +216,12 @@ class OrganizationService:
                 detail=f"Error counting organizations: {str(e)}"
             )
 
-    async def update_organization(self, org_id: str, update_data: OrganizationUpdate, db: Session) -> Optional[Dict[str, Any]]:
+    async def update_organization(self, org_id: str, update_data: OrganizationUpdate, db: Session) -> Optional[Organization]:
         """Update organization properties."""
         try:
             logger.info(f'Updating organization {org_id}')
             
-            organization = db.query(Organization).filter(Organization.id == org_id).first()
+            organization = db.execute(_organization_by_id_stmt, {"org_id": org_id}).scalar_one_or_none()
             if not organization:
                 logger.warning(f'Organization {org_id} not found')
                 return None
@@ -215,7 +248,7 @@ class OrganizationService:
             db.refresh(organization)
             
             logger.info(f'Successfully updated organization {org_id}')
-            return organization.to_dict()
+            return organization
             
         except HTTPException:
             raise
@@ -4,6 +4,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
 from celery import Task
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -27,6 +28,9 @@ from app.core.circuit_breaker import ThirdPartyService
 
 logger = get_logger(__name__)
 
+# Rows deleted per transaction by cleanup_campaign_jobs_task
+CLEANUP_BATCH_SIZE = 10_000
+
 @celery_app.task(bind=True, name="fetch_and_save_leads_task")
 def fetch_and_save_leads_task(self, job_params: Dict[str, Any], campaign_id: str, job_id: int):
     """
@@ -99,7 +103,7 @@ def fetch_and_save_leads_task(self, job_params: Dict[str, Any], campaign_id: str
         )
         
         # Process and save leads
-        leads_count = result.get('count', 0)
+        leads_count = result.count
         
         self.update_state(
             state="PROGRESS",
@@ -553,45 +557,51 @@ def cleanup_campaign_jobs_task(self, campaign_id: str, days: int):
             meta={
                 "current": 2,
                 "total": 3,
-                "status": "Finding jobs to delete"
+                "status": "Deleting jobs"
             }
         )
         
-        # Get jobs to delete (only completed or failed jobs older than cutoff)
-        jobs_to_delete = (
-            db.query(Job)
-            .filter(
+        # Only completed or failed jobs older than cutoff are deleted
+        batch_ids = (
+            select(Job.id)
+            .where(
                 Job.campaign_id == campaign_id,
                 Job.created_at < cutoff_date,
                 Job.status.in_([JobStatus.COMPLETED, JobStatus.FAILED])
             )
-            .all()
+            .limit(CLEANUP_BATCH_SIZE)
         )
         
+        # Bulk DELETE in bounded batches so no single transaction runs long
+        deleted_count = 0
+        while True:
+            deleted_task_ids = db.execute(
+                delete(Job).where(Job.id.in_(batch_ids)).returning(Job.task_id),
+                execution_options={"synchronize_session": False}
+            ).scalars().all()
+            db.commit()
+            deleted_count += len(deleted_task_ids)
+            
+            # Cancel any associated Celery tasks
+            task_ids = [task_id for task_id in deleted_task_ids if task_id]
+            if task_ids:
+                try:
+                    celery_app.control.revoke(task_ids, terminate=True)
+                except Exception as e:
+                    logger.warning(f"Could not revoke {len(task_ids)} tasks: {str(e)}")
+            
+            if len(deleted_task_ids) < CLEANUP_BATCH_SIZE:
+                break
+        
         self.update_state(
             state="PROGRESS",
             meta={
                 "current": 3,
                 "total": 3,
-                "status": f"Deleting {len(jobs_to_delete)} jobs"
+                "status": f"Deleted {deleted_count} jobs"
             }
         )
         
-        # Delete jobs
-        deleted_count = 0
-        for job in jobs_to_delete:
-            # Cancel any associated Celery tasks
-            if job.task_id:
-                try:
-                    celery_app.control.revoke(job.task_id, terminate=True)
-                except Exception as e:
-                    logger.warning(f"Could not revoke task {job.task_id}: {str(e)}")
-            
-            db.delete(job)
-            deleted_count += 1
-        
-        db.commit()
-        
         logger.info(f"Completed cleanup_campaign_jobs_task for campaign {campaign_id}, deleted {deleted_count} jobs")
         
         return {
@@ -1,5 +1,7 @@
 from celery import Celery
 from app.core.config import settings
+# Registers commit hooks that invalidate cached API responses on worker writes
+import app.core.response_cache  # noqa: F401
 
 # Initialize centralized logging for workers
 from app.core.logging_config import init_logging
@@ -6,7 +6,7 @@ from fastapi.testclient import TestClient
 import uuid
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_readonly_db
 from app.core.config import settings
 from app.models.organization import Organization
 from app.models.user import User
@@ -23,6 +23,10 @@ settings.POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
 settings.POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "postgres")
 settings.POSTGRES_DB = os.getenv("POSTGRES_DB", "test_db")
 
+# Tests mutate rows directly through db_session, so cached responses would be stale
+settings.RESPONSE_CACHE_ENABLED = False
+settings.QUEUE_STATUS_CACHE_TTL_SECONDS = 0
+
 # Always use PostgreSQL for tests
 SQLALCHEMY_DATABASE_URL = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_SERVER}/{settings.POSTGRES_DB}"
 
@@ -42,6 +46,7 @@ def override_get_db():
 
 # Override the dependency
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_readonly_db] = override_get_db
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -58,6 +63,7 @@ def db_session():
         yield session
     
     app.dependency_overrides[get_db] = override_get_db_session
+    app.dependency_overrides[get_readonly_db] = override_get_db_session
     
     yield session
     
@@ -68,6 +74,7 @@ def db_session():
     
     # Restore original override
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_readonly_db] = override_get_db
 
 @pytest.fixture(scope="function")
 def client(db_session):
@@ -11,7 +11,7 @@ import uuid
 from unittest.mock import patch, Mock, MagicMock
 from sqlalchemy.orm import Session
 from fastapi.testclient import TestClient
-from app.core.config import get_redis_connection
+from app.core.config import get_redis_connection, settings
 from app.core.database import get_db
 from app.services.campaign import CampaignService
 from app.workers.campaign_tasks import enrich_lead_task, fetch_and_save_leads_task
@@ -217,13 +217,11 @@ class TestEndToEndRateLimiting:
         # Verify remaining count
         assert limiter.get_remaining() == 0
     
-    @patch.dict('os.environ', {
-        'APIFY_API_TOKEN': 'test_token',
-        'USE_APIFY_CLIENT_MOCK': 'true'
-    })
+    @patch.dict('os.environ', {'APIFY_API_TOKEN': 'test_token'})
+    @patch.object(settings, 'USE_APIFY_CLIENT_MOCK', True)
     def test_apollo_service_bulk_operation_rate_limiting(self, redis_client):
         """Test Apollo service rate limiting for bulk operations."""
-        from app.background_services.apollo_service import ApolloService
+        from app.background_services.apollo_service import ApolloService, FetchResult
         from app.core.dependencies import get_apollo_rate_limiter
         
         rate_limiter = get_apollo_rate_limiter(redis_client)
@@ -233,30 +231,28 @@ class TestEndToEndRateLimiting:
         redis_client.delete(rate_limiter.key)
         
         # Mock database for fetch_leads
-        with patch('app.background_services.apollo_service.Session') as mock_session:
-            mock_db = Mock()
-            mock_session.return_value = mock_db
+        mock_db = Mock()
+        
+        # Test bulk operation
+        params = {
+            'fileName': 'test.csv',
+            'totalRecords': 50,
+            'url': 'https://app.apollo.io/test'
+        }
+        
+        try:
+            result = service.fetch_leads(
+                params=params,
+                campaign_id='test-campaign',
+                db=mock_db
+            )
             
-            # Test bulk operation
-            params = {
-                'fileName': 'test.csv',
-                'totalRecords': 50,
-                'url': 'https://app.apollo.io/test'
-            }
+            # Should return a result (may be rate limited or successful)
+            assert isinstance(result, FetchResult)
             
-            try:
-                result = service.fetch_leads(
-                    params=params,
-                    campaign_id='test-campaign',
-                    db=mock_db
-                )
-                
-                # Should return a result (may be rate limited or successful)
-                assert isinstance(result, dict)
-                
-            except Exception as e:
-                # If Apollo service dependencies aren't available, skip
-                pytest.skip(f"Apollo service dependencies not available: {str(e)}")
+        except Exception as e:
+            # If Apollo service dependencies aren't available, skip
+            pytest.skip(f"Apollo service dependencies not available: {str(e)}")
     
     def test_graceful_degradation_scenarios(self, redis_client):
         """Test system behavior when components fail."""
@@ -9,7 +9,7 @@ import time
 import asyncio
 from unittest.mock import patch, Mock
 from redis import Redis
-from app.core.config import get_redis_connection
+from app.core.config import get_redis_connection, settings
 from app.core.api_integration_rate_limiter import ApiIntegrationRateLimiter
 from app.core.dependencies import (
     get_apollo_rate_limiter,
@@ -103,6 +103,63 @@ class TestRedisIntegration:
         # Check that we can just check without acquiring
         assert limiter.is_allowed() == False
     
+    def test_rate_limiter_lease_reserves_slots_in_bulk(self, redis_client):
+        """Test that a leasing limiter serves slots locally without exceeding the limit."""
+        limiter = ApiIntegrationRateLimiter(
+            redis_client=redis_client,
+            api_name='TestLease',
+            max_requests=5,
+            period_seconds=5,
+            lease_size=3
+        )
+        
+        # Clear any existing state
+        redis_client.delete(limiter.key)
+        limiter.local_bucket.fill(0, 0)
+        
+        # First acquire reserves 3 slots in Redis, the next two are served locally
+        assert limiter.acquire() == True
+        assert limiter.local_bucket.tokens == 2
+        assert limiter.acquire() == True
+        assert limiter.acquire() == True
+        
+        # Second lease only gets the 2 slots left under the limit
+        assert limiter.acquire() == True
+        assert limiter.acquire() == True
+        assert limiter.acquire() == False
+    
+    def test_rate_limiter_lease_shared_across_instances(self, redis_client):
+        """Test that a limiter built later uses the slots leased by an earlier one."""
+        first = ApiIntegrationRateLimiter(
+            redis_client=redis_client,
+            api_name='TestSharedLease',
+            max_requests=5,
+            period_seconds=5,
+            lease_size=3
+        )
+        
+        # Clear any existing state
+        redis_client.delete(first.key)
+        first.local_bucket.fill(0, 0)
+        
+        assert first.acquire() == True
+        
+        second = ApiIntegrationRateLimiter(
+            redis_client=redis_client,
+            api_name='TestSharedLease',
+            max_requests=5,
+            period_seconds=5,
+            lease_size=3
+        )
+        
+        # The second limiter is served from the first one's lease without a Redis round trip
+        with patch.object(redis_client, 'pipeline') as mock_pipeline:
+            assert second.acquire() == True
+            assert second.acquire() == True
+            mock_pipeline.assert_not_called()
+        assert second.local_bucket.tokens == 0
+        assert int(redis_client.get(first.key)) == 3
+    
     def test_rate_limiter_expiry(self, redis_client):
         """Test that rate limiter resets after expiry period."""
         # Create a rate limiter with very short period
@@ -146,7 +203,8 @@ class TestRedisIntegration:
             result = service.verify_email('test@example.com')
             assert 'result' in result or 'status' in result  # Could be API response or rate limit response
     
-    @patch.dict('os.environ', {'APIFY_API_TOKEN': 'test_token', 'USE_APIFY_CLIENT_MOCK': 'true'})
+    @patch.dict('os.environ', {'APIFY_API_TOKEN': 'test_token'})
+    @patch.object(settings, 'USE_APIFY_CLIENT_MOCK', True)
     def test_apollo_service_with_redis(self, redis_client):
         """Test ApolloService with real Redis rate limiting."""
         rate_limiter = get_apollo_rate_limiter(redis_client)
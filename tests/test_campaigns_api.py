@@ -307,6 +307,34 @@ def test_list_campaigns_pagination(authenticated_client, db_session, authenticat
     db_count = db_session.query(Campaign).count()
     assert db_count == 5
 
+def test_list_campaigns_status_filter_pagination(authenticated_client, db_session, authenticated_campaign_payload):
+    """Test status filter is applied before pagination and reflected in totals."""
+    created_ids = []
+    for i in range(4):
+        payload = {**authenticated_campaign_payload, "name": f"Campaign {i}"}
+        response = authenticated_client.post("/api/v1/campaigns/", json=payload)
+        assert response.status_code == 201
+        created_ids.append(response.json()["data"]["id"])
+
+    # Mark two campaigns as running directly in the database
+    for campaign_id in created_ids[:2]:
+        campaign = db_session.query(Campaign).filter(Campaign.id == campaign_id).first()
+        campaign.status = CampaignStatus.RUNNING
+    db_session.commit()
+
+    response = authenticated_client.get("/api/v1/campaigns/?status=RUNNING&page=1&per_page=1")
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert len(data["campaigns"]) == 1
+    assert data["campaigns"][0]["status"] == "RUNNING"
+    assert data["total"] == 2
+    assert data["pages"] == 2
+
+    # Unknown status values match nothing
+    response = authenticated_client.get("/api/v1/campaigns/?status=NOT_A_STATUS")
+    assert response.status_code == 200
+    assert response.json()["data"]["total"] == 0
+
 def test_list_campaigns_order(authenticated_client, db_session, authenticated_campaign_payload):
     """Test campaigns are returned in correct order."""
     # Create campaigns with timestamps
@@ -388,6 +416,20 @@ def test_get_campaign_malformed_id(authenticated_client, db_session):
     # Should return 404 (not found) rather than 400 (bad request)
     assert response.status_code == 404
 
+def test_get_campaigns_batch(authenticated_client, db_session, authenticated_campaign_payload):
+    """Test fetching several campaigns by ID, reporting the missing ones."""
+    create_response = authenticated_client.post("/api/v1/campaigns/", json=authenticated_campaign_payload)
+    assert create_response.status_code == 201
+    campaign_id = create_response.json()["data"]["id"]
+    missing_id = str(uuid.uuid4())
+    
+    response = authenticated_client.get("/api/v1/campaigns/batch", params={"ids": [campaign_id, missing_id]})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [campaign["id"] for campaign in data["campaigns"]] == [campaign_id]
+    assert data["campaigns"][0]["status"] == CampaignStatus.CREATED.value
+    assert data["not_found"] == [missing_id]
+
 # ---------------------------------------------------------------------------
 # Campaign Update Tests
 # ---------------------------------------------------------------------------
@@ -102,6 +102,16 @@ def test_get_campaign_results_not_found(authenticated_client):
     
     assert response.status_code == 404
 
+def test_get_campaign_results_completed_jobs_only(campaign_with_jobs, authenticated_client):
+    """Test results include only completed jobs, keyed by job name."""
+    campaign, jobs = campaign_with_jobs
+    response = authenticated_client.get(f"/api/v1/campaigns/{campaign.id}/results")
+    
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["campaign"]["id"] == campaign.id
+    assert data["results"] == {"Fetch Leads Job": "Successfully fetched 300 leads"}
+
 def test_campaign_workflow(sample_campaign_data, authenticated_client):
     """Test a complete campaign workflow."""
     # 1. Create campaign
@@ -1,3 +1,4 @@
+import json
 import pytest
 import time
 from fastapi.testclient import TestClient
@@ -102,6 +103,28 @@ def test_job_status_endpoint(authenticated_client, existing_campaign):
     assert job_status["id"] == job_data["id"]
     assert job_status["status"] == "PENDING"  # Jobs are created with PENDING status by default
 
+def test_bulk_job_status_endpoint(authenticated_client, existing_campaign):
+    """Test status retrieval for several jobs in one request."""
+    job_ids = []
+    for name in ("Bulk Status Job 1", "Bulk Status Job 2"):
+        job_response = authenticated_client.post("/api/v1/jobs/", json={
+            "name": name,
+            "job_type": "FETCH_LEADS",
+            "campaign_id": existing_campaign.id
+        })
+        assert job_response.status_code == 201
+        job_ids.append(job_response.json()["data"]["id"])
+    
+    missing_id = max(job_ids) + 1000
+    query = "&".join(f"ids={job_id}" for job_id in job_ids + [missing_id])
+    status_response = authenticated_client.get(f"/api/v1/jobs/status?{query}")
+    assert status_response.status_code == 200
+    
+    data = status_response.json()["data"]
+    assert sorted(job["id"] for job in data["jobs"]) == sorted(job_ids)
+    assert all(job["status"] == "PENDING" for job in data["jobs"])
+    assert data["not_found"] == [missing_id]
+
 def test_list_jobs_endpoint(authenticated_client, existing_campaign):
     """Test jobs listing endpoint."""
     # Create a campaign first
@@ -144,6 +167,152 @@ def test_list_jobs_endpoint(authenticated_client, existing_campaign):
     assert "jobs" in jobs_data
     assert len(jobs_data["jobs"]) >= 3  # May have jobs from other tests
 
+def test_list_jobs_by_campaign(authenticated_client, existing_campaign):
+    """Test listing several campaigns' jobs in one request, grouped by campaign."""
+    job_ids = []
+    for job_type in ("FETCH_LEADS", "ENRICH_LEAD"):
+        job_response = authenticated_client.post("/api/v1/jobs/", json={
+            "name": f"Bulk List {job_type} Job",
+            "job_type": job_type,
+            "campaign_id": existing_campaign.id
+        })
+        assert job_response.status_code == 201
+        job_ids.append(job_response.json()["data"]["id"])
+    
+    response = authenticated_client.get("/api/v1/jobs/bulk", params={
+        "campaign_ids": [existing_campaign.id, "no-such-campaign"]
+    })
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert sorted(job["id"] for job in data[existing_campaign.id]) == sorted(job_ids)
+    assert data["no-such-campaign"] == []
+    
+    response = authenticated_client.get("/api/v1/jobs/bulk", params={
+        "campaign_ids": [existing_campaign.id],
+        "job_type": "ENRICH_LEAD"
+    })
+    assert response.status_code == 200
+    assert [job["id"] for job in response.json()["data"][existing_campaign.id]] == [job_ids[1]]
+
+def test_list_jobs_by_campaign_not_modified(authenticated_client, existing_campaign):
+    """Test that an unchanged bulk job listing is revalidated with a 304."""
+    params = {"campaign_ids": [existing_campaign.id]}
+    authenticated_client.post("/api/v1/jobs/", json={
+        "name": "ETag Test Job",
+        "job_type": "ENRICH_LEAD",
+        "campaign_id": existing_campaign.id
+    })
+    
+    response = authenticated_client.get("/api/v1/jobs/bulk", params=params)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    
+    response = authenticated_client.get("/api/v1/jobs/bulk", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    
+    authenticated_client.post("/api/v1/jobs/", json={
+        "name": "Second ETag Test Job",
+        "job_type": "ENRICH_LEAD",
+        "campaign_id": existing_campaign.id
+    })
+    response = authenticated_client.get("/api/v1/jobs/bulk", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["data"][existing_campaign.id]) == 2
+
+def test_job_stats_by_campaign(authenticated_client, existing_campaign):
+    """Test per-status job counts for several campaigns in one request."""
+    for job_type in ("FETCH_LEADS", "ENRICH_LEAD", "ENRICH_LEAD"):
+        job_response = authenticated_client.post("/api/v1/jobs/", json={
+            "name": f"Stats {job_type} Job",
+            "job_type": job_type,
+            "campaign_id": existing_campaign.id
+        })
+        assert job_response.status_code == 201
+    
+    response = authenticated_client.get("/api/v1/jobs/stats", params={
+        "campaign_ids": [existing_campaign.id, "no-such-campaign"],
+        "job_type": "ENRICH_LEAD"
+    })
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data[existing_campaign.id]["pending"] == 2
+    assert data[existing_campaign.id]["completed"] == 0
+    assert data[existing_campaign.id]["total"] == 2
+    assert data["no-such-campaign"]["total"] == 0
+
+def test_list_jobs_cursor_pagination(authenticated_client, existing_campaign):
+    """Test that following next_cursor walks every job exactly once."""
+    for i in range(5):
+        job_response = authenticated_client.post("/api/v1/jobs/", json={
+            "name": f"Cursor Test Job {i}",
+            "job_type": "FETCH_LEADS",
+            "campaign_id": existing_campaign.id
+        })
+        assert job_response.status_code == 201
+    
+    seen_ids = []
+    params = {"per_page": 2, "campaign_id": existing_campaign.id}
+    while True:
+        response = authenticated_client.get("/api/v1/jobs/", params=params)
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen_ids.extend(job["id"] for job in data["jobs"])
+        if not data["next_cursor"]:
+            break
+        params["cursor"] = data["next_cursor"]
+    
+    assert len(seen_ids) == 5
+    assert len(set(seen_ids)) == 5
+
+def test_list_jobs_cursor_last_page(authenticated_client, existing_campaign):
+    """Test that a page ending exactly on the last job has no next_cursor and cursor pages skip the count."""
+    for i in range(4):
+        job_response = authenticated_client.post("/api/v1/jobs/", json={
+            "name": f"Cursor Last Page Job {i}",
+            "job_type": "FETCH_LEADS",
+            "campaign_id": existing_campaign.id
+        })
+        assert job_response.status_code == 201
+    
+    params = {"per_page": 2, "campaign_id": existing_campaign.id}
+    first = authenticated_client.get("/api/v1/jobs/", params=params).json()["data"]
+    assert first["total"] == 4
+    assert first["next_cursor"]
+    
+    params["cursor"] = first["next_cursor"]
+    second = authenticated_client.get("/api/v1/jobs/", params=params).json()["data"]
+    assert len(second["jobs"]) == 2
+    assert second["next_cursor"] is None
+    assert second["total"] is None
+    assert second["pages"] is None
+
+def test_list_jobs_invalid_cursor(authenticated_client):
+    """Test that a malformed cursor is rejected."""
+    response = authenticated_client.get("/api/v1/jobs/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+def test_stream_jobs_sends_campaign_snapshot(authenticated_client, existing_campaign):
+    """Test that the job stream sends the campaign's jobs as a server-sent event."""
+    job_response = authenticated_client.post("/api/v1/jobs/", json={
+        "name": "Stream Test Job",
+        "job_type": "FETCH_LEADS",
+        "campaign_id": existing_campaign.id
+    })
+    assert job_response.status_code == 201
+    job_id = job_response.json()["data"]["id"]
+
+    response = authenticated_client.get(
+        "/api/v1/jobs/stream",
+        params={"campaign_id": existing_campaign.id, "timeout": 1}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [line for line in response.text.splitlines() if line.startswith("data: ")]
+    assert len(events) == 1
+    jobs = json.loads(events[0][len("data: "):])["jobs"]
+    assert [job["id"] for job in jobs] == [job_id]
+
 def test_cancel_job_endpoint(authenticated_client, existing_campaign):
     """Test job cancellation."""
     # Create a campaign first
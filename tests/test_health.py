@@ -16,4 +16,15 @@ def test_readiness_check():
 def test_liveness_check():
     response = client.get("/api/v1/health/live")
     assert response.status_code == 200
-    assert response.json() == {"status": "alive"} 
\ No newline at end of file
+    assert response.json() == {"status": "alive"} 
+
+def test_db_pool_status_requires_auth():
+    response = client.get("/api/v1/health/db-pool")
+    assert response.status_code == 401
+
+def test_db_pool_status(authenticated_client):
+    response = authenticated_client.get("/api/v1/health/db-pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ok"
+    assert {"size", "checked_in", "checked_out", "overflow", "max_overflow", "status"} <= set(data["pool"])
@@ -228,6 +228,17 @@ def test_get_lead_malformed_id(authenticated_client, db_session):
     response = authenticated_client.get("/api/v1/leads/not-a-uuid")
     assert response.status_code == 404
 
+def test_get_leads_batch(authenticated_client, db_session, existing_lead):
+    missing_id = str(uuid.uuid4())
+    response = authenticated_client.get(
+        "/api/v1/leads/batch", params={"ids": [existing_lead.id, missing_id]}
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [lead["id"] for lead in data["leads"]] == [existing_lead.id]
+    assert data["leads"][0]["email"] == existing_lead.email
+    assert data["not_found"] == [missing_id]
+
 # ------------------- Lead Update Tests -------------------
 def test_update_lead_success(authenticated_client, db_session, existing_lead):
     update_data = {"first_name": "Updated", "company": "NewCo"}
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.core import response_cache
+from app.core.config import settings
+
+
+class InMemoryRedis:
+    """Minimal Redis stand-in covering the commands used by the response cache."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+@pytest.fixture
+def cache_redis():
+    redis_client = InMemoryRedis()
+    with patch.object(settings, "RESPONSE_CACHE_ENABLED", True), \
+         patch.object(response_cache, "_redis_client", redis_client):
+        yield redis_client
+
+
+def make_endpoint(calls):
+    @response_cache.cached_response(response_cache.CAMPAIGNS_NAMESPACE)
+    async def get_item(item_id: str, db=None):
+        calls.append(item_id)
+        return {"id": item_id, "call": len(calls)}
+
+    return get_item
+
+
+def test_cached_response_hits_cache_for_same_params(cache_redis):
+    calls = []
+    endpoint = make_endpoint(calls)
+
+    first = asyncio.run(endpoint(item_id="a", db=object()))
+    second = asyncio.run(endpoint(item_id="a", db=object()))
+
+    assert first == second
+    assert calls == ["a"]
+
+
+def test_cached_response_keys_on_params(cache_redis):
+    calls = []
+    endpoint = make_endpoint(calls)
+
+    asyncio.run(endpoint(item_id="a"))
+    asyncio.run(endpoint(item_id="b"))
+
+    assert calls == ["a", "b"]
+
+
+def test_invalidate_cache_forces_refetch(cache_redis):
+    calls = []
+    endpoint = make_endpoint(calls)
+
+    asyncio.run(endpoint(item_id="a"))
+    response_cache.invalidate_cache(response_cache.CAMPAIGNS_NAMESPACE)
+    refreshed = asyncio.run(endpoint(item_id="a"))
+
+    assert calls == ["a", "a"]
+    assert refreshed["call"] == 2
+
+
+def test_invalidate_tables_forces_refetch(cache_redis):
+    calls = []
+    endpoint = make_endpoint(calls)
+
+    asyncio.run(endpoint(item_id="a"))
+    response_cache.invalidate_tables("leads")
+    asyncio.run(endpoint(item_id="a"))
+
+    assert calls == ["a", "a"]
+
+
+def test_cached_response_disabled_bypasses_redis():
+    calls = []
+    endpoint = make_endpoint(calls)
+
+    with patch.object(settings, "RESPONSE_CACHE_ENABLED", False):
+        asyncio.run(endpoint(item_id="a"))
+        asyncio.run(endpoint(item_id="a"))
+
+    assert calls == ["a", "a"]